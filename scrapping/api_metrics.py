@@ -0,0 +1,153 @@
+import csv
+import io
+import json
+import os
+
+# Ringkasan & export metrik per-request dari ApiClient.request_log (send_to_postman.py).
+# Setiap entry berisi: method, url, status, reused, started (epoch detik),
+# latency (total detik), ttfb (sampai header response diterima), bytes_sent / bytes_received
+# (ukuran di wire), bytes_sent_raw / bytes_received_raw (sebelum kompresi gzip),
+# attempt (0 = percobaan pertama, >0 = retry) dan error (jika ada).
+
+CSV_FIELDS = ('started', 'method', 'url', 'status', 'attempt', 'reused', 'latency', 'ttfb',
+              'bytes_sent', 'bytes_sent_raw', 'bytes_received', 'bytes_received_raw', 'error')
+
+def percentile(sorted_values, fraction):
+    """Percentile dengan interpolasi linear dari list yang sudah terurut"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+def is_error(entry):
+    """Request gagal: exception (tanpa status) atau status >= 400"""
+    return entry.get('status') is None or entry['status'] >= 400
+
+def summarize(entries):
+    """Ringkasan latency (p50/p95/p99), throughput dan error rate"""
+    latencies = sorted(entry['latency'] for entry in entries if entry.get('latency') is not None)
+    if entries:
+        first = min(entry['started'] for entry in entries)
+        last = max(entry['started'] + (entry.get('latency') or 0) for entry in entries)
+        duration = last - first
+    else:
+        duration = 0.0
+    errors = sum(1 for entry in entries if is_error(entry))
+    status_counts = {}
+    for entry in entries:
+        key = str(entry.get('status') or 'error')
+        status_counts[key] = status_counts.get(key, 0) + 1
+    summary = {
+        'requests': len(entries),
+        'errors': errors,
+        'error_rate': errors / len(entries) if entries else 0.0,
+        'retries': sum(1 for entry in entries if entry.get('attempt')),
+        'duration': duration,
+        'requests_per_second': len(entries) / duration if duration > 0 else 0.0,
+        'latency_avg': sum(latencies) / len(latencies) if latencies else 0.0,
+        'latency_p50': percentile(latencies, 0.50),
+        'latency_p95': percentile(latencies, 0.95),
+        'latency_p99': percentile(latencies, 0.99),
+        'latency_max': latencies[-1] if latencies else 0.0,
+        'bytes_sent': sum(entry.get('bytes_sent') or 0 for entry in entries),
+        'bytes_received': sum(entry.get('bytes_received') or 0 for entry in entries),
+        'bytes_sent_raw': sum(entry.get('bytes_sent_raw') or 0 for entry in entries),
+        # Body streaming tidak diketahui ukuran aslinya; anggap sama dengan di wire
+        'bytes_received_raw': sum(entry.get('bytes_received_raw') or entry.get('bytes_received') or 0
+                                  for entry in entries),
+        'status_counts': status_counts,
+        # Koneksi baru menanggung DNS + connect + TLS; selisih p50 keduanya = biaya setup koneksi
+        'latency_p50_new_connection': percentile(
+            sorted(entry['latency'] for entry in entries if entry.get('reused') is False), 0.50),
+        'latency_p50_reused_connection': percentile(
+            sorted(entry['latency'] for entry in entries if entry.get('reused')), 0.50),
+    }
+    summary['bytes_saved'] = (summary['bytes_sent_raw'] + summary['bytes_received_raw']
+                              - summary['bytes_sent'] - summary['bytes_received'])
+    return summary
+
+def summarize_by_method(entries):
+    """Ringkasan terpisah per HTTP method"""
+    groups = {}
+    for entry in entries:
+        groups.setdefault(entry['method'], []).append(entry)
+    return {method: summarize(group) for method, group in groups.items()}
+
+def to_json(entries):
+    return json.dumps({
+        'summary': summarize(entries),
+        'by_method': summarize_by_method(entries),
+        'requests': entries
+    }, ensure_ascii=False, indent=2)
+
+def to_csv(entries):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    for entry in entries:
+        writer.writerow(entry)
+    return buffer.getvalue()
+
+def to_prometheus(entries, prefix="chatbot_api"):
+    """Prometheus text exposition format (summary latency + counter per method/status)"""
+    lines = [
+        f"# HELP {prefix}_requests_total Jumlah request API per method dan status",
+        f"# TYPE {prefix}_requests_total counter",
+    ]
+    counts = {}
+    for entry in entries:
+        key = (entry['method'], str(entry.get('status') or 'error'))
+        counts[key] = counts.get(key, 0) + 1
+    for (method, status), count in sorted(counts.items()):
+        lines.append(f'{prefix}_requests_total{{method="{method}",status="{status}"}} {count}')
+
+    lines += [
+        f"# HELP {prefix}_request_duration_seconds Latency request API",
+        f"# TYPE {prefix}_request_duration_seconds summary",
+    ]
+    for method, summary in sorted(summarize_by_method(entries).items()):
+        for quantile, key in (('0.5', 'latency_p50'), ('0.95', 'latency_p95'), ('0.99', 'latency_p99')):
+            value = summary[key]
+            lines.append(f'{prefix}_request_duration_seconds{{method="{method}",quantile="{quantile}"}} {value:.6f}')
+        total = summary['latency_avg'] * summary['requests']
+        lines.append(f'{prefix}_request_duration_seconds_sum{{method="{method}"}} {total:.6f}')
+        lines.append(f'{prefix}_request_duration_seconds_count{{method="{method}"}} {summary["requests"]}')
+
+    summary = summarize(entries)
+    lines += [
+        f"# HELP {prefix}_retries_total Jumlah request yang dikirim ulang (retry karena 429, 5xx, timeout atau gagal koneksi)",
+        f"# TYPE {prefix}_retries_total counter",
+        f"{prefix}_retries_total {summary['retries']}",
+        f"# HELP {prefix}_bytes_sent_total Total byte body request",
+        f"# TYPE {prefix}_bytes_sent_total counter",
+        f"{prefix}_bytes_sent_total {summary['bytes_sent']}",
+        f"# HELP {prefix}_bytes_received_total Total byte body response",
+        f"# TYPE {prefix}_bytes_received_total counter",
+        f"{prefix}_bytes_received_total {summary['bytes_received']}",
+        f"# HELP {prefix}_compression_saved_bytes_total Byte yang dihemat oleh kompresi gzip",
+        f"# TYPE {prefix}_compression_saved_bytes_total counter",
+        f"{prefix}_compression_saved_bytes_total {summary['bytes_saved']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+EXPORTERS = {'json': to_json, 'csv': to_csv, 'prom': to_prometheus}
+
+def resolve_format(path, fmt=None):
+    """Format export dari argumen atau ekstensi (.json/.csv/.prom/.txt); ValueError jika tidak dikenal"""
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip('.').lower() or 'json'
+    if fmt == 'txt':
+        fmt = 'prom'
+    if fmt not in EXPORTERS:
+        raise ValueError(f"Format metrik tidak dikenal: {fmt} (pilih json, csv atau prom)")
+    return fmt
+
+def export(entries, path, fmt=None):
+    """Tulis metrik ke file; format dari argumen atau ekstensi (.json/.csv/.prom)"""
+    fmt = resolve_format(path, fmt)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(EXPORTERS[fmt](entries))
+    return fmt
@@ -0,0 +1,282 @@
+import numpy as np
+
+# Audit panjang response untuk form-add-line.py.
+#
+# Semua response di-flatten sekali menjadi kolom NumPy (satu baris per response):
+#   author_id, tag_id, index (posisi di intent['responses']), length (karakter),
+#   byte_length (UTF-8) dan word_count.
+# Query threshold / range / top-k / sort berjalan vektor di atas kolom itu dan menghasilkan
+# array posisi baris; entries() mengubah posisi menjadi dict seperti yang dipakai menu editor.
+#
+# Audit tidak perlu dibangun ulang setelah edit: pasang sebagai listener IntentIndex
+# (dataset.py) dan setiap perubahan tag/response hanya memperbarui baris tag yang terkena.
+# Baris response yang dihapus ditandai mati (alive=False), response baru ditambahkan di akhir
+# kolom. Dict hasil entries() ikut diperbarui (index, length, text), jadi list hasil audit yang
+# sedang dipakai menu tidak basi.
+
+DEFAULT_MAX_LENGTH = 150
+SORT_KEYS = ('length_desc', 'length_asc', 'author', 'tag')
+COLUMNS = ('author_id', 'tag_id', 'index', 'length', 'byte_length', 'word_count')
+INITIAL_CAPACITY = 1024
+
+def measure(text):
+    """(length, byte_length, word_count) satu response"""
+    return len(text), len(text.encode('utf-8')), len(text.split())
+
+class LengthAudit:
+    """Kolom panjang semua response di data, diperbarui per perubahan"""
+
+    def __init__(self, data):
+        self.authors = []      # author_id -> nama author
+        self.author_ids = {}   # nama author -> author_id
+        self.tags = []         # tag_id -> (author, tag)
+        self.tag_ids = {}      # (author, tag) -> tag_id (hanya tag yang masih ada)
+        self.intents = []      # tag_id -> intent dict (untuk mengambil teks response)
+        self.tag_rows = []     # tag_id -> list baris, urut sesuai intent['responses']
+        self._entries = {}     # baris -> dict yang sudah diberikan oleh entries()
+        columns = {name: [] for name in COLUMNS}
+
+        for author, author_data in data.items():
+            author_id = self._author_id(author)
+            for intent in author_data.get('intents', []):
+                tag_id = self._new_tag(author, intent)
+                responses = intent.get('responses', [])
+                count = len(responses)
+                start = len(columns['length'])
+                columns['author_id'].extend([author_id] * count)
+                columns['tag_id'].extend([tag_id] * count)
+                columns['index'].extend(range(count))
+                for response in responses:
+                    length, byte_length, word_count = measure(response)
+                    columns['length'].append(length)
+                    columns['byte_length'].append(byte_length)
+                    columns['word_count'].append(word_count)
+                self.tag_rows[tag_id] = list(range(start, start + count))
+
+        self.size = len(columns['length'])
+        capacity = max(INITIAL_CAPACITY, self.size)
+        self._columns = {}
+        for name in COLUMNS:
+            column = np.zeros(capacity, dtype=np.int32)
+            column[:self.size] = columns[name]
+            self._columns[name] = column
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[:self.size] = True
+
+    def _author_id(self, author):
+        if author not in self.author_ids:
+            self.author_ids[author] = len(self.authors)
+            self.authors.append(author)
+        return self.author_ids[author]
+
+    def _new_tag(self, author, intent):
+        tag_id = len(self.tags)
+        key = (author, intent['tag'])
+        self.tags.append(key)
+        self.tag_ids.setdefault(key, tag_id)
+        self.intents.append(intent)
+        self.tag_rows.append([])
+        return tag_id
+
+    # Kolom (view sebesar jumlah baris yang terpakai)
+    author_id = property(lambda self: self._columns['author_id'][:self.size])
+    tag_id = property(lambda self: self._columns['tag_id'][:self.size])
+    index = property(lambda self: self._columns['index'][:self.size])
+    length = property(lambda self: self._columns['length'][:self.size])
+    byte_length = property(lambda self: self._columns['byte_length'][:self.size])
+    word_count = property(lambda self: self._columns['word_count'][:self.size])
+    alive = property(lambda self: self._alive[:self.size])
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def _by_length_desc(self, positions):
+        # Stable: response dengan panjang sama tetap dalam urutan data
+        return positions[np.argsort(-self.length[positions], kind='stable')]
+
+    def all_rows(self):
+        return np.flatnonzero(self.alive)
+
+    def longer_than(self, max_length=DEFAULT_MAX_LENGTH):
+        """Posisi response dengan panjang > max_length, terpanjang dulu"""
+        return self._by_length_desc(np.flatnonzero((self.length > max_length) & self.alive))
+
+    def within(self, positions, min_length=None, max_length=None):
+        """Subset positions dengan min_length <= panjang <= max_length (urutan dipertahankan)"""
+        lengths = self.length[positions]
+        mask = np.ones(len(positions), dtype=bool)
+        if min_length is not None:
+            mask &= lengths >= min_length
+        if max_length is not None:
+            mask &= lengths <= max_length
+        return positions[mask]
+
+    def top_k(self, k, positions=None):
+        """k response terpanjang (dari positions atau semua response), terpanjang dulu"""
+        if positions is None:
+            positions = self.all_rows()
+        if k <= 0:
+            return positions[:0]
+        if k < len(positions):
+            lengths = self.length[positions]
+            kth = np.partition(lengths, len(lengths) - k)[len(lengths) - k]
+            above = positions[lengths > kth]
+            # Panjang sama dengan batas: ambil yang paling awal di positions (deterministik)
+            ties = positions[lengths == kth][:k - len(above)]
+            positions = np.concatenate([above, ties])
+        return self._by_length_desc(positions)
+
+    def order(self, positions, key):
+        """Urutkan positions: length_desc, length_asc, author (A-Z) atau tag ((author, tag) A-Z).
+
+        Sort author/tag stable, jadi urutan sebelumnya (misalnya terpanjang dulu) tetap di dalam grup.
+        """
+        if key == 'length_desc':
+            return self._by_length_desc(positions)
+        if key == 'length_asc':
+            return positions[np.argsort(self.length[positions], kind='stable')]
+        if key == 'author':
+            ranks = self._ranks(self.authors)[self.author_id[positions]]
+        elif key == 'tag':
+            ranks = self._ranks(self.tags)[self.tag_id[positions]]
+        else:
+            raise ValueError(f"Sort key tidak dikenal: {key} (pilih {', '.join(SORT_KEYS)})")
+        return positions[np.argsort(ranks, kind='stable')]
+
+    @staticmethod
+    def _ranks(names):
+        """Peringkat alfabetis per id"""
+        ranks = np.empty(len(names), dtype=np.int32)
+        ranks[sorted(range(len(names)), key=names.__getitem__)] = np.arange(len(names), dtype=np.int32)
+        return ranks
+
+    def entries(self, positions):
+        """List dict {author, tag, index, text, length, byte_length, word_count} untuk positions.
+
+        Dict yang sama dikembalikan untuk baris yang sama dan diperbarui saat response berubah.
+        """
+        entries = []
+        for row in positions.tolist():
+            entry = self._entries.get(row)
+            if entry is None:
+                entry = self._entries[row] = {}
+                self._fill_entry(row, entry)
+            entries.append(entry)
+        return entries
+
+    def _fill_entry(self, row, entry):
+        tag_id = int(self._columns['tag_id'][row])
+        index = int(self._columns['index'][row])
+        author, tag_name = self.tags[tag_id]
+        entry.update({
+            'author': author,
+            'tag': tag_name,
+            'index': index,
+            'text': self.intents[tag_id]['responses'][index] if self._alive[row] else entry.get('text'),
+            'length': int(self._columns['length'][row]),
+            'byte_length': int(self._columns['byte_length'][row]),
+            'word_count': int(self._columns['word_count'][row]),
+        })
+
+    def _refresh(self, rows):
+        for row in rows:
+            entry = self._entries.get(row)
+            if entry is not None:
+                self._fill_entry(row, entry)
+
+    def _append_row(self, tag_id, text):
+        if self.size == len(self._alive):
+            capacity = 2 * len(self._alive)
+            for name in COLUMNS:
+                self._columns[name] = np.resize(self._columns[name], capacity)
+            alive = np.zeros(capacity, dtype=bool)
+            alive[:self.size] = self._alive[:self.size]
+            self._alive = alive
+        row = self.size
+        rows = self.tag_rows[tag_id]
+        author, _ = self.tags[tag_id]
+        values = (self.author_ids[author], tag_id, len(rows)) + measure(text)
+        for name, value in zip(COLUMNS, values):
+            self._columns[name][row] = value
+        self._alive[row] = True
+        rows.append(row)
+        self.size += 1
+        return row
+
+    # Listener IntentIndex: dipanggil setelah tree diubah, biaya sebanding dengan tag yang berubah
+
+    def intent_added(self, author, intent):
+        self._author_id(author)
+        tag_id = self._new_tag(author, intent)
+        for response in intent.get('responses', []):
+            self._append_row(tag_id, response)
+
+    def intent_removed(self, author, tag_name):
+        tag_id = self.tag_ids.pop((author, tag_name), None)
+        if tag_id is None:
+            return
+        self._alive[self.tag_rows[tag_id]] = False
+        self.tag_rows[tag_id] = []
+
+    def response_added(self, author, tag_name, text):
+        tag_id = self.tag_ids.get((author, tag_name))
+        if tag_id is not None:
+            self._append_row(tag_id, text)
+
+    def response_removed(self, author, tag_name, position):
+        tag_id = self.tag_ids.get((author, tag_name))
+        if tag_id is None:
+            return
+        rows = self.tag_rows[tag_id]
+        row = rows.pop(position)
+        self._alive[row] = False
+        # Response sesudahnya bergeser satu posisi ke depan
+        shifted = rows[position:]
+        if shifted:
+            self._columns['index'][shifted] -= 1
+            self._refresh(shifted)
+
+    def response_set(self, author, tag_name, position, text):
+        tag_id = self.tag_ids.get((author, tag_name))
+        if tag_id is None:
+            return
+        row = self.tag_rows[tag_id][position]
+        for name, value in zip(('length', 'byte_length', 'word_count'), measure(text)):
+            self._columns[name][row] = value
+        self._refresh([row])
+
+def tag_label(key):
+    """Label tampilan untuk key (author, tag)"""
+    author, tag_name = key
+    return f"[{author}] {tag_name}"
+
+class AuditGroups:
+    """Index grup hasil audit per author dan per (author, tag), dibangun dalam satu pass.
+
+    Urutan grup mengikuti kemunculan pertama di entries (terpanjang dulu untuk hasil global audit).
+    """
+
+    def __init__(self, entries):
+        self.by_author = {}    # author -> [entry]
+        self.by_tag = {}       # (author, tag) -> [entry]
+        for entry in entries:
+            self.by_author.setdefault(entry['author'], []).append(entry)
+            self.by_tag.setdefault((entry['author'], entry['tag']), []).append(entry)
+
+    def authors(self):
+        return list(self.by_author)
+
+    def tag_keys(self):
+        return list(self.by_tag)
+
+    def author_entries(self, author):
+        return self.by_author.get(author, [])
+
+    def tag_entries(self, key):
+        return self.by_tag.get(key, [])
+
+    def author_count(self, author):
+        return len(self.by_author.get(author, []))
+
+    def tag_count(self, key):
+        return len(self.by_tag.get(key, []))
@@ -0,0 +1,210 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+import api_metrics
+import mock_server
+
+# Benchmark push/update/delete send_to_postman.py terhadap mock_server lokal.
+# Contoh:
+#   python benchmark.py --authors 5 --tags 40 --latency 0.02 --output output/benchmark.json
+#   python benchmark.py --baseline output/benchmark.json   # exit 1 jika throughput turun > 20%
+
+SCENARIOS = ('push', 'update', 'delete', 'push-bulk')
+DEFAULT_MAX_REGRESSION = 0.2
+
+def generate_dataset(authors, tags, inputs, responses, response_length):
+    """Data sintetis dengan struktur content_by_author_and_tags.json"""
+    filler = "lorem ipsum dolor sit amet "
+    text = (filler * (response_length // len(filler) + 1))[:response_length]
+    data = {}
+    for a in range(authors):
+        author = f"Author {a + 1}"
+        data[author] = {'intents': [
+            {
+                'tag': f"tag_{a + 1}_{t + 1}",
+                'input': [f"pertanyaan {i + 1} tentang tag {t + 1}" for i in range(inputs)],
+                'responses': [f"{r + 1}. {text}" for r in range(responses)]
+            }
+            for t in range(tags)
+        ]}
+    return data
+
+def run_scenario(api, name, action):
+    """Jalankan action() dengan output console dibuang; return hasil + metrik request-nya"""
+    start_index = len(api.api_client.request_log)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        operations, failed = action()
+    wall = time.perf_counter() - started
+    entries = api.api_client.request_log[start_index:]
+    summary = api_metrics.summarize(entries)
+    return {
+        'scenario': name,
+        'operations': operations,
+        'failed': failed,
+        'wall_seconds': wall,
+        'ops_per_second': operations / wall if wall > 0 else 0.0,
+        'requests': summary['requests'],
+        'requests_per_second': summary['requests'] / wall if wall > 0 else 0.0,
+        'latency_p50': summary['latency_p50'],
+        'latency_p95': summary['latency_p95'],
+        'latency_p99': summary['latency_p99'],
+        'error_rate': summary['error_rate'],
+        'retries': summary['retries'],
+        'bytes_sent': summary['bytes_sent'],
+    }
+
+def count_stats(stats):
+    return (sum(s['success'] + s['failed'] for s in stats.values()),
+            sum(s['failed'] for s in stats.values()))
+
+def scenario_actions(api, workers, rate):
+    """Scenario benchmark, dijalankan berurutan sesuai SCENARIOS"""
+
+    def push():
+        return count_stats(api.push_all_data(workers, rate, force=True))
+
+    def push_bulk():
+        return count_stats(api.push_all_data(workers, rate, force=True, bulk=True))
+
+    def update():
+        tags = api.get_all_tags_from_api(max_age=0)
+        jobs = []
+        for tag in tags:
+            payload = dict(tag, responses=tag.get('responses', []) + ["respon tambahan benchmark"])
+            payload.pop('id', None)
+            jobs.append((tag.get('nama'), tag.get('tag'),
+                         (tag.get('id'), tag.get('tag'), tag.get('nama'), payload)))
+        return count_stats(api.run_jobs(jobs, api.update_tag_in_api, workers))
+
+    def delete():
+        # Sama dengan delete_by_author (tanpa prompt) untuk setiap author
+        tags = api.get_all_tags_from_api(max_age=0)
+        operations = failed = 0
+        for author in sorted({tag.get('nama') for tag in tags}):
+            report = api.delete_tags_concurrently(api.select_api_tags(tags, author), workers,
+                                                  f"benchmark delete {author}")
+            operations += len(report['deleted']) + len(report['failed'])
+            failed += len(report['failed'])
+        return operations, failed
+
+    return {'push': push, 'push-bulk': push_bulk, 'update': update, 'delete': delete}
+
+def compare_with_baseline(results, baseline, max_regression):
+    """Return list pesan regresi (throughput turun lebih dari max_regression)"""
+    previous = {entry['scenario']: entry for entry in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result['scenario'])
+        if not before or not before['ops_per_second']:
+            continue
+        change = result['ops_per_second'] / before['ops_per_second'] - 1
+        result['vs_baseline'] = change
+        if change < -max_regression:
+            regressions.append(f"{result['scenario']}: {before['ops_per_second']:.1f} -> "
+                               f"{result['ops_per_second']:.1f} ops/s ({change*100:+.1f}%)")
+    return regressions
+
+def print_results(results):
+    print(f"\n{'scenario':<10} {'ops':>6} {'fail':>5} {'wall s':>8} {'ops/s':>8} {'req/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'err %':>6} {'retry':>6}")
+    print("-" * 94)
+    for r in results:
+        line = (f"{r['scenario']:<10} {r['operations']:>6} {r['failed']:>5} {r['wall_seconds']:>8.2f} "
+                f"{r['ops_per_second']:>8.1f} {r['requests_per_second']:>8.1f} {r['latency_p50']*1000:>8.1f} "
+                f"{r['latency_p95']*1000:>8.1f} {r['latency_p99']*1000:>8.1f} {r['error_rate']*100:>6.1f} "
+                f"{r['retries']:>6}")
+        if 'vs_baseline' in r:
+            line += f"  ({r['vs_baseline']*100:+.1f}% vs baseline)"
+        print(line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark send_to_postman.py terhadap mock server lokal")
+    parser.add_argument("--data", help="Pakai file data ini (default: data sintetis)")
+    parser.add_argument("--authors", type=int, default=4)
+    parser.add_argument("--tags", type=int, default=25, help="Jumlah tag per author")
+    parser.add_argument("--inputs", type=int, default=5, help="Jumlah input per tag")
+    parser.add_argument("--responses", type=int, default=10, help="Jumlah response per tag")
+    parser.add_argument("--response-length", type=int, default=140)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=200.0, help="Rate limiter klien (req/s, juga batas atas)")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="Scenario yang dijalankan (boleh berulang, default semua)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency mock server (detik)")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Batas req/s mock server (429)")
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON")
+    parser.add_argument("--baseline", help="Bandingkan dengan hasil JSON sebelumnya")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Penurunan ops/s maksimum sebelum dianggap regresi (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    server, store, base_url = mock_server.start_server_in_background(
+        latency=args.latency, latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+        rate_limit=args.rate_limit, retry_after=args.retry_after, seed=args.seed
+    )
+    workdir = tempfile.mkdtemp(prefix="chatbot-benchmark-")
+    data_file = os.path.join(workdir, "content_by_author_and_tags.json")
+    if args.data:
+        with open(args.data, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    else:
+        data = generate_dataset(args.authors, args.tags, args.inputs, args.responses, args.response_length)
+    with open(data_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+    # send_to_postman membaca target & lokasi file dari env saat di-import
+    os.environ['CHATBOT_API_URL'] = base_url
+    os.environ['CHATBOT_DATA_FILE'] = data_file
+    os.environ.pop('CHATBOT_TAG_CACHE_FILE', None)
+    api = importlib.import_module('send_to_postman')
+    api.run_log.setup_logging('quiet', os.path.join(workdir, "chatbot.log"))
+    api.api_client.rate_limiter.max_rate = max(args.rate, api.MIN_REQUESTS_PER_SECOND)
+    api.api_client.rate_limiter.set_rate(args.rate)
+
+    total_tags = sum(len(author_data.get('intents', [])) for author_data in data.values())
+    print(f"🧪 Benchmark: {total_tags} tags | workers {args.workers} | rate {args.rate} req/s | "
+          f"latency {args.latency*1000:.0f}±{args.latency_jitter*1000:.0f} ms | error {args.error_rate*100:.0f}% | "
+          f"server limit {args.rate_limit or '-'} req/s")
+    print(f"📁 Workdir: {workdir}")
+
+    actions = scenario_actions(api, args.workers, args.rate)
+    selected = args.scenario or SCENARIOS
+    results = []
+    try:
+        for name in SCENARIOS:
+            if name in selected:
+                results.append(run_scenario(api, name, actions[name]))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.max_regression)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'config': vars(args), 'tags': total_tags, 'results': results}, f, indent=2)
+        print(f"\n💾 Hasil disimpan di {args.output}")
+    if regressions:
+        print("\n❌ REGRESI throughput:")
+        for message in regressions:
+            print(f"   - {message}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
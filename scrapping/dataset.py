@@ -0,0 +1,527 @@
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+try:
+    import orjson  # optional: parse JSON lebih cepat
+except ImportError:
+    orjson = None
+
+# Loader bersama untuk content_by_author_and_tags.json (send_to_postman.py & form-add-line.py).
+#
+# Struktur file: {author: {"intents": [{"tag", "input", "responses"}, ...]}, ...}
+#
+# - load() mem-parse seluruh file sekali lalu meng-cache hasilnya berdasarkan (mtime, size);
+#   selama file tidak berubah, pemanggilan berikutnya tidak membaca ulang file.
+# - get_author() / get_intent() / iter_intents() memakai index byte-offset yang dibangun
+#   dengan satu kali scan file (mmap), sehingga satu author atau tag bisa diambil tanpa
+#   mem-parse author lain.
+# - Edit per intent (record_intent / record_delete) hanya ditambahkan ke change log
+#   (<file>.changes.jsonl, append-only). Log digabung ke file utama (compact) setelah
+#   COMPACT_EVERY_CHANGES perubahan, COMPACT_INTERVAL detik, atau saat editor ditutup.
+#   File utama selalu ditulis atomic (temp file + rename); load() memutar ulang change log
+#   yang belum digabung, jadi edit tidak hilang jika proses mati sebelum compact.
+# - intent_index() memberi IntentIndex di atas tree yang di-load: lookup (author, tag) O(1),
+#   lookup response berdasarkan hash, dan set input/response per tag untuk cek duplikat.
+
+# Token yang relevan untuk scan struktur: string JSON utuh (isinya diabaikan), bracket dan ':'.
+# Byte '"' dan '\' tidak pernah muncul di dalam karakter UTF-8 multibyte, jadi aman di-scan sebagai bytes.
+STRUCTURE_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]:]')
+
+CHANGELOG_SUFFIX = '.changes.jsonl'
+COMPACT_EVERY_CHANGES = 50
+COMPACT_INTERVAL = 300.0  # detik sejak perubahan pertama yang belum digabung
+
+def parse_json(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        raw = bytes(raw).decode('utf-8')
+    return json.loads(raw)
+
+def write_json_atomic(path, data, indent=None):
+    """Tulis JSON ke temp file lalu rename; file lama tetap utuh jika penulisan gagal"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def apply_change(data, change):
+    """Terapkan satu entry change log ke tree data (idempotent, aman diputar ulang)"""
+    author, tag_name = change['author'], change['tag']
+    if change['op'] == 'put_intent':
+        intents = data.setdefault(author, {}).setdefault('intents', [])
+        for i, intent in enumerate(intents):
+            if intent.get('tag') == tag_name:
+                intents[i] = change['intent']
+                return
+        intents.append(change['intent'])
+    elif change['op'] == 'delete_intent':
+        intents = data.get(author, {}).get('intents', [])
+        for i, intent in enumerate(intents):
+            if intent.get('tag') == tag_name:
+                del intents[i]
+                return
+
+def read_changes(path):
+    """Semua entry change log (list kosong jika belum ada)"""
+    changes = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    changes.append(json.loads(line))
+                except ValueError:
+                    continue  # baris terakhir bisa terpotong saat crash
+    except FileNotFoundError:
+        pass
+    return changes
+
+def response_hash(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+class IntentIndex:
+    """Index di atas tree data untuk editor.
+
+    Semua perubahan input/response/tag lewat method di sini supaya tree dan index tetap sinkron.
+    Listener (misalnya audit.LengthAudit) diberi tahu setiap perubahan lewat method
+    intent_added / intent_removed / response_added / response_removed / response_set.
+
+    File lama bisa berisi dua intent dengan tag sama untuk satu author. Yang pertama di-index,
+    salinan lainnya dicatat di duplicates. Mutator menerima intent=<dict yang dipilih user>;
+    jika itu salinan yang tidak di-index, perubahan diterapkan langsung ke dict tersebut
+    (tanpa listener) dan caller harus menyimpan ulang seluruh file (lihat is_duplicate).
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.listeners = []
+        self.intents = {}          # (author, tag) -> intent dict di tree
+        self.inputs = {}           # (author, tag) -> Counter(input)
+        self.responses = {}        # (author, tag) -> Counter(response)
+        self.response_keys = {}    # hash response -> Counter((author, tag))
+        self.duplicates = {}       # (author, tag) -> [intent lain dengan key yang sama]
+        for author, author_data in data.items():
+            for intent in author_data.get('intents', []):
+                self._add(author, intent)
+
+    def _notify(self, event, *args):
+        for listener in self.listeners:
+            getattr(listener, event)(*args)
+
+    def _add(self, author, intent):
+        key = (author, intent['tag'])
+        if key in self.intents:
+            # tag ganda: sama seperti pencarian linear lama, yang pertama dipakai untuk lookup
+            self.duplicates.setdefault(key, []).append(intent)
+            return False
+        self.intents[key] = intent
+        self.inputs[key] = Counter(intent.get('input', []))
+        self.responses[key] = Counter(intent.get('responses', []))
+        for response in intent.get('responses', []):
+            self._link_response(key, response)
+        return True
+
+    def _link_response(self, key, response):
+        self.response_keys.setdefault(response_hash(response), Counter())[key] += 1
+
+    def _unlink_response(self, key, response):
+        digest = response_hash(response)
+        keys = self.response_keys.get(digest)
+        if keys is None:
+            return
+        keys[key] -= 1
+        if keys[key] <= 0:
+            del keys[key]
+        if not keys:
+            del self.response_keys[digest]
+
+    def get(self, author, tag_name):
+        """Intent (author, tag) atau None"""
+        return self.intents.get((author, tag_name))
+
+    def is_duplicate(self, author, tag_name):
+        """True jika author punya lebih dari satu intent dengan tag ini"""
+        return (author, tag_name) in self.duplicates
+
+    def copies(self, author, tag_name):
+        """Semua intent dengan key (author, tag): yang di-index dulu, lalu salinan gandanya"""
+        key = (author, tag_name)
+        intent = self.intents.get(key)
+        return ([intent] if intent is not None else []) + self.duplicates.get(key, [])
+
+    def find_intent(self, author, tag_name, position, text):
+        """Intent (author, tag) yang response ke-position berisi text; membedakan salinan tag ganda"""
+        copies = self.copies(author, tag_name)
+        for intent in copies:
+            responses = intent.get('responses', [])
+            if position < len(responses) and responses[position] == text:
+                return intent
+        return copies[0] if copies else None
+
+    def _detached(self, author, tag_name, intent):
+        """True jika intent adalah salinan tag ganda yang tidak di-index (diedit langsung)"""
+        return intent is not None and self.intents.get((author, tag_name)) is not intent
+
+    def has_tag(self, author, tag_name):
+        return (author, tag_name) in self.intents
+
+    def add_intent(self, author, intent):
+        """Tambahkan intent baru ke author (di tree dan index)"""
+        self.data.setdefault(author, {}).setdefault('intents', []).append(intent)
+        if self._add(author, intent):
+            self._notify('intent_added', author, intent)
+
+    def remove_intent(self, author, tag_name, intent=None):
+        """Hapus intent dari tree; return intent yang dihapus atau None"""
+        key = (author, tag_name)
+        if self._detached(author, tag_name, intent):
+            copies = self.duplicates.get(key, [])
+            if not any(copy is intent for copy in copies):
+                return None
+            self.duplicates[key] = [copy for copy in copies if copy is not intent]
+            if not self.duplicates[key]:
+                del self.duplicates[key]
+            intents = self.data[author]['intents']
+            del intents[next(i for i, candidate in enumerate(intents) if candidate is intent)]
+            return intent
+        intent = self.intents.pop(key, None)
+        if intent is None:
+            return None
+        intents = self.data[author]['intents']
+        for i, candidate in enumerate(intents):
+            if candidate is intent:
+                del intents[i]
+                break
+        del self.inputs[key]
+        del self.responses[key]
+        for response in intent.get('responses', []):
+            self._unlink_response(key, response)
+        self._notify('intent_removed', author, tag_name)
+        return intent
+
+    def has_input(self, author, tag_name, text):
+        return self.inputs.get((author, tag_name), {}).get(text, 0) > 0
+
+    def has_response(self, author, tag_name, text):
+        return self.responses.get((author, tag_name), {}).get(text, 0) > 0
+
+    def add_input(self, author, tag_name, text, intent=None):
+        """Tambahkan input jika belum ada di tag; return False jika duplikat"""
+        if self._detached(author, tag_name, intent):
+            if text in intent.get('input', []):
+                return False
+            intent.setdefault('input', []).append(text)
+            return True
+        key = (author, tag_name)
+        if self.inputs[key][text] > 0:
+            return False
+        self.intents[key].setdefault('input', []).append(text)
+        self.inputs[key][text] += 1
+        return True
+
+    def add_response(self, author, tag_name, text, intent=None):
+        """Tambahkan response jika belum ada di tag; return False jika duplikat"""
+        if self._detached(author, tag_name, intent):
+            if text in intent.get('responses', []):
+                return False
+            intent.setdefault('responses', []).append(text)
+            return True
+        key = (author, tag_name)
+        if self.responses[key][text] > 0:
+            return False
+        self.intents[key].setdefault('responses', []).append(text)
+        self.responses[key][text] += 1
+        self._link_response(key, text)
+        self._notify('response_added', author, tag_name, text)
+        return True
+
+    def remove_input(self, author, tag_name, position, intent=None):
+        """Hapus input ke-position (0-based); return teks input"""
+        if self._detached(author, tag_name, intent):
+            return intent['input'].pop(position)
+        key = (author, tag_name)
+        text = self.intents[key]['input'].pop(position)
+        self.inputs[key][text] -= 1
+        return text
+
+    def remove_response(self, author, tag_name, position, intent=None):
+        """Hapus response ke-position (0-based); return teks response"""
+        if self._detached(author, tag_name, intent):
+            return intent['responses'].pop(position)
+        key = (author, tag_name)
+        text = self.intents[key]['responses'].pop(position)
+        self.responses[key][text] -= 1
+        self._unlink_response(key, text)
+        self._notify('response_removed', author, tag_name, position)
+        return text
+
+    def set_response(self, author, tag_name, position, text, intent=None):
+        """Ganti response ke-position (0-based)"""
+        if self._detached(author, tag_name, intent):
+            intent['responses'][position] = text
+            return
+        key = (author, tag_name)
+        responses = self.intents[key]['responses']
+        old = responses[position]
+        responses[position] = text
+        self.responses[key][old] -= 1
+        self.responses[key][text] += 1
+        self._unlink_response(key, old)
+        self._link_response(key, text)
+        self._notify('response_set', author, tag_name, position, text)
+
+    def find_response(self, text):
+        """Semua lokasi response dengan teks ini: list (author, tag, index)"""
+        locations = []
+        for author, tag_name in self.response_keys.get(response_hash(text), {}):
+            responses = self.intents[(author, tag_name)].get('responses', [])
+            locations.extend((author, tag_name, i) for i, response in enumerate(responses) if response == text)
+        return locations
+
+def build_offset_index(buffer):
+    """Scan struktur file sekali; return (authors, intents) berisi (start, end) byte offset.
+
+    authors: {author: (start, end)}  -> objek author
+    intents: {(author, tag): (start, end)} -> objek intent di author[...]['intents']
+    """
+    authors = {}
+    intents = {}
+    stack = []
+    last_string = None
+    keys = {}            # key terakhir per kedalaman objek
+    author = None
+    author_start = None
+    intent_start = None
+    intent_tag = None
+    expect_tag = False
+
+    for match in STRUCTURE_TOKEN.finditer(buffer):
+        token = match.group()
+        first = token[:1]
+        if first == b'"':
+            if expect_tag:
+                intent_tag = parse_json(token)
+                expect_tag = False
+            last_string = token
+        elif first == b':':
+            depth = len(stack)
+            key = parse_json(last_string)
+            keys[depth] = key
+            if depth == 1:
+                author = key
+            else:
+                expect_tag = depth == 4 and key == 'tag' and intent_start is not None
+        elif first in (b'{', b'['):
+            stack.append(first)
+            depth = len(stack)
+            if depth == 2 and first == b'{':
+                author_start = match.start()
+            elif depth == 4 and first == b'{' and stack[2] == b'[' and keys.get(2) == 'intents':
+                intent_start = match.start()
+                intent_tag = None
+        else:
+            depth = len(stack)
+            if depth == 2 and author_start is not None:
+                authors[author] = (author_start, match.end())
+                author_start = None
+            elif depth == 4 and intent_start is not None:
+                if intent_tag is not None:
+                    intents.setdefault((author, intent_tag), (intent_start, match.end()))
+                intent_start = None
+            if stack:
+                stack.pop()
+    return authors, intents
+
+class Dataset:
+    """File data chatbot dengan parse lazy, cache (mtime, size) dan index per author/tag"""
+
+    def __init__(self, path, indent=4):
+        self.path = path
+        self.indent = indent
+        self.changelog_path = path + CHANGELOG_SUFFIX
+        self._pending = 0
+        self._pending_since = None
+        self._data = None
+        self._data_signature = None
+        self._index = None
+        self._index_signature = None
+        self._intent_index = None
+        self._lock = threading.RLock()
+
+    def signature(self):
+        """(mtime_ns, size) file; raise FileNotFoundError jika file tidak ada"""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def changelog_signature(self):
+        """(mtime_ns, size) change log, atau None jika tidak ada perubahan yang belum digabung"""
+        try:
+            stat = os.stat(self.changelog_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size) if stat.st_size else None
+
+    def data_signature(self):
+        return self.signature(), self.changelog_signature()
+
+    def is_fresh(self):
+        """True jika tree yang di-cache masih sama dengan isi file (+ change log)"""
+        try:
+            return self._data is not None and self._data_signature == self.data_signature()
+        except FileNotFoundError:
+            return False
+
+    def load(self):
+        """Seluruh data (dict). Parse ulang hanya jika file berubah sejak load/save terakhir"""
+        with self._lock:
+            signature = self.data_signature()
+            if self._data is not None and self._data_signature == signature:
+                return self._data
+            with open(self.path, 'rb') as f:
+                data = parse_json(f.read())
+            changes = read_changes(self.changelog_path) if signature[1] else []
+            for change in changes:
+                apply_change(data, change)
+            self._data = data
+            self._data_signature = signature
+            self._pending = len(changes)
+            self._pending_since = time.monotonic() if changes else None
+            return self._data
+
+    def save(self, data, indent=None):
+        """Tulis seluruh data secara atomic, kosongkan change log dan jadikan cache terbaru"""
+        with self._lock:
+            write_json_atomic(self.path, data, self.indent if indent is None else indent)
+            # Urutan ini aman: jika mati sebelum log dihapus, replay log ke file baru tidak mengubah apa pun
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.changelog_path)
+            self._pending = 0
+            self._pending_since = None
+            self.mark_saved(data)
+
+    def mark_saved(self, data):
+        """Catat bahwa isi file sekarang sama dengan data (setelah ditulis oleh pemanggil)"""
+        with self._lock:
+            self._data = data
+            self._data_signature = self.data_signature()
+
+    def record_intent(self, data, author, intent):
+        """Catat intent yang baru ditambah/diubah di data (tree yang sedang diedit) ke change log"""
+        self._record(data, {'op': 'put_intent', 'author': author, 'tag': intent['tag'], 'intent': intent})
+
+    def record_delete(self, data, author, tag_name):
+        """Catat intent (author, tag) yang sudah dihapus dari data ke change log"""
+        self._record(data, {'op': 'delete_intent', 'author': author, 'tag': tag_name})
+
+    def _record(self, data, change):
+        with self._lock:
+            with open(self.changelog_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(change, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending += 1
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            self.mark_saved(data)
+            if self.should_compact():
+                self.compact()
+
+    def pending_changes(self):
+        """Jumlah perubahan di change log yang belum digabung ke file utama"""
+        return self._pending
+
+    def should_compact(self):
+        return self._pending >= COMPACT_EVERY_CHANGES or (
+            self._pending_since is not None and time.monotonic() - self._pending_since >= COMPACT_INTERVAL)
+
+    def compact(self):
+        """Gabungkan change log ke file utama; return True jika ada yang ditulis"""
+        with self._lock:
+            if not self._pending and self.changelog_signature() is None:
+                return False
+            self.save(self.load())
+            return True
+
+    def invalidate(self):
+        """Buang cache; akses berikutnya membaca file lagi"""
+        with self._lock:
+            self._data = None
+            self._data_signature = None
+            self._index = None
+            self._index_signature = None
+            self._intent_index = None
+
+    def index(self):
+        """Index byte-offset (authors, intents); dibangun ulang hanya jika file berubah"""
+        with self._lock:
+            signature = self.signature()
+            if self._index is None or self._index_signature != signature:
+                with open(self.path, 'rb') as f:
+                    if signature[1] == 0:
+                        self._index = ({}, {})
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                            self._index = build_offset_index(buffer)
+                self._index_signature = signature
+            return self._index
+
+    def intent_index(self, data=None):
+        """IntentIndex untuk data (default: tree hasil load()); dibangun ulang jika tree berganti"""
+        with self._lock:
+            if data is None:
+                data = self.load()
+            if self._intent_index is None or self._intent_index.data is not data:
+                self._intent_index = IntentIndex(data)
+            return self._intent_index
+
+    def _read_span(self, span):
+        start, end = span
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            return parse_json(f.read(end - start))
+
+    def _tree_available(self):
+        # Index byte-offset hanya menggambarkan file utama; jika ada change log, pakai tree lengkap
+        return self.is_fresh() or self.changelog_signature() is not None
+
+    def authors(self):
+        """Daftar author tanpa mem-parse isi file"""
+        if self._tree_available():
+            return list(self.load().keys())
+        return list(self.index()[0].keys())
+
+    def get_author(self, author):
+        """Data satu author ({'intents': [...]}) atau None jika tidak ada"""
+        if self._tree_available():
+            return self.load().get(author)
+        span = self.index()[0].get(author)
+        return self._read_span(span) if span else None
+
+    def get_intent(self, author, tag_name):
+        """Satu intent (author, tag) atau None; hanya objek intent itu yang di-parse"""
+        if self._tree_available():
+            intents = self.load().get(author, {}).get('intents', [])
+            return next((intent for intent in intents if intent.get('tag') == tag_name), None)
+        span = self.index()[1].get((author, tag_name))
+        return self._read_span(span) if span else None
+
+    def iter_intents(self, authors=None):
+        """Yield (author, intent) author demi author; hanya satu author yang ada di memori"""
+        for author in (authors if authors is not None else self.authors()):
+            author_data = self.get_author(author) or {}
+            for intent in author_data.get('intents', []):
+                yield author, intent
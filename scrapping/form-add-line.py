@@ -1,30 +1,87 @@
-import json
 import os
+import run_log
+from audit import DEFAULT_MAX_LENGTH, AuditGroups, LengthAudit, tag_label
+from dataset import Dataset
 
 # Path to JSON file
 base_path = r"c:\PythonVSCenv\Capstone\scrapping"
 json_file = os.path.join(base_path, "content_by_author_and_tags.json")
+log_file = os.environ.get("CHATBOT_LOG_FILE", os.path.join(base_path, "chatbot.log"))
+
+# Jumlah response terpanjang yang ditampilkan di console saat global audit
+AUDIT_PREVIEW_LIMIT = 10
+# Batas panjang response untuk global audit
+MAX_RESPONSE_LENGTH = DEFAULT_MAX_LENGTH
+
+log = run_log.get_logger("editor")
+
+# Data di-cache selama file tidak berubah, jadi load_data() di setiap loop menu tidak parse ulang.
+# Edit per tag dicatat di change log (append-only) dan digabung ke JSON utama secara berkala / saat keluar.
+dataset = Dataset(json_file, indent=4)
 
 def load_data():
     """Load data from JSON file"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return dataset.load()
     except FileNotFoundError:
         print("❌ File tidak ditemukan!")
         return {}
 
-def save_data(data):
-    """Save data to JSON file"""
+def save_data(data, author=None, tag=None, deleted=False):
+    """Save data to JSON file
+
+    Jika author dan tag (dict intent) diberikan, hanya tag itu yang dicatat ke change log;
+    deleted=True mencatat bahwa tag tersebut dihapus. Tanpa author/tag seluruh file ditulis ulang,
+    begitu juga untuk tag ganda (change log mencatat per nama tag, jadi tidak bisa membedakan salinannya).
+    """
     try:
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        if author is None or tag is None:
+            dataset.save(data)
+        elif is_duplicate_tag(data, author, tag):
+            dataset.save(data)
+            # Index & audit hanya memegang salinan pertama; bangun ulang dari tree yang baru disimpan
+            dataset.invalidate()
+        elif deleted:
+            dataset.record_delete(data, author, tag['tag'])
+        else:
+            dataset.record_intent(data, author, tag)
         print("✅ Data berhasil disimpan!")
         return True
     except Exception as e:
+        # Data di memori mungkin sudah berubah; baca ulang dari file di loop berikutnya
+        dataset.invalidate()
         print(f"❌ Error saat menyimpan: {e}")
         return False
 
+_index_state = {'warned': set()}   # tag ganda yang sudah diperingatkan
+
+def get_index(data):
+    """IntentIndex (lookup author/tag & cek duplikat) untuk data yang sedang diedit"""
+    index = dataset.intent_index(data)
+    new_duplicates = [key for key in index.duplicates if key not in _index_state['warned']]
+    if new_duplicates:
+        _index_state['warned'].update(new_duplicates)
+        print("⚠️  Tag ganda ditemukan (edit memakai tag yang dipilih dan menyimpan ulang seluruh file):")
+        for author, tag_name in new_duplicates:
+            print(f"   - [{author}] {tag_name} ({len(index.duplicates[(author, tag_name)]) + 1}x)")
+    return index
+
+def is_duplicate_tag(data, author, tag):
+    """True jika tag (dict) termasuk tag ganda milik author, atau bukan intent yang dipegang index"""
+    index = get_index(data)
+    return index.is_duplicate(author, tag['tag']) or index.get(author, tag['tag']) is not tag
+
+_audit_state = {'index': None, 'audit': None}
+
+def get_audit(data):
+    """LengthAudit untuk data; dibangun sekali lalu diperbarui oleh setiap edit lewat IntentIndex"""
+    index = get_index(data)
+    if _audit_state['index'] is not index:
+        audit = LengthAudit(data)
+        index.listeners.append(audit)
+        _audit_state.update(index=index, audit=audit)
+    return _audit_state['audit']
+
 def display_authors(data):
     """Display available authors"""
     authors = list(data.keys())
@@ -77,8 +134,8 @@ def add_tag(data):
         return
     
     # Check if tag already exists
-    existing_tags = [intent['tag'] for intent in data[author].get('intents', [])]
-    if tag_name in existing_tags:
+    index = get_index(data)
+    if index.has_tag(author, tag_name):
         print(f"❌ Tag '{tag_name}' sudah ada!")
         return
     
@@ -110,12 +167,9 @@ def add_tag(data):
             new_tag["responses"].append(resp)
     
     # Add to data
-    if 'intents' not in data[author]:
-        data[author]['intents'] = []
+    index.add_intent(author, new_tag)
     
-    data[author]['intents'].append(new_tag)
-    
-    if save_data(data):
+    if save_data(data, author, new_tag):
         print(f"✅ Tag '{tag_name}' berhasil ditambahkan untuk {author}!")
 
 def delete_tag(data):
@@ -140,8 +194,8 @@ def delete_tag(data):
                 tag_to_delete = intents[choice - 1]
                 confirm = input(f"⚠️  Yakin ingin menghapus tag '{tag_to_delete['tag']}'? (y/n): ")
                 if confirm.lower() == 'y':
-                    data[author]['intents'].remove(tag_to_delete)
-                    if save_data(data):
+                    get_index(data).remove_intent(author, tag_to_delete['tag'], tag_to_delete)
+                    if save_data(data, author, tag_to_delete, deleted=True):
                         print(f"✅ Tag '{tag_to_delete['tag']}' berhasil dihapus!")
                 else:
                     print("❌ Penghapusan dibatalkan!")
@@ -382,8 +436,8 @@ def rewrite_response(data, author, tag, index, original_text):
     
     confirm = input(f"\nSimpan perubahan? (y/n): ")
     if confirm.lower() == 'y':
-        tag['responses'][index] = new_text
-        if save_data(data):
+        get_index(data).set_response(author, tag['tag'], index, new_text, tag)
+        if save_data(data, author, tag):
             print(f"✅ Response berhasil diupdate!")
             return True
     else:
@@ -425,8 +479,8 @@ def edit_partial_response(data, author, tag, index, original_text):
     
     confirm = input(f"\nSimpan perubahan? (y/n): ")
     if confirm.lower() == 'y':
-        tag['responses'][index] = edited_text
-        if save_data(data):
+        get_index(data).set_response(author, tag['tag'], index, edited_text, tag)
+        if save_data(data, author, tag):
             print(f"✅ Response berhasil diupdate!")
             return True
     else:
@@ -439,21 +493,21 @@ def add_input_to_tag(data, author, tag):
     print(f"\n📝 Menambah input untuk tag '{tag['tag']}':")
     print("(Ketik 'done' untuk selesai)")
     
+    index = get_index(data)
     added_count = 0
     while True:
         inp = input("Input baru: ").strip()
         if inp.lower() == 'done':
             break
         if inp:
-            if inp not in tag["input"]:
-                tag["input"].append(inp)
+            if index.add_input(author, tag['tag'], inp, tag):
                 added_count += 1
                 print(f"✅ Input '{inp}' ditambahkan!")
             else:
                 print(f"⚠️  Input '{inp}' sudah ada!")
     
     if added_count > 0:
-        if save_data(data):
+        if save_data(data, author, tag):
             print(f"✅ {added_count} input baru berhasil ditambahkan!")
 
 def add_response_to_tag(data, author, tag):
@@ -461,21 +515,21 @@ def add_response_to_tag(data, author, tag):
     print(f"\n💬 Menambah response untuk tag '{tag['tag']}':")
     print("(Ketik 'done' untuk selesai)")
     
+    index = get_index(data)
     added_count = 0
     while True:
         resp = input("Response baru: ").strip()
         if resp.lower() == 'done':
             break
         if resp:
-            if resp not in tag["responses"]:
-                tag["responses"].append(resp)
+            if index.add_response(author, tag['tag'], resp, tag):
                 added_count += 1
                 print(f"✅ Response ditambahkan!")
             else:
                 print(f"⚠️  Response sudah ada!")
     
     if added_count > 0:
-        if save_data(data):
+        if save_data(data, author, tag):
             print(f"✅ {added_count} response baru berhasil ditambahkan!")
 
 def delete_input_from_tag(data, author, tag):
@@ -492,8 +546,8 @@ def delete_input_from_tag(data, author, tag):
         try:
             choice = int(input(f"\nPilih input yang akan dihapus (1-{len(tag['input'])}): "))
             if 1 <= choice <= len(tag["input"]):
-                deleted_input = tag["input"].pop(choice - 1)
-                if save_data(data):
+                deleted_input = get_index(data).remove_input(author, tag['tag'], choice - 1, tag)
+                if save_data(data, author, tag):
                     print(f"✅ Input '{deleted_input}' berhasil dihapus!")
                 break
             else:
@@ -515,8 +569,8 @@ def delete_response_from_tag(data, author, tag):
         try:
             choice = int(input(f"\nPilih response yang akan dihapus (1-{len(tag['responses'])}): "))
             if 1 <= choice <= len(tag["responses"]):
-                deleted_response = tag["responses"].pop(choice - 1)
-                if save_data(data):
+                deleted_response = get_index(data).remove_response(author, tag['tag'], choice - 1, tag)
+                if save_data(data, author, tag):
                     print(f"✅ Response berhasil dihapus!")
                 break
             else:
@@ -538,43 +592,44 @@ def view_tag_data(tag):
     for i, resp in enumerate(tag['responses'], 1):
         print(f"  {i}. {resp[:100]}{'...' if len(resp) > 100 else ''}")
 
-def global_audit_responses(data):
-    """Audit semua responses dari semua tags yang melebihi 150 karakter"""
+def global_audit_responses(data, max_length=MAX_RESPONSE_LENGTH):
+    """Audit semua responses dari semua tags yang melebihi max_length karakter"""
     print("\n" + "="*50)
     print("🔍 GLOBAL AUDIT RESPONSES - SEMUA AUTHOR & TAG")
     print("="*50)
     
-    all_long_responses = []
+    # Kolom panjang di-flatten sekali per data lalu dijaga tetap terbaru; di sini hanya query vektor
+    audit = get_audit(data)
+    long_rows = audit.longer_than(max_length)
     
-    # Find all responses longer than 150 characters across all authors and tags
-    for author, author_data in data.items():
-        intents = author_data.get('intents', [])
-        for intent in intents:
-            responses = intent.get('responses', [])
-            for i, resp in enumerate(responses):
-                if len(resp) > 150:
-                    all_long_responses.append({
-                        'author': author,
-                        'tag': intent['tag'],
-                        'index': i,
-                        'text': resp,
-                        'length': len(resp)
-                    })
-    
-    if not all_long_responses:
-        print("✅ Tidak ada response yang melebihi 150 karakter di seluruh database!")
+    if not len(long_rows):
+        print(f"✅ Tidak ada response yang melebihi {max_length} karakter di seluruh database!")
         return
     
-    # Sort by length (longest first)
-    all_long_responses.sort(key=lambda x: x['length'], reverse=True)
+    all_long_responses = audit.entries(long_rows)
+    groups = AuditGroups(all_long_responses)
     
-    print(f"⚠️  Ditemukan {len(all_long_responses)} response yang melebihi 150 karakter:")
+    print(f"⚠️  Ditemukan {len(all_long_responses)} response yang melebihi {max_length} karakter:")
     print("-" * 80)
     
+    # Detail lengkap per response hanya ke log file; console cukup ringkasan
     for i, resp_data in enumerate(all_long_responses, 1):
-        print(f"\n{i}. [{resp_data['author']}] Tag: {resp_data['tag']}")
-        print(f"   Response Index: {resp_data['index'] + 1} | Panjang: {resp_data['length']} karakter")
-        print(f"   Preview: {resp_data['text'][:100]}...")
+        log.debug(f"{i}. [{resp_data['author']}] Tag: {resp_data['tag']} | Response Index: "
+                  f"{resp_data['index'] + 1} | Panjang: {resp_data['length']} karakter",
+                  extra={'fields': {'event': 'audit', 'author': resp_data['author'], 'tag': resp_data['tag'],
+                                    'index': resp_data['index'], 'length': resp_data['length'],
+                                    'text': resp_data['text']}})
+    
+    for author in groups.authors():
+        print(f"👤 {author}: {groups.author_count(author)} response")
+    
+    longest = audit.entries(audit.top_k(AUDIT_PREVIEW_LIMIT, long_rows))
+    print(f"\n📏 {len(longest)} response terpanjang:")
+    for i, resp_data in enumerate(longest, 1):
+        print(f"{i}. [{resp_data['author']}] {resp_data['tag']} - Response {resp_data['index'] + 1} "
+              f"({resp_data['length']} karakter) {resp_data['text'][:60]}...")
+    if run_log.log_file_path():
+        print(f"🧾 Daftar lengkap ditulis ke {run_log.log_file_path()}")
     
     print("\n" + "="*80)
     print("PILIHAN TINDAKAN:")
@@ -590,13 +645,13 @@ def global_audit_responses(data):
     if choice == '1':
         edit_specific_global_response(data, all_long_responses)
     elif choice == '2':
-        edit_responses_by_author(data, all_long_responses)
+        edit_responses_by_author(data, groups)
     elif choice == '3':
-        edit_responses_by_tag(data, all_long_responses)
+        edit_responses_by_tag(data, groups)
     elif choice == '4':
         edit_all_global_responses(data, all_long_responses)
     elif choice == '5':
-        filter_and_display(all_long_responses)
+        filter_and_display(groups, audit, long_rows)
     elif choice == '6':
         return
     else:
@@ -619,42 +674,31 @@ def edit_specific_global_response(data, all_long_responses):
                 
                 # Find the actual tag object in data
                 author = selected_resp['author']
-                tag_name = selected_resp['tag']
-                
-                for intent in data[author]['intents']:
-                    if intent['tag'] == tag_name:
-                        edit_single_response(data, author, intent, selected_resp)
-                        break
+                intent = get_index(data).find_intent(author, selected_resp['tag'], selected_resp['index'],
+                                                     selected_resp['text'])
+                if intent is not None:
+                    edit_single_response(data, author, intent, selected_resp)
                 break
             else:
                 print("❌ Pilihan tidak valid!")
         except ValueError:
             print("❌ Masukkan angka yang valid!")
 
-def edit_responses_by_author(data, all_long_responses):
+def edit_responses_by_author(data, groups):
     """Edit responses berdasarkan author tertentu"""
-    # Get unique authors with long responses
-    authors_with_long = {}
-    for resp in all_long_responses:
-        author = resp['author']
-        if author not in authors_with_long:
-            authors_with_long[author] = []
-        authors_with_long[author].append(resp)
-    
     print(f"\n📝 EDIT RESPONSES BY AUTHOR")
     print("-" * 40)
     
-    authors = list(authors_with_long.keys())
+    authors = groups.authors()
     for i, author in enumerate(authors, 1):
-        count = len(authors_with_long[author])
-        print(f"{i}. {author} ({count} responses)")
+        print(f"{i}. {author} ({groups.author_count(author)} responses)")
     
     while True:
         try:
             choice = int(input(f"\nPilih author (1-{len(authors)}): "))
             if 1 <= choice <= len(authors):
                 selected_author = authors[choice - 1]
-                author_responses = authors_with_long[selected_author]
+                author_responses = groups.author_entries(selected_author)
                 
                 print(f"\n📋 Responses panjang dari {selected_author}:")
                 for i, resp in enumerate(author_responses, 1):
@@ -667,32 +711,23 @@ def edit_responses_by_author(data, all_long_responses):
         except ValueError:
             print("❌ Masukkan angka yang valid!")
 
-def edit_responses_by_tag(data, all_long_responses):
+def edit_responses_by_tag(data, groups):
     """Edit responses berdasarkan tag tertentu"""
-    # Get unique tags with long responses
-    tags_with_long = {}
-    for resp in all_long_responses:
-        tag_key = f"[{resp['author']}] {resp['tag']}"
-        if tag_key not in tags_with_long:
-            tags_with_long[tag_key] = []
-        tags_with_long[tag_key].append(resp)
-    
     print(f"\n📝 EDIT RESPONSES BY TAG")
     print("-" * 40)
     
-    tag_keys = list(tags_with_long.keys())
+    tag_keys = groups.tag_keys()
     for i, tag_key in enumerate(tag_keys, 1):
-        count = len(tags_with_long[tag_key])
-        print(f"{i}. {tag_key} ({count} responses)")
+        print(f"{i}. {tag_label(tag_key)} ({groups.tag_count(tag_key)} responses)")
     
     while True:
         try:
             choice = int(input(f"\nPilih tag (1-{len(tag_keys)}): "))
             if 1 <= choice <= len(tag_keys):
                 selected_tag_key = tag_keys[choice - 1]
-                tag_responses = tags_with_long[selected_tag_key]
+                tag_responses = groups.tag_entries(selected_tag_key)
                 
-                print(f"\n📋 Responses panjang dari {selected_tag_key}:")
+                print(f"\n📋 Responses panjang dari {tag_label(selected_tag_key)}:")
                 for i, resp in enumerate(tag_responses, 1):
                     print(f"{i}. Response {resp['index'] + 1} ({resp['length']} karakter)")
                     print(f"   {resp['text'][:80]}...")
@@ -715,6 +750,7 @@ def edit_all_global_responses(data, all_long_responses):
         print("❌ Edit dibatalkan!")
         return
     
+    index = get_index(data)
     edited_count = 0
     for i, resp_data in enumerate(all_long_responses, 1):
         print(f"\n{'='*60}")
@@ -725,13 +761,9 @@ def edit_all_global_responses(data, all_long_responses):
         
         # Find the actual tag object in data
         author = resp_data['author']
-        tag_name = resp_data['tag']
-        
-        for intent in data[author]['intents']:
-            if intent['tag'] == tag_name:
-                if edit_single_response(data, author, intent, resp_data):
-                    edited_count += 1
-                break
+        intent = index.find_intent(author, resp_data['tag'], resp_data['index'], resp_data['text'])
+        if intent is not None and edit_single_response(data, author, intent, resp_data):
+            edited_count += 1
         
         if i < len(all_long_responses):
             continue_edit = input(f"\nLanjutkan ke response berikutnya? (y/n): ")
@@ -749,6 +781,7 @@ def edit_author_responses(data, author, author_responses):
     if confirm.lower() != 'y':
         return
     
+    index = get_index(data)
     edited_count = 0
     for i, resp_data in enumerate(author_responses, 1):
         print(f"\n{'='*50}")
@@ -757,11 +790,9 @@ def edit_author_responses(data, author, author_responses):
         print("="*50)
         
         # Find the actual tag object
-        for intent in data[author]['intents']:
-            if intent['tag'] == resp_data['tag']:
-                if edit_single_response(data, author, intent, resp_data):
-                    edited_count += 1
-                break
+        intent = index.find_intent(author, resp_data['tag'], resp_data['index'], resp_data['text'])
+        if intent is not None and edit_single_response(data, author, intent, resp_data):
+            edited_count += 1
         
         if i < len(author_responses):
             continue_edit = input(f"\nLanjutkan ke response berikutnya? (y/n): ")
@@ -786,6 +817,7 @@ def edit_tag_responses(data, tag_responses):
     if confirm.lower() != 'y':
         return
     
+    index = get_index(data)
     edited_count = 0
     for i, resp_data in enumerate(tag_responses, 1):
         print(f"\n{'='*50}")
@@ -794,11 +826,9 @@ def edit_tag_responses(data, tag_responses):
         print("="*50)
         
         # Find the actual tag object
-        for intent in data[author]['intents']:
-            if intent['tag'] == tag_name:
-                if edit_single_response(data, author, intent, resp_data):
-                    edited_count += 1
-                break
+        intent = index.find_intent(author, tag_name, resp_data['index'], resp_data['text'])
+        if intent is not None and edit_single_response(data, author, intent, resp_data):
+            edited_count += 1
         
         if i < len(tag_responses):
             continue_edit = input(f"\nLanjutkan ke response berikutnya? (y/n): ")
@@ -807,7 +837,7 @@ def edit_tag_responses(data, tag_responses):
     
     print(f"\n✅ Selesai! {edited_count} response berhasil diedit dari {len(tag_responses)} response.")
 
-def filter_and_display(all_long_responses):
+def filter_and_display(groups, audit, long_rows):
     """Filter dan tampilkan responses berdasarkan kriteria"""
     print("\n🔍 FILTER DAN TAMPILKAN")
     print("-" * 30)
@@ -820,73 +850,63 @@ def filter_and_display(all_long_responses):
     choice = input("\nPilih filter (1-5): ").strip()
     
     if choice == '1':
-        filter_by_author(all_long_responses)
+        filter_by_author(groups)
     elif choice == '2':
-        filter_by_tag(all_long_responses)
+        filter_by_tag(groups)
     elif choice == '3':
-        filter_by_length(all_long_responses)
+        filter_by_length(audit, long_rows)
     elif choice == '4':
-        show_all_sorted(all_long_responses)
+        show_all_sorted(audit, long_rows)
     elif choice == '5':
         return
     else:
         print("❌ Pilihan tidak valid!")
 
-def filter_by_author(all_long_responses):
+def filter_by_author(groups):
     """Filter responses by author"""
-    authors = list(set([resp['author'] for resp in all_long_responses]))
+    authors = groups.authors()
     
     print(f"\n📚 PILIH AUTHOR:")
     for i, author in enumerate(authors, 1):
-        count = len([r for r in all_long_responses if r['author'] == author])
-        print(f"{i}. {author} ({count} responses)")
+        print(f"{i}. {author} ({groups.author_count(author)} responses)")
     
     try:
         choice = int(input(f"\nPilih author (1-{len(authors)}): "))
         if 1 <= choice <= len(authors):
             selected_author = authors[choice - 1]
-            filtered = [r for r in all_long_responses if r['author'] == selected_author]
-            display_filtered_responses(filtered, f"Author: {selected_author}")
+            display_filtered_responses(groups.author_entries(selected_author), f"Author: {selected_author}")
     except ValueError:
         print("❌ Input tidak valid!")
 
-def filter_by_tag(all_long_responses):
+def filter_by_tag(groups):
     """Filter responses by tag"""
-    tags = list(set([f"[{resp['author']}] {resp['tag']}" for resp in all_long_responses]))
+    tag_keys = groups.tag_keys()
     
     print(f"\n🏷️  PILIH TAG:")
-    for i, tag in enumerate(tags, 1):
-        tag_parts = tag.replace('[', '').split('] ')
-        author = tag_parts[0]
-        tag_name = tag_parts[1]
-        count = len([r for r in all_long_responses if r['author'] == author and r['tag'] == tag_name])
-        print(f"{i}. {tag} ({count} responses)")
+    for i, tag_key in enumerate(tag_keys, 1):
+        print(f"{i}. {tag_label(tag_key)} ({groups.tag_count(tag_key)} responses)")
     
     try:
-        choice = int(input(f"\nPilih tag (1-{len(tags)}): "))
-        if 1 <= choice <= len(tags):
-            selected_tag = tags[choice - 1]
-            tag_parts = selected_tag.replace('[', '').split('] ')
-            author = tag_parts[0]
-            tag_name = tag_parts[1]
-            filtered = [r for r in all_long_responses if r['author'] == author and r['tag'] == tag_name]
-            display_filtered_responses(filtered, f"Tag: {selected_tag}")
+        choice = int(input(f"\nPilih tag (1-{len(tag_keys)}): "))
+        if 1 <= choice <= len(tag_keys):
+            selected_tag = tag_keys[choice - 1]
+            display_filtered_responses(groups.tag_entries(selected_tag), f"Tag: {tag_label(selected_tag)}")
     except ValueError:
         print("❌ Input tidak valid!")
 
-def filter_by_length(all_long_responses):
+def filter_by_length(audit, long_rows):
     """Filter responses by length range"""
     print(f"\n📏 FILTER BY LENGTH")
     try:
-        min_length = int(input("Panjang minimum (default 150): ") or "150")
+        min_length = int(input(f"Panjang minimum (default {MAX_RESPONSE_LENGTH}): ") or MAX_RESPONSE_LENGTH)
         max_length = int(input("Panjang maximum (default 1000): ") or "1000")
         
-        filtered = [r for r in all_long_responses if min_length <= r['length'] <= max_length]
+        filtered = audit.entries(audit.within(long_rows, min_length, max_length))
         display_filtered_responses(filtered, f"Length: {min_length}-{max_length} karakter")
     except ValueError:
         print("❌ Input tidak valid!")
 
-def show_all_sorted(all_long_responses):
+def show_all_sorted(audit, long_rows):
     """Show all responses sorted by different criteria"""
     print(f"\n📊 SORT BY:")
     print("1. Length (terpanjang dulu)")
@@ -896,18 +916,15 @@ def show_all_sorted(all_long_responses):
     
     choice = input("\nPilih sorting (1-4): ").strip()
     
-    if choice == '1':
-        sorted_responses = sorted(all_long_responses, key=lambda x: x['length'], reverse=True)
-        display_filtered_responses(sorted_responses, "Sorted by Length (Desc)")
-    elif choice == '2':
-        sorted_responses = sorted(all_long_responses, key=lambda x: x['length'])
-        display_filtered_responses(sorted_responses, "Sorted by Length (Asc)")
-    elif choice == '3':
-        sorted_responses = sorted(all_long_responses, key=lambda x: x['author'])
-        display_filtered_responses(sorted_responses, "Sorted by Author")
-    elif choice == '4':
-        sorted_responses = sorted(all_long_responses, key=lambda x: (x['author'], x['tag']))
-        display_filtered_responses(sorted_responses, "Sorted by Tag")
+    sort_options = {
+        '1': ('length_desc', "Sorted by Length (Desc)"),
+        '2': ('length_asc', "Sorted by Length (Asc)"),
+        '3': ('author', "Sorted by Author"),
+        '4': ('tag', "Sorted by Tag"),
+    }
+    if choice in sort_options:
+        key, title = sort_options[choice]
+        display_filtered_responses(audit.entries(audit.order(long_rows, key)), title)
     else:
         print("❌ Pilihan tidak valid!")
 
@@ -951,33 +968,46 @@ def main():
     """Main application loop"""
     print("🎯 Selamat datang di Chatbot Tag Manager!")
     print("📁 File: content_by_author_and_tags.json")
+    run_log.setup_logging(log_file=log_file)
     
-    while True:
-        data = load_data()
-        if not data:
-            print("❌ Tidak dapat memuat data!")
-            break
+    try:
+        while True:
+            data = load_data()
+            if not data:
+                print("❌ Tidak dapat memuat data!")
+                break
         
-        main_menu()
-        choice = input("\nPilih menu (1-6): ").strip()
+            main_menu()
+            choice = input("\nPilih menu (1-6): ").strip()
         
-        if choice == '1':
-            add_tag(data)
-        elif choice == '2':
-            delete_tag(data)
-        elif choice == '3':
-            edit_tag(data)
-        elif choice == '4':
-            view_all_data(data)
-        elif choice == '5':
-            global_audit_responses(data)
-        elif choice == '6':
-            print("👋 Terima kasih telah menggunakan Tag Manager!")
-            break
-        else:
-            print("❌ Pilihan tidak valid!")
+            if choice == '1':
+                add_tag(data)
+            elif choice == '2':
+                delete_tag(data)
+            elif choice == '3':
+                edit_tag(data)
+            elif choice == '4':
+                view_all_data(data)
+            elif choice == '5':
+                global_audit_responses(data)
+            elif choice == '6':
+                print("👋 Terima kasih telah menggunakan Tag Manager!")
+                break
+            else:
+                print("❌ Pilihan tidak valid!")
         
-        input("\nTekan Enter untuk melanjutkan...")
+            input("\nTekan Enter untuk melanjutkan...")
+    finally:
+        # Juga saat Ctrl-C/EOF: perubahan per tag tidak tertinggal di change log
+        close_dataset()
+
+def close_dataset():
+    """Gabungkan change log ke file JSON utama sebelum keluar"""
+    try:
+        if dataset.compact():
+            print("💾 Perubahan digabung ke file utama")
+    except Exception as e:
+        print(f"❌ Error saat menggabungkan perubahan: {e} (perubahan tetap ada di {dataset.changelog_path})")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,345 @@
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Server lokal pengganti https://capstone-five-dusky.vercel.app/chatbot/tags
+# Jalankan: python mock_server.py --port 8000
+# Lalu: CHATBOT_API_URL=http://127.0.0.1:8000/chatbot/tags python send_to_postman.py
+
+BASE_PATH = "/chatbot/tags"
+
+# Opsi simulasi (keyword create_server / flag CLI):
+#   latency        : delay dasar per request (detik)
+#   latency_jitter : tambahan delay acak 0..jitter (detik)
+#   error_rate     : peluang request dijawab error_status (0.0 - 1.0)
+#   error_status   : status error yang disuntikkan (default 503)
+#   rate_limit     : maksimum request/detik sebelum dijawab 429 (0 = tanpa batas)
+#   retry_after    : nilai header Retry-After pada 429 (detik)
+#   seed           : seed random untuk error injection yang bisa diulang
+#   gzip           : terima body request gzip & kompres response jika diminta (default True;
+#                    False = body gzip dijawab 415)
+
+# Response lebih kecil dari ini tidak dikompres
+GZIP_MIN_BYTES = 512
+
+class RateLimitWindow:
+    """Token bucket sederhana milik server: request di atas limit dijawab 429"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = float(max(rate, 1))
+        self.updated = time.monotonic()
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(float(max(self.rate, 1)), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.throttled += 1
+            return False
+
+class TagStore:
+    """Penyimpanan tag in-memory (thread-safe)"""
+
+    def __init__(self):
+        self.tags = {}
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def etag(self):
+        """ETag koleksi: berubah setiap ada create/update/delete"""
+        return f'W/"v{self.version}"'
+
+    def create(self, payload):
+        with self._lock:
+            tag_id = uuid.uuid4().hex[:12]
+            tag = dict(payload, id=tag_id)
+            self.tags[tag_id] = tag
+            self.version += 1
+            return tag
+
+    def list(self):
+        with self._lock:
+            return list(self.tags.values())
+
+    def update(self, tag_id, payload):
+        with self._lock:
+            if tag_id not in self.tags:
+                return None
+            tag = dict(payload, id=tag_id)
+            self.tags[tag_id] = tag
+            self.version += 1
+            return tag
+
+    def delete(self, tag_id):
+        with self._lock:
+            tag = self.tags.pop(tag_id, None)
+            if tag is not None:
+                self.version += 1
+            return tag
+
+    def find_id(self, author_name, tag_name):
+        with self._lock:
+            for tag_id, tag in self.tags.items():
+                if tag.get('nama') == author_name and tag.get('tag') == tag_name:
+                    return tag_id
+        return None
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Handler GET/POST/PUT/DELETE dengan kontrak yang dipakai send_to_postman.py"""
+
+    protocol_version = "HTTP/1.1"
+    # Header dan body dikirim dalam write terpisah; tanpa ini Nagle + delayed ACK
+    # menambah ~40 ms per request dan merusak angka benchmark
+    disable_nagle_algorithm = True
+    store = None
+    options = {}
+    limiter = None
+    rng = random.Random()
+
+    def reject_unsupported_encoding(self):
+        """Jawab 415 untuk body gzip jika opsi gzip dimatikan. Return True jika sudah dijawab"""
+        if self.headers.get('Content-Encoding', 'identity') in ('identity', ''):
+            return False
+        if self.options.get('gzip', True) and self.headers.get('Content-Encoding') == 'gzip':
+            return False
+        self.read_body()
+        self.send_json(415, {"message": "Content-Encoding tidak didukung"})
+        return True
+
+    def simulate(self):
+        """Terapkan latency, 429 dan error injection. Return True jika request sudah dijawab"""
+        delay = self.options.get('latency', 0) + self.rng.uniform(0, self.options.get('latency_jitter', 0))
+        if delay > 0:
+            time.sleep(delay)
+        if self.limiter is not None and not self.limiter.allow():
+            retry_after = self.options.get('retry_after', 1)
+            self.read_body()
+            self.send_json(429, {"message": "Too Many Requests"}, {"Retry-After": str(retry_after)})
+            return True
+        if self.rng.random() < self.options.get('error_rate', 0):
+            self.read_body()
+            status = self.options.get('error_status', 503)
+            self.send_json(status, {"message": "Injected failure"})
+            return True
+        return False
+
+    def log_message(self, format, *args):
+        if self.options.get('verbose'):
+            super().log_message(format, *args)
+
+    def send_json(self, status, body, headers=None):
+        encoded = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        compressed = self.options.get('gzip', True) and accepts_gzip and len(encoded) >= GZIP_MIN_BYTES
+        if compressed:
+            encoded = gzip.compress(encoded)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def read_body(self):
+        """Baca body sekali (dipakai juga untuk membuang body saat request ditolak)"""
+        if getattr(self, '_body', None) is None:
+            length = int(self.headers.get('Content-Length', 0))
+            self._body = self.rfile.read(length) if length else b''
+        return self._body
+
+    def read_json(self):
+        raw = self.read_body()
+        if not raw:
+            return {}
+        if self.headers.get('Content-Encoding') == 'gzip':
+            raw = gzip.decompress(raw)
+        return json.loads(raw.decode('utf-8'))
+
+    def route(self):
+        """Return sub-path setelah BASE_PATH, atau None jika bukan endpoint tags"""
+        path = self.path.split('?', 1)[0].rstrip('/')
+        if path == BASE_PATH:
+            return ''
+        if path.startswith(BASE_PATH + '/'):
+            return path[len(BASE_PATH) + 1:]
+        return None
+
+    def query(self):
+        return {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+
+    def do_GET(self):
+        self._body = None
+        if self.simulate() or self.reject_unsupported_encoding():
+            return
+        sub_path = self.route()
+        if sub_path != '':
+            return self.send_json(404, {"message": "Not found"})
+        etag = self.store.etag()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        tags = self.store.list()
+        query = self.query()
+        if 'limit' not in query or not self.options.get('pagination', True):
+            return self.send_json(200, {"data": tags}, {"ETag": etag})
+
+        # Pagination: ?limit=N&page=P atau ?limit=N&cursor=C (cursor = offset)
+        try:
+            limit = max(1, int(query['limit']))
+            if 'cursor' in query:
+                offset = int(query['cursor'])
+            else:
+                offset = (max(1, int(query.get('page', 1))) - 1) * limit
+        except ValueError:
+            return self.send_json(400, {"message": "Parameter pagination tidak valid"})
+        page_tags = tags[offset:offset + limit]
+        next_offset = offset + limit
+        self.send_json(200, {
+            "data": page_tags,
+            "pagination": {
+                "page": offset // limit + 1,
+                "limit": limit,
+                "total": len(tags),
+                "totalPages": (len(tags) + limit - 1) // limit,
+                "next_cursor": str(next_offset) if next_offset < len(tags) else None
+            }
+        }, {"ETag": etag})
+
+    def do_POST(self):
+        self._body = None
+        if self.simulate() or self.reject_unsupported_encoding():
+            return
+        sub_path = self.route()
+        if sub_path is None:
+            return self.send_json(404, {"message": "Not found"})
+        try:
+            body = self.read_json()
+        except (ValueError, OSError):
+            return self.send_json(400, {"message": "Invalid JSON"})
+
+        if sub_path == '':
+            if not isinstance(body, dict) or not body.get('tag') or not body.get('nama'):
+                return self.send_json(400, {"message": "Field 'tag' dan 'nama' wajib diisi"})
+            if not isinstance(body.get('input'), list) or not isinstance(body.get('responses'), list):
+                return self.send_json(400, {"message": "Field 'input' dan 'responses' harus berupa list"})
+            return self.send_json(201, {"message": "Tag created", "data": self.store.create(body)})
+
+        if sub_path == 'bulk':
+            if not self.options.get('bulk', True):
+                return self.send_json(404, {"message": "Not found"})
+            if not isinstance(body, list):
+                return self.send_json(400, {"message": "Body bulk harus berupa list"})
+            created = [self.store.create(item) for item in body]
+            return self.send_json(201, {"message": f"{len(created)} tags created", "data": created})
+
+        if sub_path in ('delete', 'update'):
+            tag_id = self.store.find_id(body.get('nama'), body.get('tag'))
+            if tag_id is None:
+                return self.send_json(404, {"message": "Tag not found"})
+            if sub_path == 'delete':
+                self.store.delete(tag_id)
+                return self.send_json(200, {"message": "Tag deleted"})
+            return self.send_json(200, {"message": "Tag updated", "data": self.store.update(tag_id, body)})
+
+        self.send_json(405, {"message": "Method not allowed"})
+
+    def do_PUT(self):
+        self._body = None
+        if self.simulate() or self.reject_unsupported_encoding():
+            return
+        sub_path = self.route()
+        if not sub_path:
+            return self.send_json(405, {"message": "Method not allowed"})
+        try:
+            body = self.read_json()
+        except (ValueError, OSError):
+            return self.send_json(400, {"message": "Invalid JSON"})
+        tag = self.store.update(sub_path, body)
+        if tag is None:
+            return self.send_json(404, {"message": "Tag not found"})
+        self.send_json(200, {"message": "Tag updated", "data": tag})
+
+    def do_DELETE(self):
+        self._body = None
+        if self.simulate() or self.reject_unsupported_encoding():
+            return
+        sub_path = self.route()
+        if not sub_path:
+            return self.send_json(405, {"message": "Method not allowed"})
+        if self.store.delete(sub_path) is None:
+            return self.send_json(404, {"message": "Tag not found"})
+        self.send_json(200, {"message": "Tag deleted"})
+
+def create_server(host="127.0.0.1", port=8000, **options):
+    """Buat server mock (port=0 untuk port acak). Return (server, store)"""
+    store = TagStore()
+    limiter = RateLimitWindow(options['rate_limit']) if options.get('rate_limit') else None
+    handler = type('ConfiguredMockApiHandler', (MockApiHandler,), {
+        'store': store,
+        'options': options,
+        'limiter': limiter,
+        'rng': random.Random(options.get('seed'))
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server, store
+
+def start_server_in_background(host="127.0.0.1", port=0, **options):
+    """Jalankan server mock di thread terpisah. Return (server, store, base_url)"""
+    server, store = create_server(host, port, **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{server.server_address[0]}:{server.server_address[1]}{BASE_PATH}"
+    return server, store, base_url
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock server untuk API chatbot/tags")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--no-bulk", action="store_true", help="Tolak endpoint bulk (uji fallback per-item)")
+    parser.add_argument("--no-pagination", action="store_true", help="Abaikan parameter limit/page/cursor")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay dasar per request (detik)")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Tambahan delay acak maksimum (detik)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Peluang request gagal (0.0 - 1.0)")
+    parser.add_argument("--error-status", type=int, default=503, help="Status untuk error injection")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Request/detik sebelum 429 (0 = tanpa batas)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Header Retry-After pada 429 (detik)")
+    parser.add_argument("--seed", type=int, help="Seed error injection")
+    parser.add_argument("--no-gzip", action="store_true", help="Tolak body gzip (415) dan jangan kompres response")
+    parser.add_argument("--verbose", action="store_true", help="Log setiap request")
+    args = parser.parse_args()
+
+    server, _ = create_server(args.host, args.port, bulk=not args.no_bulk,
+                              pagination=not args.no_pagination, verbose=args.verbose,
+                              latency=args.latency, latency_jitter=args.latency_jitter,
+                              error_rate=args.error_rate, error_status=args.error_status,
+                              rate_limit=args.rate_limit, retry_after=args.retry_after, seed=args.seed,
+                              gzip=not args.no_gzip)
+    print(f"🧪 Mock API berjalan di http://{args.host}:{server.server_address[1]}{BASE_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Mock server dihentikan")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+import argparse
+import json
+import os
+import re
+import sys
+import unicodedata
+import zlib
+
+import numpy as np
+
+from dataset import Dataset, IntentIndex
+
+# Deteksi response yang hampir sama (beda tanda baca, spasi, huruf besar/kecil, sedikit kata)
+# di seluruh author & tag tanpa membandingkan semua pasangan:
+#   1. teks dinormalisasi lalu dipecah jadi shingle karakter (SHINGLE_SIZE karakter)
+#   2. MinHash (NUM_PERM fungsi hash) meringkas set shingle menjadi signature
+#   3. LSH: signature dibagi BANDS band; teks yang satu band-nya identik menjadi kandidat
+#   4. kandidat disaring dengan estimasi Jaccard dari signature (vektor), lalu diverifikasi
+#      dengan Jaccard shingle yang sebenarnya (>= threshold)
+#   5. pasangan digabung jadi cluster (union-find)
+# Terjemahan (quote yang sama dalam bahasa Inggris dan Indonesia) tidak punya shingle yang sama,
+# jadi tidak terdeteksi di sini.
+#
+# Contoh:
+#   python near_duplicates.py                 # tampilkan cluster, exit 1 jika ada
+#   python near_duplicates.py --merge         # hapus duplikat dalam author yang sama lalu simpan
+
+DEFAULT_DATA_FILE = os.environ.get(
+    "CHATBOT_DATA_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "output", "content_by_author_and_tags.json"))
+DEFAULT_THRESHOLD = 0.7
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 32                     # 32 band x 4 baris: peluang jadi kandidat ~1.0 untuk Jaccard 0.7
+MINHASH_SEED = 1
+EMPTY_SIGNATURE = np.iinfo(np.uint32).max
+# Estimasi MinHash 128 permutasi punya simpangan ~0.04; kandidat di bawah threshold - margin dibuang
+ESTIMATE_MARGIN = 0.15
+ESTIMATE_CHUNK = 65536
+SIGNATURE_CHUNK = 1 << 18     # jumlah shingle per batch hashing (matriks NUM_PERM x batch)
+
+EXIT_OK = 0
+EXIT_DUPLICATES = 1
+EXIT_USAGE = 2
+
+NON_WORD = re.compile(r"[\W_]+")
+
+def normalize(text):
+    """Huruf kecil, tanda baca/simbol jadi spasi, spasi dirapikan"""
+    return NON_WORD.sub(" ", unicodedata.normalize('NFKC', text).casefold()).strip()
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Set hash (crc32) shingle karakter dari teks yang sudah dinormalisasi"""
+    if len(text) <= size:
+        return {zlib.crc32(text.encode('utf-8'))} if text else set()
+    return {zlib.crc32(text[i:i + size].encode('utf-8')) for i in range(len(text) - size + 1)}
+
+def jaccard(first, second):
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+class MinHasher:
+    """Signature MinHash dengan hash multiply-shift: ((a*x + b) mod 2^64) >> 32"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=MINHASH_SEED):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_set):
+        return self.signatures([shingle_set])[0]
+
+    def signatures(self, shingle_sets):
+        """Matriks signature (jumlah teks x NUM_PERM); teks di-hash per batch, bukan satu per satu"""
+        result = np.full((len(shingle_sets), len(self.a)), EMPTY_SIGNATURE, dtype=np.uint32)
+        batch, batch_rows, batch_size = [], [], 0
+        for row, shingle_set in enumerate(shingle_sets):
+            if shingle_set:
+                batch.append(shingle_set)
+                batch_rows.append(row)
+                batch_size += len(shingle_set)
+            if batch and (batch_size >= SIGNATURE_CHUNK or row == len(shingle_sets) - 1):
+                self._hash_batch(batch, batch_rows, result)
+                batch, batch_rows, batch_size = [], [], 0
+        return result
+
+    def _hash_batch(self, batch, rows, result):
+        lengths = [len(shingle_set) for shingle_set in batch]
+        values = np.fromiter((value for shingle_set in batch for value in shingle_set),
+                             dtype=np.uint64, count=sum(lengths))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        # Overflow uint64 disengaja (mod 2^64); 32 bit atas dipakai sebagai hash
+        hashed = ((np.outer(self.a, values) + self.b[:, None]) >> np.uint64(32)).astype(np.uint32)
+        result[rows] = np.minimum.reduceat(hashed, offsets, axis=1).T
+
+def candidate_pairs(signatures, bands=BANDS):
+    """Pasangan (i, j) yang identik di minimal satu band LSH"""
+    pairs = set()
+    if not len(signatures):
+        return pairs
+    rows = signatures.shape[1] // bands
+    key_type = np.dtype((np.void, signatures.dtype.itemsize * rows))
+    for band in range(bands):
+        chunk = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        _, bucket, counts = np.unique(chunk.view(key_type).ravel(), return_inverse=True, return_counts=True)
+        bucket = bucket.ravel()
+        # Hanya bucket berisi lebih dari satu teks yang menghasilkan pasangan
+        shared = np.flatnonzero(counts[bucket] > 1)
+        if not len(shared):
+            continue
+        shared = shared[np.argsort(bucket[shared], kind='stable')]
+        splits = np.flatnonzero(np.diff(bucket[shared])) + 1
+        for members in np.split(shared, splits):
+            members = members.tolist()
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    pairs.add((members[x], members[y]))
+    return pairs
+
+def estimate_similarity(signatures, pairs):
+    """Estimasi Jaccard (porsi komponen signature yang sama) untuk array pasangan (n, 2)"""
+    estimates = np.empty(len(pairs))
+    for start in range(0, len(pairs), ESTIMATE_CHUNK):
+        chunk = pairs[start:start + ESTIMATE_CHUNK]
+        estimates[start:start + len(chunk)] = (signatures[chunk[:, 0]] == signatures[chunk[:, 1]]).mean(axis=1)
+    return estimates
+
+def cluster_pairs(count, pairs):
+    """Union-find: list cluster (list index terurut) dari pasangan yang mirip"""
+    parent = list(range(count))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    groups = {}
+    for i in sorted({i for pair in pairs for i in pair}):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+def collect_texts(data, field='responses'):
+    """List (author, tag, index, text) untuk field 'responses' atau 'input'"""
+    return [(author, intent['tag'], i, text)
+            for author, author_data in data.items()
+            for intent in author_data.get('intents', [])
+            for i, text in enumerate(intent.get(field, []))]
+
+def find_clusters(data, threshold=DEFAULT_THRESHOLD, field='responses'):
+    """Cluster teks yang hampir sama. Setiap cluster: {'similarity', 'members': [{author, tag, index, text}]}.
+
+    similarity = Jaccard terkecil di antara pasangan yang membentuk cluster.
+    """
+    items = collect_texts(data, field)
+    shingle_sets = [shingles(normalize(text)) for _, _, _, text in items]
+    signatures = MinHasher().signatures(shingle_sets)
+
+    pairs = np.array(sorted(candidate_pairs(signatures)), dtype=np.int64).reshape(-1, 2)
+    pairs = pairs[estimate_similarity(signatures, pairs) >= threshold - ESTIMATE_MARGIN]
+
+    similar = {}
+    for i, j in pairs.tolist():
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold:
+            similar[(i, j)] = similarity
+
+    groups = cluster_pairs(len(items), similar)
+    group_of = {i: g for g, members in enumerate(groups) for i in members}
+    lowest = [1.0] * len(groups)
+    for (i, _), value in similar.items():
+        lowest[group_of[i]] = min(lowest[group_of[i]], value)
+
+    clusters = []
+    for members, similarity in zip(groups, lowest):
+        clusters.append({
+            'similarity': round(similarity, 3),
+            'members': [{'author': items[i][0], 'tag': items[i][1], 'index': items[i][2], 'text': items[i][3]}
+                        for i in members],
+        })
+    return clusters
+
+def merge_duplicates(data, clusters, index=None, threshold=DEFAULT_THRESHOLD):
+    """Hapus duplikat: anggota pertama cluster dipertahankan, anggota lain dari author yang sama dihapus.
+
+    Cluster bisa berantai (A~B, B~C), jadi anggota hanya dihapus jika Jaccard-nya terhadap anggota
+    pertama >= threshold. Anggota dari author lain, anggota yang hanya mirip lewat anggota lain dan
+    anggota yang akan mengosongkan tag-nya hanya ditandai (flagged).
+    Perubahan lewat IntentIndex (listener seperti audit ikut diperbarui). Return (removed, flagged).
+    """
+    index = index or IntentIndex(data)
+    removed, flagged = [], []
+    removals = {}
+    for cluster in clusters:
+        keep = cluster['members'][0]
+        keep_shingles = shingles(normalize(keep['text']))
+        for member in cluster['members'][1:]:
+            if member['author'] != keep['author']:
+                flagged.append(dict(member, duplicate_of=keep))
+                continue
+            similarity = jaccard(keep_shingles, shingles(normalize(member['text'])))
+            if similarity >= threshold:
+                removals.setdefault((member['author'], member['tag']), []).append(member)
+            else:
+                flagged.append(dict(member, duplicate_of=keep, similarity=round(similarity, 3),
+                                    reason="hanya mirip lewat anggota lain cluster"))
+    for (author, tag_name), members in removals.items():
+        intent = index.get(author, tag_name)
+        if intent is None:
+            continue
+        if len(members) >= len(intent.get('responses', [])):
+            # Jangan sampai tag kehilangan semua response; sisakan yang pertama
+            flagged.append(dict(members[0], reason="tag akan kosong"))
+            members = members[1:]
+        # Hapus dari index terbesar supaya posisi yang belum dihapus tidak bergeser
+        for member in sorted(members, key=lambda m: m['index'], reverse=True):
+            index.remove_response(author, tag_name, member['index'])
+            removed.append(member)
+    return removed, flagged
+
+def dedupe(path, threshold=DEFAULT_THRESHOLD, merge=False, field='responses'):
+    """Cari (dan jika merge=True, hapus lalu simpan) duplikat di file data; return report"""
+    source = Dataset(path)
+    data = source.load()
+    clusters = find_clusters(data, threshold, field)
+    report = {'file': path, 'field': field, 'threshold': threshold, 'clusters': clusters,
+              'removed': [], 'flagged': []}
+    if merge and clusters:
+        if field != 'responses':
+            raise ValueError("--merge hanya untuk field responses")
+        report['removed'], report['flagged'] = merge_duplicates(data, clusters, source.intent_index(data), threshold)
+        if report['removed']:
+            source.save(data)
+    return report
+
+def print_report(report, stream=None):
+    stream = stream or sys.stdout
+    clusters = report['clusters']
+    print(f"🔁 {len(clusters)} cluster near-duplicate ({report['field']}, Jaccard >= {report['threshold']})",
+          file=stream)
+    for i, cluster in enumerate(clusters, 1):
+        print(f"\n{i}. similarity {cluster['similarity']}", file=stream)
+        for member in cluster['members']:
+            print(f"   - [{member['author']}] {member['tag']} #{member['index'] + 1}: {member['text'][:80]}",
+                  file=stream)
+    if report['removed'] or report['flagged']:
+        print(f"\n🗑️  Dihapus: {len(report['removed'])} | ⚠️  Ditandai: {len(report['flagged'])}", file=stream)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Deteksi near-duplicate response (MinHash/LSH)")
+    parser.add_argument("--data", default=DEFAULT_DATA_FILE, help="File data (default: env CHATBOT_DATA_FILE)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Jaccard shingle minimum untuk dianggap duplikat (0-1)")
+    parser.add_argument("--field", choices=('responses', 'input'), default='responses')
+    parser.add_argument("--merge", action="store_true",
+                        help="Hapus duplikat dalam author yang sama dan simpan file (sisanya ditandai)")
+    parser.add_argument("--output", help="Simpan report JSON ke file")
+    parser.add_argument("--json", action="store_true", help="Cetak report JSON ke stdout")
+    args = parser.parse_args(argv)
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold harus di antara 0 dan 1")
+    if args.merge and args.field != 'responses':
+        parser.error("--merge hanya untuk --field responses")
+
+    try:
+        report = dedupe(args.data, args.threshold, args.merge, args.field)
+    except FileNotFoundError:
+        print(f"❌ File tidak ditemukan: {args.data}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if report['clusters'] and not args.merge:
+        return EXIT_DUPLICATES
+    return EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+# Logging bersama untuk send_to_postman.py dan form-add-line.py.
+#
+# Level yang dipakai di loop besar (push/delete/audit):
+#   DEBUG   -> detail per item (URL, payload, status, preview) — hanya ke log file
+#   INFO    -> hasil per item (sukses)
+#   WARNING -> item gagal / fallback
+#   ERROR   -> kegagalan yang menghentikan operasi
+#
+# Mode console (env CHATBOT_LOG_MODE atau argumen CLI):
+#   normal  -> pesan INFO ke atas, format biasa
+#   verbose -> semua pesan termasuk DEBUG (perilaku lama: semua detail di console)
+#   quiet   -> hanya WARNING ke atas + satu baris progress yang diperbarui di tempat
+#   json    -> pesan INFO ke atas sebagai JSON lines
+# Log file (env CHATBOT_LOG_FILE) selalu berisi JSON lines level DEBUG.
+
+LOG_MODES = ('normal', 'verbose', 'quiet', 'json')
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+logger = logging.getLogger("chatbot")
+
+class JsonLinesFormatter(logging.Formatter):
+    """Satu objek JSON per baris: ts, level, logger, message + field tambahan"""
+
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class ProgressLine:
+    """Satu baris progress di stderr yang ditimpa di tempat (mode quiet)"""
+
+    _active = None
+    _lock = threading.Lock()
+
+    def __init__(self, total, label):
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.enabled = current_mode() == 'quiet'
+        self._last_draw = 0.0
+        if self.enabled:
+            with self._lock:
+                ProgressLine._active = self
+                self._draw()
+
+    def update(self, ok=True, count=1):
+        """Catat item yang selesai (count item sekaligus) dan perbarui baris progress"""
+        with self._lock:
+            self.done += count
+            if not ok:
+                self.failed += count
+            if self.enabled:
+                now = time.perf_counter()
+                # Batasi redraw ~10x per detik supaya I/O console tidak jadi bottleneck
+                if now - self._last_draw >= 0.1 or self.done >= self.total:
+                    self._draw()
+        if not self.enabled:
+            logger.debug(f"Progress {self.label}: {self.done}/{self.total}",
+                         extra={'fields': {'event': 'progress', 'done': self.done, 'total': self.total}})
+
+    def finish(self):
+        """Tutup baris progress (pindah ke baris baru)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._draw()
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+            ProgressLine._active = None
+
+    def _draw(self):
+        elapsed = time.perf_counter() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        sys.stderr.write(f"\r\x1b[K⏳ {self.label}: {self.done}/{self.total} | ❌ {self.failed} | {rate:.1f} item/s")
+        sys.stderr.flush()
+        self._last_draw = time.perf_counter()
+
+    @classmethod
+    def clear(cls):
+        """Hapus baris progress sementara sebelum pesan log lain ditulis"""
+        if cls._active is not None:
+            sys.stderr.write("\r\x1b[K")
+
+    @classmethod
+    def redraw(cls):
+        if cls._active is not None:
+            cls._active._draw()
+
+class ConsoleHandler(logging.StreamHandler):
+    """Tulis ke sys.stdout yang berlaku saat ini (ikut contextlib.redirect_stdout)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+    def emit(self, record):
+        with ProgressLine._lock:
+            ProgressLine.clear()
+            super().emit(record)
+            self.flush()
+            ProgressLine.redraw()
+
+_state = {'mode': 'normal', 'log_file': None}
+
+def current_mode():
+    return _state['mode']
+
+def setup_logging(mode=None, log_file=None):
+    """Pasang handler console (sesuai mode) dan log file JSON lines. Aman dipanggil ulang"""
+    mode = mode or os.environ.get("CHATBOT_LOG_MODE", "normal")
+    if mode not in LOG_MODES:
+        raise ValueError(f"Mode log tidak dikenal: {mode} (pilih {', '.join(LOG_MODES)})")
+    log_file = log_file or os.environ.get("CHATBOT_LOG_FILE")
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    console = ConsoleHandler()
+    if mode == 'json':
+        console.setFormatter(JsonLinesFormatter())
+    else:
+        console.setFormatter(logging.Formatter("%(message)s"))
+    console.setLevel({'verbose': logging.DEBUG, 'quiet': logging.WARNING}.get(mode, logging.INFO))
+    logger.addHandler(console)
+
+    if log_file:
+        try:
+            file_handler = RotatingFileHandler(log_file, maxBytes=LOG_FILE_MAX_BYTES,
+                                               backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"⚠️  Log file {log_file} tidak bisa dibuka: {e}")
+            log_file = None
+        else:
+            file_handler.setFormatter(JsonLinesFormatter())
+            file_handler.setLevel(logging.DEBUG)
+            logger.addHandler(file_handler)
+
+    _state['mode'] = mode
+    _state['log_file'] = log_file
+    return logger
+
+def get_logger(name):
+    """Logger anak dari 'chatbot' (misalnya get_logger('push'))"""
+    return logger.getChild(name)
+
+def log_file_path():
+    return _state['log_file']
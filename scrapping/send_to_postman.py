@@ -1,103 +1,1129 @@
+import argparse
+import contextlib
+import copy
+import gzip
+import hashlib
 import json
+import os
+import random
+import sys
+from email.utils import parsedate_to_datetime
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+import api_metrics
+import near_duplicates
+import run_log
+from dataset import Dataset
+
+try:
+    import ijson  # optional: parsing JSON incremental untuk listing tag besar
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: encode/decode JSON lebih cepat untuk payload besar
+except ImportError:
+    orjson = None
+
+# Endpoint API (bisa di-override untuk server lokal)
+API_URL = os.environ.get("CHATBOT_API_URL", "https://capstone-five-dusky.vercel.app/chatbot/tags")
+
+# Default untuk push paralel
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REQUESTS_PER_SECOND = 4.0
+
+# Batas adaptive rate limiter untuk request tulis (POST/PUT/DELETE)
+MIN_REQUESTS_PER_SECOND = 0.2
+MAX_REQUESTS_PER_SECOND = 20.0
+WRITE_METHODS = ('POST', 'PUT', 'DELETE')
+MAX_THROTTLE_RETRIES = 3
+
+# Retry dengan exponential backoff + full jitter. POST (create) tidak idempotent:
+# hanya di-retry jika request pasti belum diproses server (gagal connect, 429, 503).
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+RETRY_STATUSES = (502, 503, 504)
+NOT_PROCESSED_STATUSES = (503,)
+DEFAULT_RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Circuit breaker: setelah N kegagalan beruntun (error koneksi/5xx) request berikutnya
+# ditolak tanpa menyentuh jaringan ('halt') atau menunggu server pulih ('pause')
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30.0
+BREAKER_MODES = ('halt', 'pause')
+
+# Ukuran halaman saat fetch tag dari API (server yang tidak mendukung pagination tetap 1 request)
+DEFAULT_PAGE_SIZE = 100
+# Batas keras jumlah halaman listing (pengaman jika server tidak pernah melaporkan halaman terakhir)
+MAX_LISTING_PAGES = 1000
+
+# Cache listing tag: umur maksimum (detik) sebelum revalidasi ETag/If-None-Match.
+# Set env CHATBOT_TAG_CACHE_FILE untuk menyimpan cache ke disk antar sesi.
+TAG_CACHE_TTL = 120
+TAG_CACHE_FILE = os.environ.get("CHATBOT_TAG_CACHE_FILE")
+
+# Bulk mode: batas ukuran chunk & status yang berarti server menolak bentuk batch
+DEFAULT_BULK_MAX_BYTES = 512 * 1024
+DEFAULT_BULK_MAX_ITEMS = 50
+BULK_UNSUPPORTED_STATUSES = (404, 405, 501)
+BULK_REJECTED_STATUSES = (400, 413, 422)
+
+# Default untuk HTTP client
+DEFAULT_TIMEOUT = 15
+DEFAULT_POOL_SIZE = 16
+
+# Kompresi gzip body request (opsional, env CHATBOT_GZIP=1 atau --gzip); body kecil tidak dikompres.
+# Server yang menjawab 415 dianggap tidak menerima gzip dan request dikirim ulang tanpa kompresi.
+COMPRESS_REQUESTS = os.environ.get("CHATBOT_GZIP", "").lower() in ("1", "true", "yes")
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 6
+COMPRESS_UNSUPPORTED_STATUSES = (415,)
+
+# File data & manifest push terakhir
+DATA_FILE = os.environ.get("CHATBOT_DATA_FILE", r"c:\PythonVSCenv\Capstone\scrapping\output\content_by_author_and_tags.json")
+MANIFEST_FILE = os.path.join(os.path.dirname(DATA_FILE), "push_manifest.json")
+JOURNAL_FILE = os.path.join(os.path.dirname(DATA_FILE), "push_journal.jsonl")
+DELETE_REPORT_FILE = os.path.join(os.path.dirname(DATA_FILE), "delete_report.json")
+METRICS_FILE = os.path.join(os.path.dirname(DATA_FILE), "api_metrics.json")
+LOG_FILE = os.environ.get("CHATBOT_LOG_FILE", os.path.join(os.path.dirname(DATA_FILE), "chatbot.log"))
+ENDPOINT_CACHE_FILE = os.path.join(os.path.dirname(DATA_FILE), "endpoint_cache.json")
+
+# Endpoint delete/update yang berhasil disimpan selama TTL ini (detik)
+ENDPOINT_CACHE_TTL = 24 * 3600
+# Status yang berarti endpoint/method salah (bukan error server)
+ENDPOINT_MISS_STATUSES = (404, 405, 501)
+# Strategy yang tidak pernah di-cache: POST ke base URL juga endpoint create, jadi 200/201 darinya
+# tidak membuktikan bahwa update/delete benar-benar terjadi
+UNCACHEABLE_STRATEGIES = ('base',)
+
+# Detail per item (push/delete/update) lewat logger; lihat run_log untuk level & mode
+log = run_log.get_logger("api")
+
+def encode_json(obj):
+    """JSON compact (UTF-8 bytes), pakai orjson jika terinstall"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def decode_json(raw):
+    """Parse JSON dari bytes/str, pakai orjson jika terinstall"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# File data di-parse sekali dan di-cache selama mtime/size tidak berubah (lihat dataset.py)
+dataset = Dataset(DATA_FILE)
 
 # Load data from JSON file
 def load_data():
-    with open(r"c:\PythonVSCenv\Capstone\scrapping\output\content_by_author_and_tags.json", 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return dataset.load()
 
-def send_tag_to_api(tag_data, author_name):
-    """Send single tag data to API"""
-    url = "https://capstone-five-dusky.vercel.app/chatbot/tags"
-    
-    # Transform data sesuai struktur API
-    payload = {
+class AdaptiveRateLimiter:
+    """Token bucket bersama untuk semua request tulis.
+
+    Rate naik perlahan selama response sehat, turun setengah saat 429/5xx,
+    dan semua worker berhenti sementara jika server mengirim Retry-After.
+    """
+
+    def __init__(self, rate=DEFAULT_REQUESTS_PER_SECOND, min_rate=MIN_REQUESTS_PER_SECOND,
+                 max_rate=MAX_REQUESTS_PER_SECOND, burst=2, increase_step=0.5, decrease_factor=0.5):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.capacity = float(burst)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.throttled_count = 0
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate):
+        """Set rate awal (req/detik)"""
+        with self._lock:
+            self.rate = min(max(rate, self.min_rate), self.max_rate)
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Tunggu sampai ada token (dan tidak sedang pause karena Retry-After)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def observe(self, status_code, retry_after=None):
+        """Sesuaikan rate berdasarkan hasil request"""
+        with self._lock:
+            if status_code is None or status_code == 429 or status_code >= 500:
+                self.throttled_count += 1
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+                    self._tokens = 0.0
+            elif status_code < 400:
+                self.rate = min(self.max_rate, self.rate + self.increase_step / max(self.rate, 1.0))
+
+    def print_status(self):
+        """Tampilkan status limiter"""
+        print(f"🚦 Rate limiter: {self.rate:.2f} req/s saat ini | throttled {self.throttled_count}x")
+
+def parse_retry_after(value):
+    """Parse header Retry-After (detik atau HTTP-date) menjadi detik"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RetryPolicy:
+    """Kapan dan berapa lama menunggu sebelum mengulang request yang gagal"""
+
+    def __init__(self, max_attempts=DEFAULT_RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY,
+                 max_delay=RETRY_MAX_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt):
+        """Full jitter: acak antara 0 dan base * 2^attempt (dibatasi max_delay)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def should_retry_error(self, error, idempotent, attempt):
+        if attempt >= self.max_attempts:
+            return False
+        if idempotent:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        # Non-idempotent: hanya jika koneksi tidak pernah terbentuk
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def should_retry_status(self, status_code, idempotent, attempt):
+        if attempt >= self.max_attempts or status_code not in RETRY_STATUSES:
+            return False
+        return idempotent or status_code in NOT_PROCESSED_STATUSES
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Request ditolak karena circuit breaker sedang terbuka"""
+
+class CircuitBreaker:
+    """closed -> open setelah failure_threshold kegagalan beruntun -> half-open setelah reset_timeout.
+
+    Saat half-open hanya satu request percobaan yang dikirim; sukses menutup circuit,
+    gagal membukanya lagi. mode='halt' menolak request selama open (CircuitOpenError),
+    mode='pause' membuat worker menunggu sampai percobaan berikutnya.
+    """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT,
+                 mode='halt'):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.mode = mode
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Panggil sebelum request; raise CircuitOpenError atau tunggu jika circuit terbuka"""
+        while True:
+            with self._lock:
+                if self.failure_threshold <= 0 or self.state == 'closed':
+                    return
+                now = time.monotonic()
+                if self.state == 'open' and now - self._opened_at >= self.reset_timeout:
+                    self.state = 'half_open'
+                if self.state == 'half_open' and not self._probe_in_flight:
+                    self._probe_in_flight = True
+                    return
+                if self.mode == 'halt':
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        f"circuit breaker open ({self.consecutive_failures} kegagalan beruntun)")
+                wait = max(0.2, self._opened_at + self.reset_timeout - now) if self.state == 'open' else 0.2
+            time.sleep(min(wait, 1.0))
+
+    def record_success(self):
+        with self._lock:
+            if self.state != 'closed':
+                log.warning("✅ Circuit breaker tertutup lagi, server merespons normal",
+                            extra={'fields': {'event': 'breaker_closed'}})
+            self.state = 'closed'
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.failure_threshold <= 0:
+                return
+            if self.state == 'half_open' or (self.state == 'closed'
+                                             and self.consecutive_failures >= self.failure_threshold):
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self.open_count += 1
+                action = "request ditolak" if self.mode == 'halt' else "push dijeda"
+                log.warning(f"⛔ Circuit breaker terbuka setelah {self.consecutive_failures} kegagalan beruntun; "
+                            f"{action} selama {self.reset_timeout:.0f} detik",
+                            extra={'fields': {'event': 'breaker_open', 'failures': self.consecutive_failures,
+                                              'mode': self.mode}})
+
+    def print_status(self):
+        if self.open_count or self.rejected:
+            print(f"⛔ Circuit breaker: {self.state} | terbuka {self.open_count}x | "
+                  f"{self.rejected} request ditolak tanpa network")
+            if self.rejected:
+                print("   ↪️  Jalankan Resume Last Push (menu 12 / `resume`) setelah server pulih")
+
+class ApiClient:
+    """HTTP client bersama: satu Session keep-alive dengan connection pool"""
+
+    def __init__(self, base_url=API_URL, timeout=DEFAULT_TIMEOUT, pool_size=DEFAULT_POOL_SIZE,
+                 rate_limiter=None, retry_policy=None, breaker=None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        })
+        self.compress_requests = COMPRESS_REQUESTS
+        self.session.hooks['response'].append(self._mark_connection_reuse)
+        self._lock = threading.Lock()
+        self.request_log = []
+        # Dipanggil setelah setiap request tulis yang sukses (misalnya invalidasi cache)
+        self.write_listeners = []
+
+    @staticmethod
+    def _mark_connection_reuse(response, *args, **kwargs):
+        """Tandai apakah response memakai koneksi keep-alive yang sudah ada"""
+        connection = getattr(response.raw, 'connection', None)
+        if connection is None:
+            response.connection_reused = None
+            return response
+        served = getattr(connection, '_chatbot_requests_served', 0)
+        response.connection_reused = served > 0
+        connection._chatbot_requests_served = served + 1
+        return response
+
+    def url(self, *parts):
+        """Gabungkan base URL dengan path tambahan"""
+        return '/'.join([self.base_url] + [str(part).strip('/') for part in parts])
+
+    def request(self, method, url=None, timeout=None, idempotent=None, **kwargs):
+        """Kirim request lewat circuit breaker & retry policy.
+
+        Request tulis juga lewat rate limiter dan mematuhi Retry-After. idempotent=None
+        berarti ditentukan dari method (POST dianggap tidak idempotent).
+        """
+        url = url or self.base_url
+        is_write = method in WRITE_METHODS
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if 'json' in kwargs:
+            # Encode sekali untuk semua attempt (bukan setiap retry)
+            raw_body = encode_json(kwargs.pop('json'))
+            encoded = self._encode_body(raw_body)
+            if 'headers' in encoded:
+                encoded['headers'] = dict(kwargs.get('headers') or {}, **encoded['headers'])
+            kwargs.update(encoded)
+        
+        attempt = 0
+        throttled = 0
+        while True:
+            self.breaker.before_request()
+            if is_write:
+                self.rate_limiter.acquire()
+            try:
+                response = self._send(method, url, timeout, attempt=attempt, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.breaker.record_failure()
+                if is_write:
+                    self.rate_limiter.observe(None)
+                if not self.retry_policy.should_retry_error(e, idempotent, attempt):
+                    raise
+                self._wait_before_retry(method, url, attempt, str(e))
+                attempt += 1
+                continue
+            
+            status = response.status_code
+            if status in COMPRESS_UNSUPPORTED_STATUSES and kwargs.get('raw_size') is not None:
+                # Server tidak menerima body gzip: matikan kompresi dan kirim ulang apa adanya
+                log.warning(f"⚠️  Server menolak body gzip ({status}), kompresi request dimatikan",
+                            extra={'fields': {'event': 'gzip_unsupported', 'url': url}})
+                self.compress_requests = False
+                kwargs.pop('raw_size')
+                kwargs['data'] = gzip.decompress(kwargs['data'])
+                kwargs['headers'] = {name: value for name, value in kwargs['headers'].items()
+                                     if name != 'Content-Encoding'} or None
+                response.close()
+                continue
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if status >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            if is_write:
+                self.rate_limiter.observe(status, retry_after)
+                if status < 400:
+                    for listener in self.write_listeners:
+                        listener()
+            
+            if status == 429 and throttled < MAX_THROTTLE_RETRIES:
+                # Request tulis: rate limiter sudah pause sesuai Retry-After
+                log.info(f"    ⏳ 429 Too Many Requests, retry setelah {retry_after or 0:.1f} detik...",
+                         extra={'fields': {'event': 'throttled', 'url': url, 'retry_after': retry_after}})
+                if not is_write:
+                    time.sleep(retry_after if retry_after is not None else self.retry_policy.backoff(throttled))
+                throttled += 1
+                attempt += 1
+                response.close()
+                continue
+            if self.retry_policy.should_retry_status(status, idempotent, attempt):
+                response.close()
+                self._wait_before_retry(method, url, attempt, f"HTTP {status}", retry_after)
+                attempt += 1
+                continue
+            return response
+
+    def _encode_body(self, raw_body):
+        """kwargs request untuk body JSON; gzip jika aktif dan body cukup besar"""
+        if not self.compress_requests or len(raw_body) < COMPRESS_MIN_BYTES:
+            return {'data': raw_body}
+        return {
+            'data': gzip.compress(raw_body, compresslevel=COMPRESS_LEVEL),
+            'headers': {'Content-Encoding': 'gzip'},
+            'raw_size': len(raw_body)
+        }
+
+    def _wait_before_retry(self, method, url, attempt, reason, retry_after=None):
+        delay = max(self.retry_policy.backoff(attempt), retry_after or 0)
+        log.info(f"    🔁 {method} {url} gagal ({reason}), retry ke-{attempt + 1} dalam {delay:.2f} detik",
+                 extra={'fields': {'event': 'retry', 'method': method, 'url': url,
+                                   'attempt': attempt + 1, 'delay': delay, 'reason': reason}})
+        time.sleep(delay)
+
+    def _send(self, method, url, timeout=None, attempt=0, raw_size=None, **kwargs):
+        """Kirim request lewat session bersama dan catat metriknya (lihat api_metrics).
+
+        raw_size = ukuran body sebelum gzip; bytes_* = ukuran di wire, bytes_*_raw = sebelum/sesudah kompresi.
+        """
+        started = time.perf_counter()
+        entry = {
+            'method': method, 'url': url, 'status': None, 'reused': None, 'attempt': attempt,
+            'started': time.time(), 'latency': None, 'ttfb': None,
+            'bytes_sent': 0, 'bytes_sent_raw': 0, 'bytes_received': None, 'bytes_received_raw': None
+        }
+        try:
+            response = self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+            entry['status'] = response.status_code
+            entry['reused'] = getattr(response, 'connection_reused', None)
+            # Untuk response streaming, ukuran body dilengkapi setelah dibaca (record_stream_size)
+            response.metrics_entry = entry
+            # elapsed = kirim request sampai header response selesai di-parse
+            entry['ttfb'] = response.elapsed.total_seconds()
+            body = response.request.body
+            entry['bytes_sent'] = len(body) if body else 0
+            entry['bytes_sent_raw'] = raw_size if raw_size is not None else entry['bytes_sent']
+            if kwargs.get('stream'):
+                # Body streaming belum dibaca; pakai Content-Length (ukuran di wire) jika ada
+                length = response.headers.get('Content-Length')
+                entry['bytes_received'] = int(length) if length and length.isdigit() else None
+            else:
+                entry['bytes_received_raw'] = len(response.content)
+                wire = response.raw.tell() if hasattr(response.raw, 'tell') else None
+                entry['bytes_received'] = wire or entry['bytes_received_raw']
+            return response
+        except Exception as e:
+            entry['error'] = str(e)
+            raise
+        finally:
+            entry['latency'] = time.perf_counter() - started
+            with self._lock:
+                self.request_log.append(entry)
+
+    def record_stream_size(self, response, decoded_bytes):
+        """Lengkapi metrik response streaming setelah body selesai dibaca"""
+        entry = getattr(response, 'metrics_entry', None)
+        if entry is None:
+            return
+        with self._lock:
+            entry['bytes_received_raw'] = decoded_bytes
+            if hasattr(response.raw, 'tell'):
+                entry['bytes_received'] = response.raw.tell()
+
+    def get(self, url=None, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url=None, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url=None, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url=None, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def stats(self):
+        """Ringkasan reuse koneksi, latency, throughput dan error rate semua request"""
+        with self._lock:
+            log = list(self.request_log)
+        stats = api_metrics.summarize(log)
+        stats['reused_connections'] = sum(1 for entry in log if entry['reused'])
+        stats['new_connections'] = sum(1 for entry in log if entry['reused'] is False)
+        return stats
+
+    def export_metrics(self, path, fmt=None):
+        """Export metrik per-request ke JSON/CSV/Prometheus text. Return format yang dipakai"""
+        with self._lock:
+            log = list(self.request_log)
+        return api_metrics.export(log, path, fmt)
+
+    def print_stats(self):
+        """Tampilkan statistik koneksi HTTP, latency percentile dan throughput"""
+        stats = self.stats()
+        if not stats['requests']:
+            return
+        reuse_rate = stats['reused_connections'] / stats['requests'] * 100
+        print(f"🔌 HTTP session: {stats['requests']} requests | "
+              f"{stats['new_connections']} koneksi baru | "
+              f"{stats['reused_connections']} reused ({reuse_rate:.1f}%)")
+        print(f"⏱️  Latency: p50 {stats['latency_p50']*1000:.0f} ms | p95 {stats['latency_p95']*1000:.0f} ms | "
+              f"p99 {stats['latency_p99']*1000:.0f} ms | max {stats['latency_max']*1000:.0f} ms")
+        print(f"📈 Throughput: {stats['requests_per_second']:.1f} req/s | "
+              f"error rate {stats['error_rate']*100:.1f}% | retries {stats['retries']} | "
+              f"{stats['bytes_sent']/1024:.1f} KB dikirim")
+        if stats['bytes_saved']:
+            print(f"📦 Kompresi: {(stats['bytes_sent_raw'] + stats['bytes_received_raw'])/1024:.1f} KB -> "
+                  f"{(stats['bytes_sent'] + stats['bytes_received'])/1024:.1f} KB di wire "
+                  f"(hemat {stats['bytes_saved']/1024:.1f} KB)")
+        self.rate_limiter.print_status()
+        self.breaker.print_status()
+
+# Client bersama untuk semua operasi API
+api_client = ApiClient()
+
+class PushManifest:
+    """Cache di disk: (author, tag) -> content hash & server id dari push sukses terakhir.
+
+    Karena key-nya content hash, edit dari form-add-line.py otomatis membuat
+    entry tidak cocok lagi. Manifest juga diabaikan jika target API berbeda.
+    """
+
+    def __init__(self, path=MANIFEST_FILE, api_url=None):
+        self.path = path
+        self.api_url = api_url or api_client.base_url
+        self.entries = {}
+        self._changed = set()
+        self._removed = set()
+        self._lock = threading.Lock()
+        self.entries = self.read_entries()
+
+    def read_entries(self):
+        """Baca manifest dari disk (manifest rusak/beda target = kosong)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if raw.get('api_url') != self.api_url:
+            return {}
+        return {(entry['author'], entry['tag']): entry for entry in raw.get('entries', [])}
+
+    def save(self):
+        """Tulis manifest secara atomic (temp file + rename) jika ada perubahan.
+
+        Perubahan digabung dengan isi file terbaru, sehingga beberapa proses
+        (misalnya shard CLI yang berjalan paralel) tidak saling menimpa.
+        """
+        with self._lock:
+            if not self._changed and not self._removed:
+                return
+            merged = self.read_entries()
+            for key in self._changed:
+                if key in self.entries:
+                    merged[key] = self.entries[key]
+            for key in self._removed:
+                merged.pop(key, None)
+            self._changed = set()
+            self._removed = set()
+            self.entries = merged
+            payload = {'api_url': self.api_url, 'entries': list(merged.values())}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Gagal menyimpan manifest: {e}")
+
+    def is_current(self, author, intent):
+        """True jika intent identik dengan yang terakhir sukses di-push"""
+        entry = self.entries.get((author, intent['tag']))
+        return entry is not None and entry['hash'] == intent_hash(intent, author)
+
+    def get_id(self, author, tag_name):
+        entry = self.entries.get((author, tag_name))
+        return entry.get('id') if entry else None
+
+    def record(self, author, tag_data, server_id=None):
+        """Catat push/update sukses"""
+        with self._lock:
+            previous = self.entries.get((author, tag_data['tag']), {})
+            self.entries[(author, tag_data['tag'])] = {
+                'author': author,
+                'tag': tag_data['tag'],
+                'hash': intent_hash(tag_data, author),
+                'id': server_id or previous.get('id'),
+                'pushed_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
+            self._changed.add((author, tag_data['tag']))
+            self._removed.discard((author, tag_data['tag']))
+
+    def forget(self, author, tag_name):
+        """Hapus entry (misalnya setelah tag dihapus dari API)"""
+        with self._lock:
+            self.entries.pop((author, tag_name), None)
+            self._changed.discard((author, tag_name))
+            self._removed.add((author, tag_name))
+
+def extract_server_id(response_data):
+    """Ambil id tag dari berbagai bentuk response API"""
+    if not isinstance(response_data, dict):
+        return None
+    if isinstance(response_data.get('data'), dict):
+        return response_data['data'].get('id') or response_data['data'].get('_id')
+    return response_data.get('id') or response_data.get('_id')
+
+def build_payload(tag_data, author_name):
+    """Transform intent lokal menjadi payload sesuai struktur API"""
+    return {
         "tag": tag_data["tag"],
         "nama": author_name,
         "input": tag_data["input"],
         "responses": tag_data["responses"]
     }
+
+def intent_hash(tag_data, author_name):
+    """Content hash stabil dari payload (urutan key tidak berpengaruh)"""
+    payload = build_payload({
+        "tag": tag_data.get("tag"),
+        "input": tag_data.get("input", []),
+        "responses": tag_data.get("responses", [])
+    }, author_name)
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+# Manifest push terakhir (dipakai untuk skip intent yang tidak berubah)
+push_manifest = PushManifest()
+
+def send_tag_to_api(tag_data, author_name):
+    """Send single tag data to API"""
+    url = api_client.base_url
     
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    # Transform data sesuai struktur API
+    payload = build_payload(tag_data, author_name)
     
+    fields = {'event': 'push', 'author': author_name, 'tag': tag_data['tag']}
     try:
-        print(f"🔄 Sending [{author_name}] Tag: {tag_data['tag']}")
-        print(f"   URL: {url}")
-        print(f"   Payload preview: tag='{tag_data['tag']}', nama='{author_name}', inputs={len(tag_data['input'])}, responses={len(tag_data['responses'])}")
-        
-        response = requests.post(url, json=payload, headers=headers, timeout=15)
+        log.debug(f"🔄 Sending [{author_name}] Tag: {tag_data['tag']} -> {url} "
+                  f"(inputs={len(tag_data['input'])}, responses={len(tag_data['responses'])})",
+                  extra={'fields': dict(fields, url=url, inputs=len(tag_data['input']),
+                                        responses=len(tag_data['responses']))})
         
-        print(f"   Response Status: {response.status_code}")
+        response = api_client.post(url, json=payload, timeout=15)
         
         if response.status_code in [200, 201]:
-            print(f"   ✅ SUCCESS! [{author_name}] Tag: {tag_data['tag']}")
+            response_data = None
             try:
-                response_data = response.json()
-                if 'message' in response_data:
-                    print(f"   📝 Message: {response_data['message']}")
-            except:
+                response_data = decode_json(response.content)
+            except ValueError:
                 pass
+            message = response_data.get('message') if isinstance(response_data, dict) else None
+            log.info(f"   ✅ SUCCESS! [{author_name}] Tag: {tag_data['tag']}",
+                     extra={'fields': dict(fields, ok=True, status=response.status_code, message=message)})
+            push_manifest.record(author_name, tag_data, extract_server_id(response_data))
             return True
         else:
-            print(f"   ❌ FAILED! Status: {response.status_code}")
-            print(f"   Response: {response.text[:200]}...")
+            log.warning(f"   ❌ FAILED! [{author_name}] Tag: {tag_data['tag']} | Status: {response.status_code} | "
+                        f"{response.text[:200]}",
+                        extra={'fields': dict(fields, ok=False, status=response.status_code,
+                                              response=response.text[:200])})
             return False
             
+    except CircuitOpenError as e:
+        log.debug(f"   ⛔ SKIPPED [{author_name}] Tag: {tag_data['tag']}: {e}",
+                  extra={'fields': dict(fields, ok=False, error=str(e))})
+        return False
     except Exception as e:
-        print(f"   ❌ ERROR: {e}")
+        log.warning(f"   ❌ ERROR [{author_name}] Tag: {tag_data['tag']}: {e}",
+                    extra={'fields': dict(fields, ok=False, error=str(e))})
         return False
 
-def get_all_tags_from_api():
-    """Get all tags from API to see what's available"""
-    url = "https://capstone-five-dusky.vercel.app/chatbot/tags"
-    
-    try:
-        print("📋 Fetching all tags from API...")
-        response = requests.get(url, timeout=10)
+def normalize_tag_listing(data):
+    """Handle different response structures. Return (tags, metadata)"""
+    if isinstance(data, list):
+        return data, {}
+    if isinstance(data, dict) and 'data' in data:
+        metadata = {}
+        for key, value in data.items():
+            if key == 'data':
+                continue
+            if isinstance(value, dict):
+                # Samakan dengan prefix ijson, misalnya "pagination.next_cursor"
+                for sub_key, sub_value in value.items():
+                    metadata[f"{key}.{sub_key}"] = sub_value
+            else:
+                metadata[key] = value
+        return data['data'], metadata
+    return [data], {}
+
+class CountingReader:
+    """Bungkus file-like dan hitung byte yang sudah dibaca (setelah dekompresi)"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def read(self, size=-1):
+        chunk = self.raw.read(size)
+        self.count += len(chunk)
+        return chunk
+
+def stream_tag_listing(raw, metadata):
+    """Parse listing secara incremental dengan ijson: yield tag satu per satu.
+
+    Field selain list tag (pagination, next_cursor, dst.) dikumpulkan ke metadata.
+    """
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(raw):
+        if builder is None:
+            if prefix in ('item', 'data.item'):
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                else:
+                    yield value
+                    continue
+            else:
+                if event not in ('start_map', 'end_map', 'start_array', 'end_array', 'map_key') \
+                        and not prefix.startswith('data'):
+                    metadata[prefix] = value
+                continue
         
-        if response.status_code == 200:
-            data = response.json()
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+            if depth == 0:
+                yield builder.value
+                builder = None
+
+def next_page_params(metadata, page, fetched=0, page_count=0, page_size=None):
+    """Tentukan parameter halaman berikutnya dari metadata pagination (None = selesai).
+
+    fetched = jumlah tag sejauh ini, page_count = jumlah tag di halaman terakhir. Server yang hanya
+    melaporkan total dilanjutkan selama fetched < total; tanpa metadata sama sekali, halaman penuh
+    (page_count == page_size) berarti mungkin masih ada halaman berikutnya.
+    """
+    def meta(*keys):
+        for key in keys:
+            for prefix in ('', 'pagination.', 'meta.'):
+                value = metadata.get(prefix + key)
+                if value is not None:
+                    return value
+        return None
+    
+    cursor = meta('next_cursor', 'nextCursor', 'cursor_next')
+    if cursor:
+        return {'cursor': cursor}
+    if meta('has_more', 'hasMore', 'has_next', 'hasNext'):
+        return {'page': page + 1}
+    total_pages = meta('total_pages', 'totalPages')
+    if total_pages is not None:
+        return {'page': page + 1} if page < int(total_pages) else None
+    total = meta('total', 'totalCount', 'total_count', 'totalItems')
+    if total is not None:
+        return {'page': page + 1} if page_count and fetched < int(total) else None
+    if page_size and page_count >= page_size:
+        return {'page': page + 1}
+    return None
+
+def listing_key(tag):
+    """Identitas tag di listing: id/_id (seperti extract_server_id), atau (nama, tag) jika tanpa id"""
+    tag_id = extract_server_id(tag)
+    if tag_id is not None:
+        return 'id', tag_id
+    if isinstance(tag, dict):
+        return 'name', tag.get('nama'), tag.get('tag')
+    return 'value', repr(tag)
+
+def iter_tags_from_api(page_size=DEFAULT_PAGE_SIZE, etag=None, result=None):
+    """Yield tag dari API halaman demi halaman (cursor/page), parsing incremental jika ijson ada.
+
+    Server yang mengabaikan parameter pagination cukup di-fetch sekali: halaman yang tidak berisi
+    tag baru (listing_key sudah pernah di-yield) atau isinya sama dengan halaman sebelumnya
+    mengakhiri paging. Lebih dari MAX_LISTING_PAGES halaman dianggap error (listing tidak lengkap).
+    Jika etag diberikan, halaman pertama dikirim dengan If-None-Match; hasil 304
+    ditandai lewat result['not_modified'] dan tidak ada tag yang di-yield.
+    """
+    url = api_client.base_url
+    params = {'limit': page_size, 'page': 1}
+    page = 1
+    fetched = 0
+    seen_keys = set()
+    previous_page = None
+    if result is None:
+        result = {}
+    
+    while params is not None:
+        metadata = {}
+        page_count = new_count = 0
+        page_keys = []
+        headers = {'If-None-Match': etag} if etag and page == 1 else None
+        response = api_client.get(url, params=params, headers=headers, timeout=10, stream=ijson is not None)
+        try:
+            if page == 1:
+                result['etag'] = response.headers.get('ETag')
+                if response.status_code == 304:
+                    result['not_modified'] = True
+                    return
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
             
-            # Handle different response structures
-            if 'data' in data:
-                tags = data['data']
-            elif isinstance(data, list):
-                tags = data
+            if ijson is not None:
+                response.raw.decode_content = True
+                reader = CountingReader(response.raw)
+                tags = stream_tag_listing(reader, metadata)
             else:
-                tags = [data]
-            
-            print(f"✅ Found {len(tags)} tags in API")
-            return tags
-        else:
-            print(f"❌ Failed to fetch tags: {response.status_code}")
-            print(f"Response: {response.text[:200]}")
-            return []
-            
+                tags, metadata = normalize_tag_listing(decode_json(response.content))
+            for tag in tags:
+                page_count += 1
+                key = listing_key(tag)
+                page_keys.append(key)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                new_count += 1
+                yield tag
+            if ijson is not None:
+                api_client.record_stream_size(response, reader.count)
+        finally:
+            response.close()
+        
+        fetched += new_count
+        next_params = next_page_params(metadata, page, fetched, page_count, page_size)
+        if next_params is None or (page > 1 and not new_count) or page_keys == previous_page:
+            break
+        if page >= MAX_LISTING_PAGES:
+            raise RuntimeError(f"Listing masih berlanjut setelah {MAX_LISTING_PAGES} halaman, paging dihentikan")
+        previous_page = page_keys
+        page += 1
+        params = dict(next_params, limit=page_size)
+
+class TagListingCache:
+    """Cache listing tag API (TTL + revalidasi ETag), dipakai bersama oleh semua menu.
+
+    Otomatis di-invalidate setelah create/update/delete yang sukses. ETag dari
+    halaman pertama dianggap mewakili seluruh koleksi.
+    """
+
+    def __init__(self, ttl=TAG_CACHE_TTL, path=TAG_CACHE_FILE):
+        self.ttl = ttl
+        self.path = path
+        self.tags = None
+        self.etag = None
+        self.fetched_at = 0.0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if raw.get('api_url') == api_client.base_url:
+            self.tags = raw.get('tags')
+            self.etag = raw.get('etag')
+            self.fetched_at = raw.get('fetched_at', 0.0)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            payload = {'api_url': api_client.base_url, 'tags': self.tags,
+                       'etag': self.etag, 'fetched_at': self.fetched_at}
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Gagal menyimpan cache listing: {e}")
+
+    def invalidate(self):
+        """Buang listing (dipanggil setelah request tulis yang sukses)"""
+        with self._lock:
+            if self.tags is None:
+                return
+            self.tags = None
+            self.etag = None
+            self.fetched_at = 0.0
+        if self.path:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def iter_tags(self, page_size=DEFAULT_PAGE_SIZE, max_age=None):
+        """Yield tag dari cache jika masih segar, revalidasi dengan ETag, atau fetch ulang"""
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            cached = self.tags
+            etag = self.etag
+            age = time.time() - self.fetched_at
+        
+        if cached is not None and age < max_age:
+            print(f"⚡ Memakai cache listing ({len(cached)} tags, umur {age:.0f} detik)")
+            yield from copy.deepcopy(cached)
+            return
+        
+        result = {}
+        fetched = []
+        for tag in iter_tags_from_api(page_size, etag if cached is not None else None, result):
+            fetched.append(tag)
+            yield tag
+        
+        if result.get('not_modified'):
+            print(f"⚡ Listing tidak berubah (304), memakai cache ({len(cached)} tags)")
+            with self._lock:
+                self.fetched_at = time.time()
+            self.save()
+            yield from copy.deepcopy(cached)
+            return
+        
+        # Hanya listing yang selesai di-fetch lengkap yang disimpan
+        with self._lock:
+            self.tags = copy.deepcopy(fetched)
+            self.etag = result.get('etag')
+            self.fetched_at = time.time()
+        self.save()
+
+tag_cache = TagListingCache()
+api_client.write_listeners.append(tag_cache.invalidate)
+
+class IncompleteListingError(requests.exceptions.RequestException):
+    """Listing tag API gagal di tengah jalan; hasilnya tidak boleh dipakai untuk diff/delete"""
+
+    def __init__(self, message, tags):
+        super().__init__(message)
+        self.tags = tags
+
+def get_all_tags_from_api(page_size=DEFAULT_PAGE_SIZE, max_age=None, require_complete=False):
+    """Get all tags from API to see what's available
+
+    Tanpa require_complete, listing yang gagal di tengah tetap dikembalikan sebagian (untuk tampilan).
+    Dengan require_complete=True kegagalan dilempar sebagai IncompleteListingError, supaya caller yang
+    membandingkan data lokal dengan listing (sync, delete) tidak bertindak atas listing terpotong.
+    """
+    print("📋 Fetching all tags from API...")
+    tags = []
+    try:
+        for tag in tag_cache.iter_tags(page_size, max_age):
+            tags.append(tag)
     except Exception as e:
         print(f"❌ Error fetching tags: {e}")
-        return []
+        if tags:
+            print(f"⚠️  Hanya {len(tags)} tags yang berhasil diambil")
+        if require_complete:
+            raise IncompleteListingError(f"listing tag API tidak lengkap ({len(tags)} tags): {e}", tags) from e
+        return tags
+    
+    print(f"✅ Found {len(tags)} tags in API")
+    return tags
+
+def format_tag_line(position, tag):
+    tag_name = tag.get('tag', 'Unknown')
+    author_name = tag.get('nama', 'Unknown')
+    input_count = len(tag.get('input', []))
+    response_count = len(tag.get('responses', []))
+    return f"{position}. {tag_name} by {author_name} ({input_count} inputs, {response_count} responses)"
+
+def fetch_and_display_tags(title, page_size=DEFAULT_PAGE_SIZE):
+    """Tampilkan tag API segera setelah setiap halaman tiba; return list lengkap"""
+    print("📋 Fetching all tags from API...")
+    print(f"\n{title}")
+    tags = []
+    try:
+        for tag in tag_cache.iter_tags(page_size):
+            tags.append(tag)
+            print(format_tag_line(len(tags), tag))
+    except Exception as e:
+        print(f"❌ Error fetching tags: {e}")
+    
+    if tags:
+        print(f"✅ Found {len(tags)} tags in API")
+    return tags
+
+class EndpointCache:
+    """Cache kombinasi endpoint+method delete/update yang terbukti bekerja (persist dengan TTL)"""
+
+    def __init__(self, path=ENDPOINT_CACHE_FILE, ttl=ENDPOINT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get(api_client.base_url, {})
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def get(self, operation):
+        """Return strategy yang tersimpan untuk operation, atau None jika belum ada/kadaluarsa"""
+        with self._lock:
+            entry = self.entries.get(operation)
+            if entry and entry['strategy'] not in UNCACHEABLE_STRATEGIES \
+                    and time.time() - entry['discovered_at'] < self.ttl:
+                return entry['strategy']
+            return None
+
+    def set(self, operation, strategy):
+        if strategy in UNCACHEABLE_STRATEGIES:
+            return
+        with self._lock:
+            entry = self.entries.get(operation)
+            if entry and entry['strategy'] == strategy and time.time() - entry['discovered_at'] < self.ttl:
+                return
+            self.entries[operation] = {'strategy': strategy, 'discovered_at': time.time()}
+        self.save()
+
+    def invalidate(self, operation):
+        with self._lock:
+            if self.entries.pop(operation, None) is None:
+                return
+        self.save()
+
+    def save(self):
+        """Tulis cache secara atomic, entry untuk base URL lain tetap dipertahankan"""
+        with self._lock:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    all_entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                all_entries = {}
+            all_entries[api_client.base_url] = dict(self.entries)
+            tmp_path = self.path + '.tmp'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(all_entries, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"⚠️  Gagal menyimpan endpoint cache: {e}")
+
+endpoint_cache = EndpointCache()
+
+def endpoint_candidates(operation, tag_id, payload):
+    """Kandidat (strategy, url, method, body) untuk delete/update, urutan sama seperti sebelumnya"""
+    candidates = []
+    if tag_id:
+        if operation == 'delete':
+            candidates.append(('by_id', api_client.url(tag_id), 'DELETE', None))
+        else:
+            candidates.append(('by_id', api_client.url(tag_id), 'PUT', payload))
+    candidates.append(('action', api_client.url(operation), 'POST', payload))
+    candidates.append(('base', api_client.base_url, 'POST', payload))
+    return candidates
+
+def call_with_discovery(operation, candidates, success_statuses):
+    """Coba endpoint yang sudah ditemukan dulu (1 request); discovery hanya jika belum ada/gagal.
+
+    Return (ok, reason) dengan reason berisi alasan kegagalan setiap attempt.
+    """
+    cached = endpoint_cache.get(operation)
+    if cached:
+        candidates = sorted(candidates, key=lambda candidate: candidate[0] != cached)
+    
+    reasons = []
+    for i, (strategy, url, method, body) in enumerate(candidates, 1):
+        is_cached = strategy == cached
+        fields = {'event': operation, 'attempt': i, 'method': method, 'url': url, 'cached': is_cached}
+        # POST /delete & /update menarget (nama, tag) sehingga aman diulang; POST base tidak
+        idempotent = True if strategy == 'action' else None
+        try:
+            if body is None:
+                response = api_client.request(method, url, timeout=10, idempotent=idempotent)
+            else:
+                response = api_client.request(method, url, json=body, timeout=10, idempotent=idempotent)
+            log.debug(f"  Attempt {i}: {method} {url}{' (cached)' if is_cached else ''} -> {response.status_code}",
+                      extra={'fields': dict(fields, status=response.status_code)})
+            
+            if response.status_code in success_statuses:
+                endpoint_cache.set(operation, strategy)
+                return True, None
+            
+            reasons.append(f"{method} {url} -> HTTP {response.status_code}: {response.text[:100]}")
+            if is_cached:
+                if response.status_code not in ENDPOINT_MISS_STATUSES:
+                    return False, " | ".join(reasons)
+                endpoint_cache.invalidate(operation)
+                
+        except CircuitOpenError as e:
+            reasons.append(str(e))
+            return False, " | ".join(reasons)
+        except Exception as e:
+            log.debug(f"  Attempt {i}: {method} {url} -> {e}", extra={'fields': dict(fields, error=str(e))})
+            reasons.append(f"{method} {url} -> {e}")
+            if is_cached:
+                return False, " | ".join(reasons)
+    
+    return False, " | ".join(reasons) or "no endpoint tried"
 
 def delete_tag_from_api(tag_id=None, tag_name=None, author_name=None):
     """Delete tag from API"""
-    # Multiple possible delete endpoints
-    possible_endpoints = [
-        f"https://capstone-five-dusky.vercel.app/chatbot/tags/{tag_id}" if tag_id else None,
-        f"https://capstone-five-dusky.vercel.app/chatbot/tags/delete",
-        f"https://capstone-five-dusky.vercel.app/chatbot/tags",
-    ]
-    
-    # Filter out None values
-    possible_endpoints = [url for url in possible_endpoints if url]
-    
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
+    return delete_tag_with_reason(tag_id, tag_name, author_name)[0]
+
+def delete_tag_with_reason(tag_id=None, tag_name=None, author_name=None):
+    """Delete tag from API, return (ok, reason)"""
     # Payload for delete (if needed)
     delete_payload = {}
     if tag_name and author_name:
@@ -106,77 +1132,33 @@ def delete_tag_from_api(tag_id=None, tag_name=None, author_name=None):
             "nama": author_name
         }
     
-    print(f"🗑️  Deleting tag: {tag_name} by {author_name}")
-    
-    for i, url in enumerate(possible_endpoints, 1):
-        try:
-            print(f"  Attempt {i}: {url}")
-            
-            # Try DELETE method first
-            if tag_id and i == 1:
-                response = requests.delete(url, headers=headers, timeout=10)
-                print(f"    Method: DELETE")
-            else:
-                # Try POST with delete payload
-                response = requests.post(url, json=delete_payload, headers=headers, timeout=10)
-                print(f"    Method: POST with delete payload")
-            
-            print(f"    Response Status: {response.status_code}")
-            
-            if response.status_code in [200, 201, 204]:
-                print(f"    ✅ SUCCESS! Deleted {tag_name}")
-                return True
-            else:
-                print(f"    ❌ Failed: {response.status_code}")
-                print(f"    Response: {response.text[:100]}")
-                
-        except Exception as e:
-            print(f"    ❌ Error: {e}")
+    fields = {'event': 'delete', 'author': author_name, 'tag': tag_name, 'id': tag_id}
+    log.debug(f"🗑️  Deleting tag: {tag_name} by {author_name}", extra={'fields': fields})
     
-    return False
+    candidates = endpoint_candidates('delete', tag_id, delete_payload)
+    ok, reason = call_with_discovery('delete', candidates, [200, 201, 204])
+    if ok:
+        log.info(f"    ✅ SUCCESS! Deleted [{author_name}] {tag_name}", extra={'fields': dict(fields, ok=True)})
+        push_manifest.forget(author_name, tag_name)
+    else:
+        log.warning(f"    ❌ FAILED! Delete [{author_name}] {tag_name}: {reason}",
+                    extra={'fields': dict(fields, ok=False, reason=reason)})
+    return ok, reason
 
 def update_tag_in_api(tag_id=None, tag_name=None, author_name=None, updated_data=None):
     """Update tag in API (for removing specific inputs/responses)"""
-    possible_endpoints = [
-        f"https://capstone-five-dusky.vercel.app/chatbot/tags/{tag_id}" if tag_id else None,
-        f"https://capstone-five-dusky.vercel.app/chatbot/tags/update",
-        f"https://capstone-five-dusky.vercel.app/chatbot/tags",
-    ]
-    
-    # Filter out None values
-    possible_endpoints = [url for url in possible_endpoints if url]
-    
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
-    print(f"🔄 Updating tag: {tag_name} by {author_name}")
-    
-    for i, url in enumerate(possible_endpoints, 1):
-        try:
-            print(f"  Attempt {i}: {url}")
-            
-            # Try PUT method first, then POST
-            if i == 1 and tag_id:
-                response = requests.put(url, json=updated_data, headers=headers, timeout=10)
-                print(f"    Method: PUT")
-            else:
-                response = requests.post(url, json=updated_data, headers=headers, timeout=10)
-                print(f"    Method: POST")
-            
-            print(f"    Response Status: {response.status_code}")
-            
-            if response.status_code in [200, 201]:
-                print(f"    ✅ SUCCESS! Updated {tag_name}")
-                return True
-            else:
-                print(f"    ❌ Failed: {response.status_code}")
-                print(f"    Response: {response.text[:100]}")
-                
-        except Exception as e:
-            print(f"    ❌ Error: {e}")
-    
+    fields = {'event': 'update', 'author': author_name, 'tag': tag_name, 'id': tag_id}
+    log.debug(f"🔄 Updating tag: {tag_name} by {author_name}", extra={'fields': fields})
+    
+    candidates = endpoint_candidates('update', tag_id, updated_data)
+    ok, reason = call_with_discovery('update', candidates, [200, 201])
+    if ok:
+        log.info(f"    ✅ SUCCESS! Updated [{author_name}] {tag_name}", extra={'fields': dict(fields, ok=True)})
+        if updated_data and 'tag' in updated_data:
+            push_manifest.record(author_name, updated_data, tag_id)
+        return True
+    log.warning(f"    ❌ FAILED! Update [{author_name}] {tag_name}: {reason}",
+                extra={'fields': dict(fields, ok=False, reason=reason)})
     return False
 
 def delete_specific_tag():
@@ -184,22 +1166,13 @@ def delete_specific_tag():
     print("🗑️  DELETE SPECIFIC TAG FROM API")
     print("="*50)
     
-    # Get tags from API
-    api_tags = get_all_tags_from_api()
+    # Get tags from API (ditampilkan per halaman begitu tiba)
+    api_tags = fetch_and_display_tags("📋 Available tags in API:")
     
     if not api_tags:
         print("❌ No tags found in API or failed to fetch!")
         return
     
-    # Display available tags
-    print("\n📋 Available tags in API:")
-    for i, tag in enumerate(api_tags, 1):
-        tag_name = tag.get('tag', 'Unknown')
-        author_name = tag.get('nama', 'Unknown')
-        input_count = len(tag.get('input', []))
-        response_count = len(tag.get('responses', []))
-        print(f"{i}. {tag_name} by {author_name} ({input_count} inputs, {response_count} responses)")
-    
     try:
         choice = int(input(f"\nPilih tag untuk dihapus (1-{len(api_tags)}): "))
         if 1 <= choice <= len(api_tags):
@@ -234,8 +1207,12 @@ def delete_by_author():
     print("🗑️  DELETE ALL TAGS BY AUTHOR")
     print("="*50)
     
-    # Get tags from API
-    api_tags = get_all_tags_from_api()
+    # Get tags from API (harus lengkap: listing terpotong berarti hanya sebagian tag yang terhapus)
+    try:
+        api_tags = get_all_tags_from_api(require_complete=True)
+    except IncompleteListingError:
+        print("❌ Delete dibatalkan: listing API tidak lengkap")
+        return
     
     if not api_tags:
         print("❌ No tags found in API!")
@@ -268,17 +1245,8 @@ def delete_by_author():
             
             confirm = input(f"\nDelete all {len(tags_to_delete)} tags? (y/n): ")
             if confirm.lower() == 'y':
-                success_count = 0
-                for tag in tags_to_delete:
-                    tag_name = tag.get('tag', 'Unknown')
-                    tag_id = tag.get('id')
-                    
-                    if delete_tag_from_api(tag_id, tag_name, selected_author):
-                        success_count += 1
-                    
-                    time.sleep(1)  # Delay between deletions
-                
-                print(f"\n✅ Deleted {success_count}/{len(tags_to_delete)} tags")
+                max_workers = prompt_int(f"Jumlah worker paralel (default {DEFAULT_MAX_WORKERS}): ", DEFAULT_MAX_WORKERS)
+                delete_tags_concurrently(tags_to_delete, max_workers, f"delete author {selected_author}")
             else:
                 print("❌ Deletion cancelled!")
         else:
@@ -286,27 +1254,90 @@ def delete_by_author():
     except ValueError:
         print("❌ Please enter a valid number!")
 
+def delete_tags_concurrently(tags, max_workers=DEFAULT_MAX_WORKERS, label="delete"):
+    """Hapus banyak tag API secara paralel, lalu simpan laporan kegagalan.
+
+    Laporan (DELETE_REPORT_FILE) berisi id, tag, nama dan alasan setiap kegagalan
+    sehingga bisa dijalankan ulang hanya untuk yang gagal (retry_failed_deletes).
+    """
+    report = {
+        'label': label,
+        'api_url': api_client.base_url,
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'deleted': [],
+        'failed': []
+    }
+    report_lock = threading.Lock()
+    
+    def delete_job(tag):
+        tag_name = tag.get('tag', 'Unknown')
+        author_name = tag.get('nama', 'Unknown')
+        ok, reason = delete_tag_with_reason(tag.get('id'), tag_name, author_name)
+        entry = {'id': tag.get('id'), 'tag': tag_name, 'nama': author_name}
+        with report_lock:
+            if ok:
+                report['deleted'].append(entry)
+            else:
+                report['failed'].append(dict(entry, reason=reason))
+        return ok
+    
+    jobs = [(tag.get('nama', 'Unknown'), tag.get('tag', 'Unknown'), (tag,)) for tag in tags]
+    try:
+        stats = run_jobs(jobs, delete_job, max_workers)
+    finally:
+        report['finished_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        save_delete_report(report)
+    
+    print_push_summary(stats, "DELETE SUMMARY", action="deleted")
+    if report['failed']:
+        print(f"\n🧾 Gagal dihapus ({len(report['failed'])}):")
+        for entry in report['failed']:
+            print(f"   - [{entry['nama']}] {entry['tag']} (id: {entry['id']}): {entry['reason']}")
+        print(f"💾 Laporan disimpan di {DELETE_REPORT_FILE} (menu 13 untuk retry yang gagal)")
+    api_client.print_stats()
+    return report
+
+def save_delete_report(report):
+    """Simpan laporan delete terakhir sebagai JSON"""
+    try:
+        with open(DELETE_REPORT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"⚠️  Gagal menyimpan laporan delete: {e}")
+
+def retry_failed_deletes(max_workers=DEFAULT_MAX_WORKERS):
+    """Jalankan ulang delete hanya untuk tag yang gagal di laporan terakhir"""
+    print("🔁 RETRY FAILED DELETES")
+    print("="*50)
+    try:
+        with open(DELETE_REPORT_FILE, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (FileNotFoundError, ValueError):
+        print("❌ Tidak ada laporan delete sebelumnya!")
+        return None
+    
+    if previous.get('api_url') != api_client.base_url:
+        print(f"❌ Laporan dibuat untuk {previous.get('api_url')}, bukan {api_client.base_url}")
+        return None
+    if not previous.get('failed'):
+        print("🎉 Tidak ada delete yang gagal di laporan terakhir!")
+        return None
+    
+    print(f"🗑️  Retrying {len(previous['failed'])} tags dari '{previous.get('label')}'")
+    return delete_tags_concurrently(previous['failed'], max_workers, f"retry {previous.get('label')}")
+
 def delete_specific_inputs_responses():
     """Delete specific inputs or responses from a tag"""
     print("🗑️  DELETE SPECIFIC INPUTS/RESPONSES")
     print("="*50)
     
-    # Get tags from API
-    api_tags = get_all_tags_from_api()
+    # Get tags from API (ditampilkan per halaman begitu tiba)
+    api_tags = fetch_and_display_tags("📋 Available tags:")
     
     if not api_tags:
         print("❌ No tags found in API!")
         return
     
-    # Display available tags
-    print("\n📋 Available tags:")
-    for i, tag in enumerate(api_tags, 1):
-        tag_name = tag.get('tag', 'Unknown')
-        author_name = tag.get('nama', 'Unknown')
-        input_count = len(tag.get('input', []))
-        response_count = len(tag.get('responses', []))
-        print(f"{i}. {tag_name} by {author_name} ({input_count} inputs, {response_count} responses)")
-    
     try:
         choice = int(input(f"\nPilih tag untuk diedit (1-{len(api_tags)}): "))
         if 1 <= choice <= len(api_tags):
@@ -533,6 +1564,9 @@ def test_single_request():
     
     print("📤 Payload yang akan dikirim:")
     print(json.dumps(payload, indent=2, ensure_ascii=False))
+    body = encode_json(payload)
+    print(f"📏 Ukuran body: {len(body)} bytes compact | {len(gzip.compress(body, COMPRESS_LEVEL))} bytes gzip"
+          f" (gzip {'aktif' if api_client.compress_requests else 'nonaktif'})")
     print()
     
     # Confirm before sending
@@ -546,56 +1580,452 @@ def test_single_request():
     else:
         print("Test dibatalkan.")
 
-def push_all_data():
-    """Push semua data ke API"""
-    print("🚀 Starting data push to API...")
-    print("="*60)
+def prompt_int(prompt, default):
+    """Minta angka dari user, pakai default jika kosong/tidak valid"""
+    value = input(prompt).strip()
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(f"⚠️  Input tidak valid, memakai default {default}")
+        return default
+
+def prompt_float(prompt, default):
+    """Minta angka desimal dari user, pakai default jika kosong/tidak valid"""
+    value = input(prompt).strip()
+    if not value:
+        return default
+    try:
+        number = float(value)
+        return number if number > 0 else default
+    except ValueError:
+        print(f"⚠️  Input tidak valid, memakai default {default}")
+        return default
+
+def run_jobs(jobs, action, max_workers=DEFAULT_MAX_WORKERS, on_result=None):
+    """Jalankan action(*args) untuk setiap job (author, tag_name, args) secara paralel.
+
+    Laju request diatur oleh adaptive rate limiter milik api_client.
+    on_result(author, tag_name, ok) dipanggil setiap kali satu job selesai.
+    Return statistik per author: {author: {'success', 'failed', 'failed_tags'}}
+    """
+    stats = {}
+    for author, _, _ in jobs:
+        stats.setdefault(author, {'success': 0, 'failed': 0, 'failed_tags': []})
+    
+    total = len(jobs)
+    progress = run_log.ProgressLine(total, getattr(action, '__name__', 'jobs'))
+    
+    def worker(position, author, tag_name, args):
+        log.debug(f"[{position}/{total}] Processing tag: {tag_name} ({author})",
+                  extra={'fields': {'event': 'job_start', 'position': position, 'author': author, 'tag': tag_name}})
+        return action(*args)
+    
+    def record(future):
+        author, tag_name = futures[future]
+        try:
+            ok = future.result()
+        except Exception as e:
+            log.warning(f"   ❌ ERROR worker [{author}] {tag_name}: {e}",
+                        extra={'fields': {'event': 'job_error', 'author': author, 'tag': tag_name, 'error': str(e)}})
+            ok = False
+        
+        progress.update(ok)
+        if ok:
+            stats[author]['success'] += 1
+        else:
+            stats[author]['failed'] += 1
+            stats[author]['failed_tags'].append(tag_name)
+        if on_result:
+            on_result(author, tag_name, ok)
+    
+    futures = {}
+    recorded = set()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        for position, (author, tag_name, args) in enumerate(jobs, 1):
+            futures[executor.submit(worker, position, author, tag_name, args)] = (author, tag_name)
+        for future in as_completed(futures):
+            recorded.add(future)
+            record(future)
+    except KeyboardInterrupt:
+        print("\n⛔ Dihentikan! Job yang belum berjalan dibatalkan, menunggu job yang sedang berjalan...")
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Job yang sempat selesai tetap dicatat (journal) supaya resume tidak mengirimnya ulang
+        for future in futures:
+            if future not in recorded and not future.cancelled():
+                record(future)
+        progress.finish()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+    progress.finish()
+    
+    return stats
+
+def push_intents(jobs, max_workers=DEFAULT_MAX_WORKERS, journal=None):
+    """Push list (author, intent) memakai worker pool terbatas"""
+    push_jobs = [(author, intent['tag'], (intent, author)) for author, intent in jobs]
+    on_result = journal.mark if journal else None
+    try:
+        return run_jobs(push_jobs, send_tag_to_api, max_workers, on_result)
+    finally:
+        push_manifest.save()
+
+def skip_unchanged(jobs):
+    """Buang intent yang identik dengan push sukses terakhir (menurut manifest)"""
+    pending = [(author, intent) for author, intent in jobs if not push_manifest.is_current(author, intent)]
+    skipped = len(jobs) - len(pending)
+    if skipped:
+        print(f"⏭️  Skipped {skipped} tag yang tidak berubah sejak push terakhir (manifest)")
+    return pending
+
+def chunk_payloads(items, max_bytes=DEFAULT_BULK_MAX_BYTES, max_items=DEFAULT_BULK_MAX_ITEMS):
+    """Bagi list (author, intent) menjadi chunk dengan batas jumlah item & ukuran JSON"""
+    chunks = []
+    current = []
+    current_bytes = 2  # "[]"
+    for author, intent in items:
+        payload = build_payload(intent, author)
+        size = len(encode_json(payload)) + 1
+        if current and (len(current) >= max_items or current_bytes + size > max_bytes):
+            chunks.append(current)
+            current = []
+            current_bytes = 2
+        current.append((author, intent))
+        current_bytes += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+def send_bulk_to_api(chunk):
+    """Kirim satu chunk lewat endpoint bulk.
+
+    Return 'ok', 'rejected' (chunk ini ditolak), 'unsupported' (server tidak punya
+    endpoint bulk) atau 'failed'.
+    """
+    url = api_client.url("bulk")
+    payloads = [build_payload(intent, author) for author, intent in chunk]
+    fields = {'event': 'bulk', 'url': url, 'items': len(payloads)}
+    log.debug(f"📦 Sending bulk chunk: {len(payloads)} tags -> {url}", extra={'fields': fields})
+    try:
+        response = api_client.post(url, json=payloads, timeout=60)
+    except Exception as e:
+        log.warning(f"   ❌ ERROR bulk: {e}", extra={'fields': dict(fields, error=str(e))})
+        return 'failed'
     
-    data = load_data()
+    fields['status'] = response.status_code
+    if response.status_code in [200, 201]:
+        try:
+            created = decode_json(response.content).get('data', [])
+        except (ValueError, AttributeError):
+            created = []
+        for position, (author, intent) in enumerate(chunk):
+            server_id = extract_server_id(created[position]) if position < len(created) else None
+            push_manifest.record(author, intent, server_id)
+        log.info(f"   ✅ SUCCESS! {len(chunk)} tags pushed in 1 request",
+                 extra={'fields': dict(fields, ok=True, tags=[f"{author}/{intent['tag']}" for author, intent in chunk])})
+        return 'ok'
+    if response.status_code in BULK_UNSUPPORTED_STATUSES:
+        log.debug(f"   ⚠️  Endpoint bulk tidak didukung ({response.status_code})", extra={'fields': fields})
+        return 'unsupported'
+    if response.status_code in BULK_REJECTED_STATUSES:
+        log.warning(f"   ⚠️  Chunk ditolak ({response.status_code}): {response.text[:100]}",
+                    extra={'fields': dict(fields, response=response.text[:100])})
+        return 'rejected'
+    log.warning(f"   ❌ FAILED! Bulk status: {response.status_code}", extra={'fields': dict(fields, ok=False)})
+    return 'failed'
+
+def push_intents_bulk(jobs, max_workers=DEFAULT_MAX_WORKERS, journal=None,
+                      max_bytes=DEFAULT_BULK_MAX_BYTES, max_items=DEFAULT_BULK_MAX_ITEMS):
+    """Push (author, intent) dalam chunk bulk; fallback per-item jika batch ditolak"""
+    stats = {}
+    for author, _ in jobs:
+        stats.setdefault(author, {'success': 0, 'failed': 0, 'failed_tags': []})
+    
+    chunks = chunk_payloads(jobs, max_bytes, max_items)
+    print(f"📦 {len(jobs)} tags dibagi menjadi {len(chunks)} chunk bulk")
+    
+    fallback = []
+    bulk_supported = True
+    progress = run_log.ProgressLine(len(jobs), 'bulk')
+    
+    def record(future):
+        nonlocal bulk_supported
+        chunk = futures[future]
+        result = future.result()
+        if result != 'failed':
+            # chunk yang masuk fallback dihitung lagi oleh progress per-item
+            progress.update(True, len(chunk) if result == 'ok' else 0)
+        else:
+            progress.update(False, len(chunk))
+        if result == 'ok':
+            for author, intent in chunk:
+                stats[author]['success'] += 1
+                if journal:
+                    journal.mark(author, intent['tag'], True)
+        elif result in ('rejected', 'unsupported'):
+            bulk_supported = bulk_supported and result != 'unsupported'
+            fallback.extend(chunk)
+        else:
+            for author, intent in chunk:
+                stats[author]['failed'] += 1
+                stats[author]['failed_tags'].append(intent['tag'])
+                if journal:
+                    journal.mark(author, intent['tag'], False)
+    
+    futures = {}
+    recorded = set()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        for chunk in chunks:
+            futures[executor.submit(send_bulk_to_api, chunk)] = chunk
+        for future in as_completed(futures):
+            recorded.add(future)
+            record(future)
+    except KeyboardInterrupt:
+        print("\n⛔ Dihentikan! Chunk yang belum berjalan dibatalkan, menunggu chunk yang sedang berjalan...")
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Chunk yang sempat selesai tetap dicatat (journal) supaya resume tidak mengirimnya ulang
+        for future in futures:
+            if future not in recorded and not future.cancelled():
+                record(future)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        progress.finish()
+        push_manifest.save()
+    
+    if fallback:
+        reason = "tidak didukung server" if not bulk_supported else "ditolak"
+        print(f"\n↩️  Bulk {reason}: fallback per-item untuk {len(fallback)} tags")
+        for author, author_stats in push_intents(fallback, max_workers, journal).items():
+            stats[author]['success'] += author_stats['success']
+            stats[author]['failed'] += author_stats['failed']
+            stats[author]['failed_tags'].extend(author_stats['failed_tags'])
+    
+    return stats
+
+class PushJournal:
+    """Checkpoint journal (JSON lines) untuk push yang bisa di-resume.
+
+    Baris pertama mencatat semua item (pending), lalu setiap hasil push
+    ditambahkan sebagai baris baru sehingga aman jika proses mati di tengah jalan.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def start(self, jobs, label, bulk=False):
+        """Mulai journal baru untuk list (author, intent); bulk dicatat supaya resume memakai mode yang sama"""
+        header = {
+            'type': 'start',
+            'job_id': time.strftime('%Y%m%d-%H%M%S'),
+            'label': label,
+            'bulk': bulk,
+            'api_url': api_client.base_url,
+            'items': [{'author': author, 'tag': intent['tag']} for author, intent in jobs]
+        }
+        with self._lock, open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+
+    def mark(self, author, tag_name, ok):
+        """Catat hasil satu item (dipanggil setiap kali push selesai)"""
+        entry = {'type': 'result', 'author': author, 'tag': tag_name,
+                 'status': 'succeeded' if ok else 'failed'}
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+
+    def read(self):
+        """Return (header, {(author, tag): status}) atau (None, {}) jika belum ada journal"""
+        header = None
+        statuses = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # baris terakhir bisa terpotong saat crash
+                    if entry.get('type') == 'start':
+                        header = entry
+                        statuses = {(item['author'], item['tag']): 'pending' for item in entry['items']}
+                    elif entry.get('type') == 'result':
+                        statuses[(entry['author'], entry['tag'])] = entry['status']
+        except FileNotFoundError:
+            pass
+        return header, statuses
+
+push_journal = PushJournal()
+
+def journal_for_shard(shard=None):
+    """Journal default, atau journal terpisah per shard (index, count)"""
+    if shard is None:
+        return push_journal
+    index, count = shard
+    return PushJournal(f"{JOURNAL_FILE}.shard{index}of{count}")
+
+def in_shard(author, tag_name, shard):
+    """True jika (author, tag) termasuk shard (index, count); pembagian stabil antar proses"""
+    if shard is None:
+        return True
+    index, count = shard
+    digest = hashlib.md5(f"{author}\x1f{tag_name}".encode('utf-8')).hexdigest()
+    return int(digest, 16) % count == index
+
+def run_push(jobs, max_workers, bulk, label, journal=None):
+    """Push dengan journal checkpoint (journal lama tetap ada jika tidak ada job)"""
+    journal = journal or push_journal
+    if jobs:
+        journal.start(jobs, label, bulk)
+    if bulk:
+        stats = push_intents_bulk(jobs, max_workers, journal)
+    else:
+        stats = push_intents(jobs, max_workers, journal)
+    return stats
+
+def resume_last_push(max_workers=DEFAULT_MAX_WORKERS, requests_per_second=DEFAULT_REQUESTS_PER_SECOND, shard=None):
+    """Lanjutkan push terakhir dari checkpoint: hanya item pending/failed yang dikirim"""
+    print("⏯️  RESUME LAST PUSH")
+    print("="*60)
     
-    total_tags = 0
-    success_count = 0
-    failed_count = 0
+    journal = journal_for_shard(shard)
+    header, statuses = journal.read()
+    if header is None:
+        print("❌ Tidak ada journal push yang bisa di-resume!")
+        return {}
+    if header.get('api_url') != api_client.base_url:
+        print(f"❌ Journal dibuat untuk {header.get('api_url')}, bukan {api_client.base_url}")
+        return {}
+    
+    counts = {}
+    for status in statuses.values():
+        counts[status] = counts.get(status, 0) + 1
+    print(f"🧾 Job {header['job_id']} ({header.get('label', '-')})")
+    print(f"   ✅ succeeded: {counts.get('succeeded', 0)} | ❌ failed: {counts.get('failed', 0)} | ⏳ pending: {counts.get('pending', 0)}")
+    
+    remaining = {key for key, status in statuses.items() if status != 'succeeded'}
+    if not remaining:
+        print("🎉 Semua item di journal sudah sukses, tidak ada yang perlu di-resume!")
+        return {}
     
-    # Count total tags
+    data = load_data()
+    jobs = []
     for author, author_data in data.items():
-        total_tags += len(author_data.get('intents', []))
+        for intent in author_data.get('intents', []):
+            if (author, intent['tag']) in remaining:
+                jobs.append((author, intent))
+    
+    missing = len(remaining) - len(jobs)
+    if missing:
+        print(f"⚠️  {missing} item sudah tidak ada di data lokal dan dilewati")
+    
+    # Push yang sukses tapi belum sempat tercatat di journal sudah ada di manifest; jangan POST ulang
+    pending = skip_unchanged(jobs)
+    if len(pending) < len(jobs):
+        pending_keys = {(author, intent['tag']) for author, intent in pending}
+        for author, intent in jobs:
+            if (author, intent['tag']) not in pending_keys:
+                journal.mark(author, intent['tag'], True)
+        jobs = pending
+    
+    bulk = header.get('bulk', False)
+    print(f"🔁 Retrying {len(jobs)} tags dengan {max_workers} worker{' (bulk)' if bulk else ''}...")
+    api_client.rate_limiter.set_rate(requests_per_second)
+    if bulk:
+        stats = push_intents_bulk(jobs, max_workers, journal)
+    else:
+        stats = push_intents(jobs, max_workers, journal)
+    print_push_summary(stats, "RESUME SUMMARY")
+    api_client.print_stats()
+    return stats
+
+def print_push_summary(stats, title, action="pushed"):
+    """Tampilkan ringkasan push per author"""
+    total = sum(s['success'] + s['failed'] for s in stats.values())
+    success_count = sum(s['success'] for s in stats.values())
+    failed_count = sum(s['failed'] for s in stats.values())
+    
+    print("\n" + "="*60)
+    print(f"📋 {title}")
+    print("="*60)
+    for author, author_stats in stats.items():
+        author_total = author_stats['success'] + author_stats['failed']
+        print(f"👤 {author}: ✅ {author_stats['success']}/{author_total} | ❌ {author_stats['failed']}/{author_total}")
+        for tag_name in author_stats['failed_tags']:
+            print(f"   - ❌ {tag_name}")
+    print("-"*60)
+    print(f"✅ Successfully {action}: {success_count}/{total}")
+    print(f"❌ Failed: {failed_count}/{total}")
+    if total:
+        print(f"📊 Success rate: {(success_count/total*100):.1f}%")
     
-    print(f"📊 Total tags to push: {total_tags}")
-    print(f"🌐 Target URL: https://capstone-five-dusky.vercel.app/chatbot/tags")
+    if failed_count == 0:
+        print(f"🎉 All data {action} successfully!")
+    else:
+        print(f"⚠️  {failed_count} tags failed. Check logs above.")
+
+def push_all_data(max_workers=DEFAULT_MAX_WORKERS, requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+                  force=False, bulk=False, shard=None):
+    """Push semua data ke API (skip intent yang tidak berubah kecuali force=True).
+
+    shard=(index, count) hanya mengirim bagian data milik shard tersebut.
+    """
+    print("🚀 Starting data push to API...")
     print("="*60)
     
-    # Push data for each author
+    data = load_data()
+    
+    jobs = []
     for author, author_data in data.items():
-        print(f"\n📤 Processing {author}...")
-        intents = author_data.get('intents', [])
-        
-        for i, intent in enumerate(intents, 1):
-            print(f"\n[{i}/{len(intents)}] Processing tag: {intent['tag']}")
-            
-            if send_tag_to_api(intent, author):
-                success_count += 1
-                print(f"   ✅ Success count: {success_count}")
-            else:
-                failed_count += 1
-                print(f"   ❌ Failed count: {failed_count}")
-            
-            # Small delay to avoid overwhelming the API
-            print(f"   ⏳ Waiting 2 seconds...")
-            time.sleep(2)
+        for intent in author_data.get('intents', []):
+            if in_shard(author, intent['tag'], shard):
+                jobs.append((author, intent))
     
-    # Summary
-    print("\n" + "="*60)
-    print("📋 PUSH SUMMARY")
+    if shard is not None:
+        print(f"🧩 Shard {shard[0]}/{shard[1]}")
+    
+    if not force:
+        jobs = skip_unchanged(jobs)
+    
+    print(f"📊 Total tags to push: {len(jobs)}")
+    print(f"🌐 Target URL: {api_client.base_url}")
+    print(f"⚙️  Workers: {max_workers} | Rate awal: {requests_per_second} req/s (adaptif) | Bulk: {'ya' if bulk else 'tidak'}")
     print("="*60)
-    print(f"✅ Successfully pushed: {success_count}/{total_tags}")
-    print(f"❌ Failed: {failed_count}/{total_tags}")
-    print(f"📊 Success rate: {(success_count/total_tags*100):.1f}%")
     
-    if failed_count == 0:
-        print("🎉 All data pushed successfully!")
-    else:
-        print(f"⚠️  {failed_count} tags failed to push. Check logs above.")
+    api_client.rate_limiter.set_rate(requests_per_second)
+    label = "push all" if shard is None else f"push all shard {shard[0]}/{shard[1]}"
+    stats = run_push(jobs, max_workers, bulk, label, journal_for_shard(shard))
+    print_push_summary(stats, "PUSH SUMMARY")
+    api_client.print_stats()
+    return stats
+
+def push_author_data(author, max_workers=DEFAULT_MAX_WORKERS, requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+                     force=False, bulk=False, data=None):
+    """Push semua tag milik satu author. Return stats, atau None jika author tidak ada"""
+    # Tanpa data lengkap, hanya author ini yang di-parse (index dataset)
+    author_data = data.get(author) if data is not None else dataset.get_author(author)
+    if author_data is None:
+        print(f"❌ Author '{author}' tidak ditemukan!")
+        return None
+    
+    print(f"\n🚀 Pushing data for {author}...")
+    print(f"🌐 Target URL: {api_client.base_url}")
+    print(f"⚙️  Workers: {max_workers} | Rate awal: {requests_per_second} req/s (adaptif) | Bulk: {'ya' if bulk else 'tidak'}")
+    print("="*50)
+    
+    intents = author_data.get('intents', [])
+    jobs = [(author, intent) for intent in intents]
+    if not force:
+        jobs = skip_unchanged(jobs)
+    api_client.rate_limiter.set_rate(requests_per_second)
+    stats = run_push(jobs, max_workers, bulk, f"push author {author}")
+    print_push_summary(stats, f"SUMMARY FOR {author}")
+    api_client.print_stats()
+    return stats
 
 def push_by_author():
     """Push data berdasarkan author tertentu"""
@@ -611,38 +2041,39 @@ def push_by_author():
         choice = int(input(f"\nPilih author (1-{len(authors)}): "))
         if 1 <= choice <= len(authors):
             selected_author = authors[choice - 1]
-            
-            print(f"\n🚀 Pushing data for {selected_author}...")
-            print(f"🌐 Target URL: https://capstone-five-dusky.vercel.app/chatbot/tags")
-            print("="*50)
-            
-            intents = data[selected_author].get('intents', [])
-            success_count = 0
-            failed_count = 0
-            
-            for i, intent in enumerate(intents, 1):
-                print(f"\n[{i}/{len(intents)}] Processing tag: {intent['tag']}")
-                
-                if send_tag_to_api(intent, selected_author):
-                    success_count += 1
-                else:
-                    failed_count += 1
-                
-                # Delay between requests
-                if i < len(intents):
-                    print(f"   ⏳ Waiting 2 seconds...")
-                    time.sleep(2)
-            
-            print(f"\n" + "="*50)
-            print(f"📋 SUMMARY FOR {selected_author}")
-            print(f"✅ Successful: {success_count}/{len(intents)}")
-            print(f"❌ Failed: {failed_count}/{len(intents)}")
-            print(f"📊 Success rate: {(success_count/len(intents)*100):.1f}%")
+            max_workers = prompt_int(f"Jumlah worker paralel (default {DEFAULT_MAX_WORKERS}): ", DEFAULT_MAX_WORKERS)
+            requests_per_second = prompt_float(f"Rate awal req/detik, adaptif (default {DEFAULT_REQUESTS_PER_SECOND}): ", DEFAULT_REQUESTS_PER_SECOND)
+            force = input("Kirim ulang juga tag yang tidak berubah? (y/n, default n): ").lower() == 'y'
+            bulk = input("Gunakan bulk mode (banyak tag per request)? (y/n, default n): ").lower() == 'y'
+            push_author_data(selected_author, max_workers, requests_per_second, force, bulk, data)
         else:
             print("❌ Invalid choice!")
     except ValueError:
         print("❌ Please enter a valid number!")
 
+def push_single_tag(author, tag_name, data=None):
+    """Push satu tag. Return True/False, atau None jika author/tag tidak ada"""
+    if data is not None:
+        intents = data.get(author, {}).get('intents', [])
+        selected_tag = next((intent for intent in intents if intent['tag'] == tag_name), None)
+    else:
+        selected_tag = dataset.get_intent(author, tag_name)
+    if selected_tag is None:
+        print(f"❌ Tag '{tag_name}' untuk author '{author}' tidak ditemukan!")
+        return None
+    
+    print(f"\n🚀 Pushing tag: {selected_tag['tag']} for {author}")
+    print(f"🌐 Target URL: {api_client.base_url}")
+    print("-" * 50)
+    
+    ok = send_tag_to_api(selected_tag, author)
+    push_manifest.save()
+    if ok:
+        print("\n🎉 Tag pushed successfully!")
+    else:
+        print("\n❌ Failed to push tag!")
+    return ok
+
 def push_specific_tag():
     """Push tag tertentu"""
     data = load_data()
@@ -668,16 +2099,7 @@ def push_specific_tag():
             
             tag_choice = int(input(f"\nPilih tag (1-{len(intents)}): "))
             if 1 <= tag_choice <= len(intents):
-                selected_tag = intents[tag_choice - 1]
-                
-                print(f"\n🚀 Pushing tag: {selected_tag['tag']} for {selected_author}")
-                print(f"🌐 Target URL: https://capstone-five-dusky.vercel.app/chatbot/tags")
-                print("-" * 50)
-                
-                if send_tag_to_api(selected_tag, selected_author):
-                    print("\n🎉 Tag pushed successfully!")
-                else:
-                    print("\n❌ Failed to push tag!")
+                push_single_tag(selected_author, intents[tag_choice - 1]['tag'], data)
             else:
                 print("❌ Invalid tag choice!")
         else:
@@ -685,13 +2107,188 @@ def push_specific_tag():
     except ValueError:
         print("❌ Please enter a valid number!")
 
+def plan_sync(data, api_tags):
+    """Bandingkan data lokal dengan state API, key (nama, tag).
+
+    Return dict berisi 'create' [(author, intent)], 'update' [(author, intent, remote)],
+    'delete' [remote], 'duplicates' [remote] (salinan ganda di API selain yang pertama; dihapus
+    berdasarkan id setelah operasi lain selesai) dan 'unchanged' (jumlah intent yang sudah identik).
+    """
+    remote_by_key = {}
+    duplicates = []
+    for remote in api_tags:
+        key = (remote.get('nama'), remote.get('tag'))
+        if key in remote_by_key:
+            duplicates.append(remote)
+        else:
+            remote_by_key[key] = remote
+    
+    plan = {'create': [], 'update': [], 'delete': [], 'duplicates': duplicates, 'unchanged': 0}
+    local_keys = set()
+    for author, author_data in data.items():
+        for intent in author_data.get('intents', []):
+            key = (author, intent['tag'])
+            local_keys.add(key)
+            remote = remote_by_key.get(key)
+            if remote is None:
+                plan['create'].append((author, intent))
+            elif intent_hash(remote, author) != intent_hash(intent, author):
+                plan['update'].append((author, intent, remote))
+            else:
+                plan['unchanged'] += 1
+                push_manifest.record(author, intent, remote.get('id'))
+    
+    for key, remote in remote_by_key.items():
+        if key not in local_keys:
+            plan['delete'].append(remote)
+    
+    return plan
+
+def print_sync_plan(plan):
+    """Tampilkan rencana sync sebelum dieksekusi"""
+    print("\n" + "="*60)
+    print("🧭 SYNC PLAN")
+    print("="*60)
+    print(f"🆕 Create: {len(plan['create'])}")
+    for author, intent in plan['create']:
+        print(f"   + [{author}] {intent['tag']}")
+    print(f"✏️  Update: {len(plan['update'])}")
+    for author, intent, _ in plan['update']:
+        print(f"   ~ [{author}] {intent['tag']}")
+    print(f"🗑️  Delete: {len(plan['delete'])}")
+    for remote in plan['delete']:
+        print(f"   - [{remote.get('nama', 'Unknown')}] {remote.get('tag', 'Unknown')} (id: {remote.get('id')})")
+    if plan['duplicates']:
+        print(f"♊ Salinan ganda di API: {len(plan['duplicates'])} (dihapus per id setelah operasi di atas)")
+        for remote in plan['duplicates']:
+            print(f"   - [{remote.get('nama', 'Unknown')}] {remote.get('tag', 'Unknown')} (id: {remote.get('id')})")
+    print(f"✅ Unchanged: {plan['unchanged']}")
+
+def sync_jobs(plan):
+    """Ubah sync plan menjadi job untuk run_jobs"""
+    jobs = []
+    for remote in plan['delete']:
+        author = remote.get('nama', 'Unknown')
+        tag_name = remote.get('tag', 'Unknown')
+        jobs.append((author, f"{tag_name} (delete)", (delete_tag_from_api, remote.get('id'), tag_name, author)))
+    for author, intent, remote in plan['update']:
+        jobs.append((author, f"{intent['tag']} (update)",
+                     (update_tag_in_api, remote.get('id'), intent['tag'], author, build_payload(intent, author))))
+    for author, intent in plan['create']:
+        jobs.append((author, f"{intent['tag']} (create)", (send_tag_to_api, intent, author)))
+    return jobs
+
+def duplicate_jobs(plan):
+    """Job delete untuk salinan ganda di API; salinan tanpa id dilewati (tidak bisa ditarget aman)"""
+    jobs = []
+    for remote in plan['duplicates']:
+        author = remote.get('nama', 'Unknown')
+        tag_name = remote.get('tag', 'Unknown')
+        tag_id = extract_server_id(remote)
+        if tag_id is None:
+            print(f"⚠️  Salinan ganda [{author}] {tag_name} tanpa id dilewati")
+            continue
+        jobs.append((author, f"{tag_name} (duplicate)", (delete_duplicate_from_api, tag_id, tag_name, author)))
+    return jobs
+
+def delete_duplicate_from_api(tag_id, tag_name=None, author_name=None):
+    """Hapus satu salinan ganda berdasarkan id saja.
+
+    Delete berbasis (nama, tag) bisa mengenai salinan yang dipertahankan, dan entry manifest
+    untuk key ini tetap milik salinan tersebut, jadi tidak di-forget.
+    """
+    fields = {'event': 'delete_duplicate', 'author': author_name, 'tag': tag_name, 'id': tag_id}
+    candidates = [candidate for candidate in endpoint_candidates('delete', tag_id, None)
+                  if candidate[0] == 'by_id']
+    ok, reason = call_with_discovery('delete', candidates, [200, 201, 204])
+    if ok:
+        log.info(f"    ✅ SUCCESS! Deleted duplicate [{author_name}] {tag_name} (id: {tag_id})",
+                 extra={'fields': dict(fields, ok=True)})
+    else:
+        log.warning(f"    ❌ FAILED! Delete duplicate [{author_name}] {tag_name}: {reason}",
+                    extra={'fields': dict(fields, ok=False, reason=reason)})
+    return ok
+
+def merge_stats(stats, extra):
+    """Tambahkan statistik per author dari run_jobs lain ke stats"""
+    for author, author_stats in extra.items():
+        target = stats.setdefault(author, {'success': 0, 'failed': 0, 'failed_tags': []})
+        target['success'] += author_stats['success']
+        target['failed'] += author_stats['failed']
+        target['failed_tags'].extend(author_stats['failed_tags'])
+    return stats
+
+def call_job(function, *args):
+    """Helper run_jobs untuk job yang membawa fungsinya sendiri"""
+    return function(*args)
+
+def sync_data(max_workers=DEFAULT_MAX_WORKERS, requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+              confirm=True, dry_run=False):
+    """Sync data lokal ke API: hanya create/update/delete yang diperlukan.
+
+    Return {'plan': jumlah per operasi, 'stats': statistik per author}; jika listing API gagal
+    diambil lengkap, plan None dan 'error' berisi alasannya.
+    """
+    print("🔄 SYNC DATA (DIFF VS API)")
+    print("="*60)
+    
+    data = load_data()
+    # Sync selalu revalidasi ke server (304 murah jika tidak ada perubahan). Listing terpotong akan
+    # membuat tag yang sudah ada direncanakan sebagai create (duplikat), jadi sync dibatalkan.
+    try:
+        api_tags = get_all_tags_from_api(max_age=0, require_complete=True)
+    except IncompleteListingError as e:
+        print("❌ Sync dibatalkan: listing API tidak lengkap, tidak ada operasi yang dijalankan")
+        return {'plan': None, 'stats': {}, 'error': str(e)}
+    plan = plan_sync(data, api_tags)
+    print_sync_plan(plan)
+    result = {
+        'plan': {
+            'create': len(plan['create']),
+            'update': len(plan['update']),
+            'delete': len(plan['delete']),
+            'duplicates': len(plan['duplicates']),
+            'unchanged': plan['unchanged']
+        },
+        'stats': {}
+    }
+    
+    jobs = sync_jobs(plan)
+    cleanup_jobs = duplicate_jobs(plan)
+    if not jobs and not cleanup_jobs:
+        print("\n🎉 Data lokal dan API sudah identik, tidak ada yang perlu dikirim!")
+        push_manifest.save()
+        return result
+    
+    if dry_run:
+        print("\n🔍 Dry run: tidak ada operasi yang dijalankan")
+        return result
+    
+    if confirm:
+        answer = input(f"\nJalankan {len(jobs) + len(cleanup_jobs)} operasi di atas? (y/n): ")
+        if answer.lower() != 'y':
+            print("❌ Sync dibatalkan!")
+            return result
+    
+    api_client.rate_limiter.set_rate(requests_per_second)
+    try:
+        result['stats'] = run_jobs(jobs, call_job, max_workers)
+        # Salinan ganda baru dihapus setelah update pada key yang sama selesai
+        if cleanup_jobs:
+            merge_stats(result['stats'], run_jobs(cleanup_jobs, call_job, max_workers))
+    finally:
+        push_manifest.save()
+    print_push_summary(result['stats'], "SYNC SUMMARY", action="synced")
+    api_client.print_stats()
+    return result
+
 def check_data_preview():
     """Preview data yang akan dikirim"""
     data = load_data()
     
     print("📋 DATA PREVIEW")
     print("="*60)
-    print("🌐 Target URL: https://capstone-five-dusky.vercel.app/chatbot/tags")
+    print(f"🌐 Target URL: {api_client.base_url}")
     print("="*60)
     
     for author, author_data in data.items():
@@ -724,12 +2321,12 @@ def check_endpoint_connectivity():
     print("🔗 Checking endpoint connectivity...")
     print("="*50)
     
-    url = "https://capstone-five-dusky.vercel.app/chatbot/tags"
+    url = api_client.base_url
     
     try:
         # Test GET request first
         print(f"Testing GET {url}")
-        response = requests.get(url, timeout=10)
+        response = api_client.get(url, timeout=10)
         print(f"GET Response: {response.status_code}")
         print(f"Response: {response.text[:200]}...")
         print()
@@ -743,7 +2340,7 @@ def check_endpoint_connectivity():
             "responses": ["test response"]
         }
         
-        response = requests.post(url, json=test_payload, timeout=10)
+        response = api_client.post(url, json=test_payload, timeout=10)
         print(f"POST Response: {response.status_code}")
         print(f"Response: {response.text[:200]}...")
         
@@ -759,13 +2356,24 @@ def check_endpoint_connectivity():
     except Exception as e:
         print(f"❌ Connection error: {e}")
 
+def export_api_metrics():
+    """Export metrik semua request di sesi ini (format dari ekstensi file)"""
+    api_client.print_stats()
+    path = input(f"File tujuan (.json/.csv/.prom, default {METRICS_FILE}): ").strip() or METRICS_FILE
+    try:
+        fmt = api_client.export_metrics(path)
+        print(f"💾 Metrik ({fmt}) disimpan di {path}")
+    except (OSError, ValueError) as e:
+        print(f"❌ Gagal export metrik: {e}")
+
 def main_menu():
     """Main menu untuk push data"""
+    run_log.setup_logging(log_file=LOG_FILE)
     while True:
         print("\n" + "="*60)
         print("🚀 CHATBOT TAGS MANAGER - API OPERATIONS")
         print("="*60)
-        print("🌐 Target: https://capstone-five-dusky.vercel.app/chatbot/tags")
+        print(f"🌐 Target: {api_client.base_url}")
         print("="*60)
         print("📤 PUSH DATA:")
         print("1. Push All Data (Semua author & tag)")
@@ -782,14 +2390,24 @@ def main_menu():
         print("8. Delete Specific Tag")
         print("9. Delete All Tags by Author")
         print("10. Delete/Edit Inputs & Responses")
-        print("11. Exit")
+        print()
+        print("🔄 SYNC:")
+        print("11. Sync Data (Push hanya yang berubah vs API)")
+        print("12. Resume Last Push (lanjutkan dari checkpoint)")
+        print("13. Retry Failed Deletes (dari laporan terakhir)")
+        print("14. Export API Metrics (JSON/CSV/Prometheus)")
+        print("0. Exit")
         
-        choice = input("\nPilih menu (1-11): ").strip()
+        choice = input("\nPilih menu (0-14): ").strip()
         
         if choice == '1':
             confirm = input("⚠️  Push semua data? This will send ALL tags to API (y/n): ")
             if confirm.lower() == 'y':
-                push_all_data()
+                max_workers = prompt_int(f"Jumlah worker paralel (default {DEFAULT_MAX_WORKERS}): ", DEFAULT_MAX_WORKERS)
+                requests_per_second = prompt_float(f"Rate awal req/detik, adaptif (default {DEFAULT_REQUESTS_PER_SECOND}): ", DEFAULT_REQUESTS_PER_SECOND)
+                force = input("Kirim ulang juga tag yang tidak berubah? (y/n, default n): ").lower() == 'y'
+                bulk = input("Gunakan bulk mode (banyak tag per request)? (y/n, default n): ").lower() == 'y'
+                push_all_data(max_workers, requests_per_second, force, bulk)
             else:
                 print("❌ Push dibatalkan!")
                 
@@ -809,15 +2427,7 @@ def main_menu():
             check_endpoint_connectivity()
             
         elif choice == '7':
-            api_tags = get_all_tags_from_api()
-            if api_tags:
-                print(f"\n📋 Found {len(api_tags)} tags in API:")
-                for i, tag in enumerate(api_tags, 1):
-                    tag_name = tag.get('tag', 'Unknown')
-                    author_name = tag.get('nama', 'Unknown')
-                    input_count = len(tag.get('input', []))
-                    response_count = len(tag.get('responses', []))
-                    print(f"{i}. {tag_name} by {author_name} ({input_count} inputs, {response_count} responses)")
+            fetch_and_display_tags("📋 Tags in API:")
             
         elif choice == '8':
             delete_specific_tag()
@@ -829,14 +2439,280 @@ def main_menu():
             delete_specific_inputs_responses()
             
         elif choice == '11':
+            max_workers = prompt_int(f"Jumlah worker paralel (default {DEFAULT_MAX_WORKERS}): ", DEFAULT_MAX_WORKERS)
+            requests_per_second = prompt_float(f"Rate awal req/detik, adaptif (default {DEFAULT_REQUESTS_PER_SECOND}): ", DEFAULT_REQUESTS_PER_SECOND)
+            sync_data(max_workers, requests_per_second)
+            
+        elif choice == '12':
+            max_workers = prompt_int(f"Jumlah worker paralel (default {DEFAULT_MAX_WORKERS}): ", DEFAULT_MAX_WORKERS)
+            requests_per_second = prompt_float(f"Rate awal req/detik, adaptif (default {DEFAULT_REQUESTS_PER_SECOND}): ", DEFAULT_REQUESTS_PER_SECOND)
+            resume_last_push(max_workers, requests_per_second)
+            
+        elif choice == '13':
+            max_workers = prompt_int(f"Jumlah worker paralel (default {DEFAULT_MAX_WORKERS}): ", DEFAULT_MAX_WORKERS)
+            retry_failed_deletes(max_workers)
+            
+        elif choice == '14':
+            export_api_metrics()
+            
+        elif choice == '0':
+            api_client.print_stats()
+            push_manifest.save()
             print("👋 Goodbye!")
             break
             
         else:
             print("❌ Invalid choice!")
         
-        if choice in ['1', '2', '3', '5', '6', '7', '8', '9', '10']:
+        push_manifest.save()
+        
+        if choice in ['1', '2', '3', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14']:
             input("\nPress Enter to continue...")
 
+# Exit code CLI non-interaktif (untuk cron/CI)
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+def stats_summary(stats):
+    """Ringkas stats per author menjadi jumlah total success/failed"""
+    success = sum(s['success'] for s in stats.values())
+    failed = sum(s['failed'] for s in stats.values())
+    return {'success': success, 'failed': failed, 'total': success + failed}
+
+def parse_shard(value):
+    """Parse '--shard I/N' menjadi (I, N) dengan 0 <= I < N"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("format shard harus I/N, misalnya 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError("shard harus memenuhi 0 <= I < N")
+    return index, count
+
+def stats_result(stats):
+    """Hasil perintah push/sync/resume: (payload JSON, exit code)"""
+    summary = stats_summary(stats)
+    return {'summary': summary, 'stats': stats}, EXIT_FAILED if summary['failed'] else EXIT_OK
+
+def cli_push_all(args):
+    stats = push_all_data(args.workers, args.rate, args.force, args.bulk, args.shard)
+    return stats_result(stats)
+
+def cli_push_author(args):
+    stats = push_author_data(args.author, args.workers, args.rate, args.force, args.bulk)
+    if stats is None:
+        return {'error': f"author '{args.author}' tidak ditemukan"}, EXIT_USAGE
+    return stats_result(stats)
+
+def cli_push_tag(args):
+    ok = push_single_tag(args.author, args.tag)
+    if ok is None:
+        return {'error': f"tag '{args.tag}' untuk author '{args.author}' tidak ditemukan"}, EXIT_USAGE
+    return {'pushed': ok}, EXIT_OK if ok else EXIT_FAILED
+
+def cli_sync(args):
+    if not args.yes and not args.dry_run:
+        return {'error': "sync non-interaktif membutuhkan --yes atau --dry-run"}, EXIT_USAGE
+    result = sync_data(args.workers, args.rate, confirm=False, dry_run=args.dry_run)
+    if 'error' in result:
+        return {'error': result['error']}, EXIT_FAILED
+    payload, code = stats_result(result['stats'])
+    payload['plan'] = result['plan']
+    return payload, code
+
+def cli_resume(args):
+    return stats_result(resume_last_push(args.workers, args.rate, args.shard))
+
+def select_api_tags(api_tags, author=None, tag_name=None, ids=None):
+    """Filter listing API berdasarkan author, nama tag dan/atau id"""
+    selected = []
+    for tag in api_tags:
+        if author is not None and tag.get('nama') != author:
+            continue
+        if tag_name is not None and tag.get('tag') != tag_name:
+            continue
+        if ids and tag.get('id') not in ids:
+            continue
+        selected.append(tag)
+    return selected
+
+def cli_delete(args):
+    if args.author is None and not args.id:
+        return {'error': "delete membutuhkan --author atau --id"}, EXIT_USAGE
+    tags = select_api_tags(get_all_tags_from_api(max_age=0, require_complete=True), args.author, args.tag, set(args.id or []))
+    if not tags:
+        return {'error': "tidak ada tag yang cocok di API"}, EXIT_USAGE
+    if not args.yes:
+        for tag in tags:
+            print(f"   - [{tag.get('nama', 'Unknown')}] {tag.get('tag', 'Unknown')} (id: {tag.get('id')})")
+        return {'would_delete': len(tags), 'error': "tambahkan --yes untuk benar-benar menghapus"}, EXIT_USAGE
+    report = delete_tags_concurrently(tags, args.workers, f"cli delete {args.author or 'ids'}")
+    payload = {
+        'summary': {'success': len(report['deleted']), 'failed': len(report['failed']), 'total': len(tags)},
+        'deleted': report['deleted'],
+        'failed': report['failed']
+    }
+    return payload, EXIT_FAILED if report['failed'] else EXIT_OK
+
+def cli_retry_deletes(args):
+    report = retry_failed_deletes(args.workers)
+    if report is None:
+        return {'summary': {'success': 0, 'failed': 0, 'total': 0}}, EXIT_OK
+    payload = {
+        'summary': {'success': len(report['deleted']), 'failed': len(report['failed']),
+                    'total': len(report['deleted']) + len(report['failed'])},
+        'failed': report['failed']
+    }
+    return payload, EXIT_FAILED if report['failed'] else EXIT_OK
+
+def cli_list(args):
+    tags = select_api_tags(get_all_tags_from_api(args.page_size, max_age=args.max_age), args.author)
+    for i, tag in enumerate(tags, 1):
+        print(format_tag_line(i, tag))
+    print(f"📊 Total: {len(tags)} tags")
+    return {'count': len(tags), 'tags': tags}, EXIT_OK
+
+def cli_dedupe(args):
+    """Cari near-duplicate response sebelum push; --merge menghapus duplikat dalam satu author"""
+    report = near_duplicates.dedupe(dataset.path, args.threshold, args.merge)
+    near_duplicates.print_report(report)
+    return report, EXIT_FAILED if report['clusters'] and not args.merge else EXIT_OK
+
+def build_cli_parser():
+    """Parser CLI non-interaktif; setiap subcommand memanggil fungsi yang sama dengan menu"""
+    parser = argparse.ArgumentParser(
+        description="Push/sync/delete data chatbot ke API tanpa menu interaktif",
+        epilog="Tanpa argumen, send_to_postman.py membuka menu interaktif."
+    )
+    parser.add_argument("--json", action="store_true",
+                        help="Cetak hasil sebagai JSON ke stdout (log progres ke stderr)")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Export metrik per-request ke PATH (.json/.csv/.prom)")
+    parser.add_argument("--log-mode", choices=run_log.LOG_MODES,
+                        help="Console log: normal, verbose (detail per item), quiet (1 baris progress), json")
+    parser.add_argument("--log-file", default=LOG_FILE,
+                        help="Log file JSON lines berisi detail per item (default output/chatbot.log)")
+    parser.add_argument("--gzip", action="store_true", default=COMPRESS_REQUESTS,
+                        help="Kompres body request dengan gzip (fallback otomatis jika server menolak)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRY_ATTEMPTS,
+                        help="Retry maksimum per request (backoff eksponensial + jitter)")
+    parser.add_argument("--breaker-threshold", type=int, default=BREAKER_FAILURE_THRESHOLD,
+                        help="Kegagalan beruntun sebelum circuit breaker terbuka (0 = nonaktif)")
+    parser.add_argument("--breaker-timeout", type=float, default=BREAKER_RESET_TIMEOUT,
+                        help="Detik sebelum circuit breaker mencoba lagi")
+    parser.add_argument("--breaker-mode", choices=BREAKER_MODES, default='halt',
+                        help="halt: sisa item langsung gagal (bisa di-resume); pause: tunggu server pulih")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_rate_options(sub, rate=True):
+        sub.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="Jumlah worker paralel")
+        if rate:
+            sub.add_argument("--rate", type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                             help="Rate awal req/detik (adaptif)")
+
+    sub = subparsers.add_parser("push-all", help="Push semua data (skip yang tidak berubah)")
+    add_rate_options(sub)
+    sub.add_argument("--force", action="store_true", help="Kirim ulang juga tag yang tidak berubah")
+    sub.add_argument("--bulk", action="store_true", help="Banyak tag per request")
+    sub.add_argument("--shard", type=parse_shard, help="Hanya kirim shard I dari N (format I/N)")
+    sub.set_defaults(handler=cli_push_all)
+
+    sub = subparsers.add_parser("push-author", help="Push semua tag milik satu author")
+    sub.add_argument("author")
+    add_rate_options(sub)
+    sub.add_argument("--force", action="store_true", help="Kirim ulang juga tag yang tidak berubah")
+    sub.add_argument("--bulk", action="store_true", help="Banyak tag per request")
+    sub.set_defaults(handler=cli_push_author)
+
+    sub = subparsers.add_parser("push-tag", help="Push satu tag")
+    sub.add_argument("author")
+    sub.add_argument("tag")
+    sub.set_defaults(handler=cli_push_tag)
+
+    sub = subparsers.add_parser("sync", help="Sync data lokal ke API (create/update/delete)")
+    add_rate_options(sub)
+    sub.add_argument("--yes", action="store_true", help="Jalankan tanpa konfirmasi")
+    sub.add_argument("--dry-run", action="store_true", help="Hanya tampilkan rencana sync")
+    sub.set_defaults(handler=cli_sync)
+
+    sub = subparsers.add_parser("resume", help="Lanjutkan push terakhir dari journal")
+    add_rate_options(sub)
+    sub.add_argument("--shard", type=parse_shard, help="Resume journal milik shard I/N")
+    sub.set_defaults(handler=cli_resume)
+
+    sub = subparsers.add_parser("delete", help="Hapus tag di API berdasarkan author/tag atau id")
+    sub.add_argument("--author", help="Hapus tag milik author ini")
+    sub.add_argument("--tag", help="Batasi ke nama tag ini (bersama --author)")
+    sub.add_argument("--id", action="append", help="Id tag yang dihapus (boleh berulang)")
+    sub.add_argument("--yes", action="store_true", help="Tanpa ini, hanya tampilkan tag yang akan dihapus")
+    add_rate_options(sub, rate=False)
+    sub.set_defaults(handler=cli_delete)
+
+    sub = subparsers.add_parser("retry-deletes", help="Ulangi delete yang gagal di laporan terakhir")
+    add_rate_options(sub, rate=False)
+    sub.set_defaults(handler=cli_retry_deletes)
+
+    sub = subparsers.add_parser("list", help="Tampilkan tag yang ada di API")
+    sub.add_argument("--author", help="Hanya tag milik author ini")
+    sub.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    sub.add_argument("--max-age", type=float, default=None,
+                     help="Umur cache listing maksimum dalam detik (0 = selalu revalidasi)")
+    sub.set_defaults(handler=cli_list)
+
+    sub = subparsers.add_parser("dedupe", help="Cari near-duplicate response (MinHash/LSH) sebelum push")
+    sub.add_argument("--threshold", type=float, default=near_duplicates.DEFAULT_THRESHOLD,
+                     help="Jaccard minimum antar response")
+    sub.add_argument("--merge", action="store_true",
+                     help="Hapus duplikat milik author yang sama (lintas author hanya ditandai)")
+    sub.set_defaults(handler=cli_dedupe)
+
+    return parser
+
+def cli_main(argv):
+    """Entry point non-interaktif. Return exit code (0 sukses, 1 ada kegagalan, 2 salah pakai)"""
+    parser = build_cli_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'dedupe' and not 0 < args.threshold <= 1:
+        parser.error("--threshold harus di antara 0 dan 1")
+    if args.metrics:
+        try:
+            api_metrics.resolve_format(args.metrics)
+        except ValueError as e:
+            parser.error(f"--metrics: {e}")
+        if not os.path.isdir(os.path.dirname(os.path.abspath(args.metrics))):
+            parser.error(f"--metrics: folder {os.path.dirname(args.metrics)} tidak ada")
+    run_log.setup_logging(args.log_mode, args.log_file)
+    api_client.compress_requests = args.gzip
+    api_client.retry_policy.max_attempts = args.retries
+    api_client.breaker.failure_threshold = args.breaker_threshold
+    api_client.breaker.reset_timeout = args.breaker_timeout
+    api_client.breaker.mode = args.breaker_mode
+    # Dengan --json, stdout hanya berisi satu dokumen JSON; semua log progres ke stderr
+    output = sys.stderr if args.json else sys.stdout
+    try:
+        with contextlib.redirect_stdout(output):
+            payload, code = args.handler(args)
+    except requests.exceptions.RequestException as e:
+        payload, code = {'error': str(e)}, EXIT_FAILED
+    finally:
+        push_manifest.save()
+        if args.metrics:
+            # Gagal export tidak boleh menggantikan exit code / exception perintah yang sebenarnya
+            try:
+                api_client.export_metrics(args.metrics)
+            except (OSError, ValueError) as e:
+                print(f"❌ Gagal export metrik: {e}", file=sys.stderr)
+
+    if args.json:
+        result = dict(payload, command=args.command, ok=code == EXIT_OK, exit_code=code,
+                      metrics=api_client.stats())
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif 'error' in payload:
+        print(f"❌ {payload['error']}", file=sys.stderr)
+    return code
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli_main(sys.argv[1:]))
     main_menu()
\ No newline at end of file
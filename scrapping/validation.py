@@ -0,0 +1,304 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dataset import Dataset
+
+# Validasi content_by_author_and_tags.json dengan rule yang bisa ditambah.
+# Contoh:
+#   python validation.py --output output/validation_report.json
+#   python validation.py --rule mojibake --rule empty_inputs --workers 1
+#
+# Setiap rule punya dua bagian:
+#   check(author, intent)   -> issue untuk satu intent (dijalankan di worker per shard)
+#   collect(author, intent) -> {key: [lokasi]} untuk rule lintas tag; merge() di proses utama
+#                              menggabungkan hasil semua shard menjadi issue
+# Intent dibagi ke shard berdasarkan hash (author, tag) lalu dijalankan di process pool.
+# Exit code: 0 tanpa error, 1 ada issue severity error (atau warning dengan --strict), 2 salah pakai.
+
+DEFAULT_DATA_FILE = os.environ.get(
+    "CHATBOT_DATA_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "output", "content_by_author_and_tags.json"))
+DEFAULT_MAX_INPUT_LENGTH = 200
+SHARDS_PER_WORKER = 4
+
+EXIT_OK = 0
+EXIT_ISSUES = 1
+EXIT_USAGE = 2
+
+# Hasil decode UTF-8 sebagai cp1252/latin-1 (misalnya "â€™", "Ã©") dan karakter pengganti
+MOJIBAKE_PATTERN = re.compile('\ufffd|\u00e2\u20ac|\u00c3[\u0080-\u00bf]|\u00c2[\u0080-\u00bf]|\u00f0\u0178')
+QUOTE_PAIRS = (('“', '”'), ('«', '»'))
+
+def normalize_text(text):
+    """Bentuk pembanding untuk duplikat: spasi dirapikan, huruf kecil"""
+    return " ".join(text.split()).casefold()
+
+def location(author, intent, field, index):
+    return {'author': author, 'tag': intent['tag'], 'field': field, 'index': index}
+
+def location_key(entry):
+    return entry.get('author', ''), entry.get('tag', ''), entry.get('field', ''), entry.get('index', -1)
+
+def location_dicts(locations):
+    """Tuple (author, tag, field, index) hasil collect() -> dict lokasi untuk report"""
+    return [{'author': author, 'tag': tag_name, 'field': field, 'index': index}
+            for author, tag_name, field, index in locations]
+
+def issue(rule, message, text=None, **fields):
+    entry = {'rule': rule.name, 'severity': rule.severity, 'message': message}
+    entry.update(fields)
+    if text is not None:
+        entry['text'] = text
+    return entry
+
+class Rule:
+    """Dasar rule validasi; turunan mengisi check() dan/atau collect() + merge().
+
+    collect() memakai tuple (author, tag, field, index) sebagai lokasi supaya hasil shard
+    kecil saat dikirim balik dari worker.
+    """
+
+    name = None
+    severity = 'warning'
+    description = ''
+
+    def __init__(self, options):
+        self.options = options
+
+    def check(self, author, intent):
+        return []
+
+    def collect(self, author, intent):
+        return {}
+
+    def merge(self, collected):
+        return []
+
+class DuplicateResponsesRule(Rule):
+    name = 'duplicate_responses'
+    description = "Response yang sama muncul di lebih dari satu tag"
+
+    def collect(self, author, intent):
+        collected = {}
+        tag_name = intent['tag']
+        for i, response in enumerate(intent.get('responses', [])):
+            collected.setdefault(normalize_text(response), []).append((author, tag_name, 'responses', i))
+        return collected
+
+    def merge(self, collected):
+        issues = []
+        for locations in collected.values():
+            tags = {(author, tag_name) for author, tag_name, _, _ in locations}
+            if len(tags) > 1:
+                issues.append(issue(self, f"Response sama di {len(tags)} tag",
+                                    locations=location_dicts(sorted(locations))))
+        return issues
+
+class EmptyInputsRule(Rule):
+    name = 'empty_inputs'
+    severity = 'error'
+    description = "Tag tanpa input atau input kosong"
+
+    def check(self, author, intent):
+        inputs = intent.get('input', [])
+        if not inputs:
+            return [issue(self, "Tag tidak punya input", author=author, tag=intent['tag'], field='input')]
+        return [issue(self, "Input kosong", **location(author, intent, 'input', i))
+                for i, text in enumerate(inputs) if not text.strip()]
+
+class SharedInputsRule(Rule):
+    name = 'shared_inputs'
+    description = "Input yang sama dipakai tag milik author berbeda"
+
+    def collect(self, author, intent):
+        collected = {}
+        tag_name = intent['tag']
+        for i, text in enumerate(intent.get('input', [])):
+            if text.strip():
+                collected.setdefault(normalize_text(text), []).append((author, tag_name, 'input', i))
+        return collected
+
+    def merge(self, collected):
+        issues = []
+        for locations in collected.values():
+            authors = {author for author, _, _, _ in locations}
+            if len(authors) > 1:
+                issues.append(issue(self, f"Input dipakai oleh {len(authors)} author",
+                                    locations=location_dicts(sorted(locations))))
+        return issues
+
+class MismatchedQuotesRule(Rule):
+    name = 'mismatched_quotes'
+    description = "Tanda kutip tidak berpasangan"
+
+    def check(self, author, intent):
+        issues = []
+        for field in ('input', 'responses'):
+            for i, text in enumerate(intent.get(field, [])):
+                problems = []
+                if text.count('"') % 2:
+                    problems.append('"')
+                problems += [f"{opening}{closing}" for opening, closing in QUOTE_PAIRS
+                             if text.count(opening) != text.count(closing)]
+                if problems:
+                    issues.append(issue(self, f"Kutip tidak berpasangan: {' '.join(problems)}", text,
+                                        **location(author, intent, field, i)))
+        return issues
+
+class MojibakeRule(Rule):
+    name = 'mojibake'
+    severity = 'error'
+    description = "Teks rusak karena salah encoding"
+
+    def check(self, author, intent):
+        issues = []
+        for field in ('input', 'responses'):
+            for i, text in enumerate(intent.get(field, [])):
+                match = MOJIBAKE_PATTERN.search(text)
+                if match:
+                    issues.append(issue(self, f"Karakter rusak {match.group()!r}", text,
+                                        **location(author, intent, field, i)))
+        return issues
+
+class OverlongInputsRule(Rule):
+    name = 'overlong_inputs'
+    description = "Input lebih panjang dari batas"
+
+    def check(self, author, intent):
+        limit = self.options.get('max_input_length', DEFAULT_MAX_INPUT_LENGTH)
+        return [issue(self, f"Input {len(text)} karakter (batas {limit})", text,
+                      **location(author, intent, 'input', i))
+                for i, text in enumerate(intent.get('input', [])) if len(text) > limit]
+
+RULES = {rule.name: rule for rule in (DuplicateResponsesRule, EmptyInputsRule, SharedInputsRule,
+                                      MismatchedQuotesRule, MojibakeRule, OverlongInputsRule)}
+
+def build_rules(names, options):
+    return [RULES[name](options) for name in names]
+
+def shard_index(author, tag_name, count):
+    """Shard stabil untuk (author, tag); sama dengan pembagian --shard di send_to_postman.py"""
+    digest = hashlib.md5(f"{author}\x1f{tag_name}".encode('utf-8')).hexdigest()
+    return int(digest, 16) % count
+
+def validate_shard(rule_names, options, items):
+    """Jalankan rule untuk list (author, intent); return (issues, {rule: {key: [lokasi]}})"""
+    rules = build_rules(rule_names, options)
+    issues = []
+    collected = {rule.name: {} for rule in rules}
+    for author, intent in items:
+        for rule in rules:
+            issues.extend(rule.check(author, intent))
+            target = collected[rule.name]
+            for key, locations in rule.collect(author, intent).items():
+                target.setdefault(key, []).extend(locations)
+    return issues, collected
+
+def issue_sort_key(entry):
+    first = entry['locations'][0] if 'locations' in entry else entry
+    return (entry['rule'],) + location_key(first)
+
+def validate(items, rule_names=None, options=None, workers=None):
+    """Validasi iterable (author, intent); return report (dict, bisa langsung di-dump ke JSON)"""
+    # Rule yang disebut berulang (--rule x --rule x) cukup dijalankan sekali
+    rule_names = list(dict.fromkeys(rule_names or RULES))
+    options = options or {}
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    shard_count = max(1, workers * SHARDS_PER_WORKER)
+    shards = [[] for _ in range(shard_count)]
+    intents = 0
+    for author, intent in items:
+        shards[shard_index(author, intent['tag'], shard_count)].append((author, intent))
+        intents += 1
+    shards = [shard for shard in shards if shard]
+
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(validate_shard, [rule_names] * len(shards), [options] * len(shards), shards))
+    else:
+        results = [validate_shard(rule_names, options, shard) for shard in shards]
+
+    issues = []
+    merged = {name: {} for name in rule_names}
+    for shard_issues, collected in results:
+        issues.extend(shard_issues)
+        for name, keys in collected.items():
+            for key, locations in keys.items():
+                merged[name].setdefault(key, []).extend(locations)
+    for rule in build_rules(rule_names, options):
+        issues.extend(rule.merge(merged[rule.name]))
+    issues.sort(key=issue_sort_key)
+
+    summary = {name: {'severity': RULES[name].severity, 'issues': 0} for name in rule_names}
+    for entry in issues:
+        summary[entry['rule']]['issues'] += 1
+    return {
+        'rules': rule_names,
+        'options': options,
+        'intents': intents,
+        'shards': len(shards),
+        'workers': workers,
+        'duration': time.perf_counter() - started,
+        'errors': sum(1 for entry in issues if entry['severity'] == 'error'),
+        'warnings': sum(1 for entry in issues if entry['severity'] == 'warning'),
+        'summary': summary,
+        'issues': issues,
+    }
+
+def validate_file(path, rule_names=None, options=None, workers=None):
+    report = validate(Dataset(path).iter_intents(), rule_names, options, workers)
+    report['file'] = path
+    return report
+
+def print_report(report, stream=None):
+    stream = stream or sys.stdout
+    print(f"🔎 Validasi {report['intents']} tag | {report['shards']} shard | {report['workers']} worker | "
+          f"{report['duration']:.2f}s", file=stream)
+    for name, entry in report['summary'].items():
+        icon = "✅" if not entry['issues'] else ("❌" if entry['severity'] == 'error' else "⚠️ ")
+        print(f"{icon} {name:<20} {entry['issues']:>5} issue  ({RULES[name].description})", file=stream)
+    print(f"Total: {report['errors']} error, {report['warnings']} warning", file=stream)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validasi data chatbot (content_by_author_and_tags.json)")
+    parser.add_argument("--data", default=DEFAULT_DATA_FILE, help="File data (default: env CHATBOT_DATA_FILE)")
+    parser.add_argument("--rule", action="append", choices=sorted(RULES),
+                        help="Rule yang dijalankan (boleh berulang, default semua)")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument("--max-input-length", type=int, default=DEFAULT_MAX_INPUT_LENGTH)
+    parser.add_argument("--output", help="Simpan report JSON ke file")
+    parser.add_argument("--json", action="store_true", help="Cetak report JSON ke stdout")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 juga jika ada warning")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers minimal 1")
+
+    try:
+        report = validate_file(args.data, args.rule, {'max_input_length': args.max_input_length}, args.workers)
+    except FileNotFoundError:
+        print(f"❌ File tidak ditemukan: {args.data}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 Report disimpan di {args.output}", file=sys.stderr if args.json else sys.stdout)
+
+    if report['errors'] or (args.strict and report['warnings']):
+        return EXIT_ISSUES
+    return EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())